@@ -5,7 +5,12 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import collections
+import concurrent.futures
 import copy
+import errno
+import fnmatch
 import hashlib
 import json
 import os
@@ -13,14 +18,18 @@ import platform
 import re
 import shutil
 import signal
+import socket
+import socketserver
 import string
 import subprocess
 import sys
 import tarfile
+import tempfile
+import threading
 import time
 import traceback
+import zipfile
 from datetime import datetime
-from distutils.dir_util import copy_tree
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, NoReturn, Union, Callable, Any
 
@@ -33,12 +42,107 @@ def adapt_the_command_arguments_when_using_bash_on_windows(command_arguments):
     return command_arguments_to_use
 
 
+class SubprocessLogCapture:
+    chunkSize = 1024 * 1024
+    logFileBufferSize = 4 * 1024 * 1024
+    timestampTickInSeconds = 0.05
+
+    isLowOverheadModeEnabled = False
+    tailLineCount = 0
+
+    @classmethod
+    def enable_the_low_overhead_mode(cls, quiet: bool = False, tail_line_count: int = None) -> NoReturn:
+        cls.isLowOverheadModeEnabled = True
+        if quiet or tail_line_count is None:
+            cls.tailLineCount = 0
+        else:
+            cls.tailLineCount = max(tail_line_count, 0)
+
+    @staticmethod
+    def get_the_timestamp_prefix() -> bytes:
+        return (datetime.now().strftime("%H:%M:%S.%f")[:-3] + "- ").encode()
+
+    @classmethod
+    def copy_the_output_by_chunks(cls, output_stream, log_file, tail_lines: Optional[collections.deque] = None, flush_after_each_chunk: bool = False) -> NoReturn:
+        """
+        Copy the process output to the log file by large binary chunks.
+        The timestamp prefix is computed once per wall-clock tick and inserted at each line start of the chunk.
+        If a tail deque is given, only its last lines are kept for the console echo.
+        """
+        tail_line_count = tail_lines.maxlen if tail_lines is not None else 0
+        is_at_line_start = True
+        pending_tail_line = b""
+        last_tick = None
+        timestamp_prefix = b""
+
+        while True:
+            chunk = output_stream.read1(cls.chunkSize)
+            if not chunk:
+                break
+
+            now = time.monotonic()
+            if last_tick is None or now - last_tick >= cls.timestampTickInSeconds:
+                last_tick = now
+                timestamp_prefix = cls.get_the_timestamp_prefix()
+
+            prefixed_chunk = chunk.replace(b"\n", b"\n" + timestamp_prefix)
+            if is_at_line_start:
+                prefixed_chunk = timestamp_prefix + prefixed_chunk
+            is_at_line_start = chunk.endswith(b"\n")
+            if is_at_line_start:
+                prefixed_chunk = prefixed_chunk[:-len(timestamp_prefix)]
+
+            log_file.write(prefixed_chunk)
+            if flush_after_each_chunk:
+                log_file.flush()
+
+            if tail_line_count > 0:
+                # Only the last lines of the chunk can reach the tail, so avoid splitting the whole chunk
+                chunk_lines = prefixed_chunk.rsplit(b"\n", tail_line_count + 1)
+                chunk_lines[0] = pending_tail_line + chunk_lines[0]
+                pending_tail_line = chunk_lines.pop()
+                tail_lines.extend(chunk_lines[-tail_line_count:])
+
+        if tail_line_count > 0 and pending_tail_line:
+            tail_lines.append(pending_tail_line)
+
+
+def run_subprocess_with_low_overhead_capture(log_file_path: Path,
+                                             arguments: Union[list, str],
+                                             *subprocess_args,
+                                             environment_variables: dict = None,
+                                             current_working_directory: Path = None,
+                                             **subprocess_kwargs) -> subprocess.Popen:
+    tail_lines = collections.deque(maxlen=SubprocessLogCapture.tailLineCount) if SubprocessLogCapture.tailLineCount > 0 else None
+
+    with subprocess.Popen(arguments, *subprocess_args,
+                          env=environment_variables,
+                          cwd=current_working_directory,
+                          stdout=subprocess.PIPE,
+                          stderr=subprocess.STDOUT,
+                          bufsize=SubprocessLogCapture.chunkSize,
+                          **subprocess_kwargs) as running_process, log_file_path.open("wb", buffering=SubprocessLogCapture.logFileBufferSize) as log_file:
+        SubprocessLogCapture.copy_the_output_by_chunks(running_process.stdout, log_file, tail_lines)
+
+    if tail_lines is not None:
+        for tail_line in tail_lines:
+            print(tail_line.decode(errors="replace").rstrip("\r"))
+
+    return running_process
+
+
 def run_subprocess(log_file_path: Path,
                    arguments: Union[list, str],
                    *subprocess_args,
                    environment_variables: dict = None,
                    current_working_directory: Path = None,
                    **subprocess_kwargs) -> subprocess.Popen:
+    if SubprocessLogCapture.isLowOverheadModeEnabled:
+        return run_subprocess_with_low_overhead_capture(log_file_path, arguments, *subprocess_args,
+                                                        environment_variables=environment_variables,
+                                                        current_working_directory=current_working_directory,
+                                                        **subprocess_kwargs)
+
     with subprocess.Popen(arguments, *subprocess_args,
                           env=environment_variables,
                           cwd=current_working_directory,
@@ -62,32 +166,1585 @@ def run_detach_subprocess(log_file_path: Path,
     def norm_path(file_path: Path) -> str:
         return str(file_path).replace('\\', '/')
 
-    python_command_string = f"""
-import subprocess
-import platform
-from datetime import datetime
-def launch_subprocess(args_to_use, env_to_use, cwd_to_use, log_file_to_use):
-    if platform.system() == "Windows":
-        creation_flags = subprocess.CREATE_NO_WINDOW
-    else:
-        creation_flags = 0
-    with subprocess.Popen(args_to_use, env=env_to_use, cwd=cwd_to_use, text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1, creationflags=creation_flags) as running_process, open(log_file_to_use, "w") as log_file:
-        for line in running_process.stdout:
-            line = datetime.now().strftime("%H:%M:%S.%f")[:-3] + "- " + line
-            print(line[:-1])
-            log_file.write(line)
-            log_file.flush()
-launch_subprocess({arguments}, {environment_variables}, "{norm_path(current_working_directory)}", "{norm_path(log_file_path)}")
-            """
+    python_command_string = f"""
+import subprocess
+import platform
+from datetime import datetime
+def launch_subprocess(args_to_use, env_to_use, cwd_to_use, log_file_to_use):
+    if platform.system() == "Windows":
+        creation_flags = subprocess.CREATE_NO_WINDOW
+    else:
+        creation_flags = 0
+    with subprocess.Popen(args_to_use, env=env_to_use, cwd=cwd_to_use, text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1, creationflags=creation_flags) as running_process, open(log_file_to_use, "w") as log_file:
+        for line in running_process.stdout:
+            line = datetime.now().strftime("%H:%M:%S.%f")[:-3] + "- " + line
+            print(line[:-1])
+            log_file.write(line)
+            log_file.flush()
+launch_subprocess({arguments}, {environment_variables}, "{norm_path(current_working_directory)}", "{norm_path(log_file_path)}")
+            """
+
+    python_command_arguments = ["python", "-c", python_command_string]
+
+    if platform.system() == "Windows":
+        process = subprocess.Popen(python_command_arguments, cwd=current_working_directory.parent, creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP)
+    else:
+        process = subprocess.Popen(python_command_arguments, cwd=current_working_directory.parent, start_new_session=True)    # Try adding this in case of terminal problems: , stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+
+    return process
+
+
+class ProcessGroupStopper:
+    gracefulStopTimeoutInSeconds = 30
+    killTimeoutInSeconds = 5
+    pollingPeriodInSeconds = 0.1
+
+    @staticmethod
+    def _send_the_signal(process_id: int, process_group_id: int, signal_number: int) -> NoReturn:
+        # Never signal the deployer own process group, only the process itself in this case
+        if process_group_id == os.getpgrp():
+            os.kill(process_id, signal_number)
+        else:
+            os.killpg(process_group_id, signal_number)
+
+    @staticmethod
+    def is_process_group_alive(process_id: int, process_group_id: int) -> bool:
+        try:
+            if process_group_id == os.getpgrp():
+                os.kill(process_id, 0)
+            else:
+                os.killpg(process_group_id, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    @classmethod
+    def _wait_for_the_process_group_end(cls, process_id: int, process_group_id: int, timeout_in_seconds: float) -> bool:
+        deadline = time.monotonic() + timeout_in_seconds
+        while cls.is_process_group_alive(process_id, process_group_id):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(cls.pollingPeriodInSeconds)
+        return True
+
+    @classmethod
+    def stop_the_process_group(cls, process_id: int, timeout_in_seconds: float = None) -> Tuple[bool, bool]:
+        """
+        Send SIGTERM to the whole process group of the given process, wait for its end until the timeout
+        and escalate to SIGKILL if needed. Return the stopped status and the killed status.
+        """
+        if timeout_in_seconds is None:
+            timeout_in_seconds = cls.gracefulStopTimeoutInSeconds
+
+        try:
+            process_group_id = os.getpgid(process_id)
+        except ProcessLookupError:
+            return True, False
+
+        try:
+            cls._send_the_signal(process_id, process_group_id, signal.SIGTERM)
+        except ProcessLookupError:
+            return True, False
+
+        if cls._wait_for_the_process_group_end(process_id, process_group_id, timeout_in_seconds):
+            return True, False
+
+        try:
+            cls._send_the_signal(process_id, process_group_id, signal.SIGKILL)
+        except ProcessLookupError:
+            return True, True
+
+        return cls._wait_for_the_process_group_end(process_id, process_group_id, cls.killTimeoutInSeconds), True
+
+
+class ProcessLivenessProbe:
+    procDirPath = Path("/proc")
+    bootIdFilePath = Path("/proc/sys/kernel/random/boot_id")
+    portConnectionTimeoutInSeconds = 0.5
+
+    @classmethod
+    def get_the_process_start_identity(cls, process_id: int) -> Optional[str]:
+        """
+        Return an identity of the process made of the boot id and the process start time,
+        so a pid reused after a crash or a reboot is not taken for the recorded process.
+        """
+        try:
+            process_stat = (cls.procDirPath / str(process_id) / "stat").read_text()
+        except OSError:
+            return None
+
+        # The process name can contain spaces and parentheses, so the fields are read after the last ')'
+        process_stat_fields = process_stat[process_stat.rfind(")") + 2:].split()
+        if len(process_stat_fields) < 20 or process_stat_fields[0] == "Z":
+            return None
+
+        try:
+            boot_id = cls.bootIdFilePath.read_text().strip()
+        except OSError:
+            boot_id = "unknown-boot"
+        return f"{boot_id}:{process_stat_fields[19]}"
+
+    @classmethod
+    def is_process_alive(cls, process_id: int, expected_start_identity: str = None) -> bool:
+        if platform.system() == "Windows":
+            # os.kill() terminates the process on Windows, whatever the signal
+            complete_process = subprocess.run(["tasklist", "/FI", f"PID eq {process_id}", "/NH", "/FO", "CSV"], capture_output=True, text=True)
+            return f'"{process_id}"' in complete_process.stdout
+
+        if not cls.procDirPath.is_dir():
+            try:
+                os.kill(process_id, 0)
+            except ProcessLookupError:
+                return False
+            except PermissionError:
+                return True
+            return True
+
+        start_identity = cls.get_the_process_start_identity(process_id)
+        if start_identity is None:
+            return False
+        return expected_start_identity is None or start_identity == expected_start_identity
+
+    @classmethod
+    def is_port_listening(cls, host: str, port: int) -> bool:
+        try:
+            with socket.create_connection((host, int(port)), timeout=cls.portConnectionTimeoutInSeconds):
+                return True
+        except (OSError, ValueError):
+            return False
+
+
+class ProcessSupervisor:
+    socketFileName = "process-supervisor.sock"
+    supervisorLogFileName = "process-supervisor.log"
+    maxSocketPathLength = 100
+
+    def __init__(self, socket_path: Path):
+        self.socketPath = socket_path
+        self._processesByName: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    @staticmethod
+    def is_available() -> bool:
+        return platform.system() != "Windows" and hasattr(socket, "AF_UNIX")
+
+    @classmethod
+    def get_the_socket_path(cls, supervised_dir_path: Path) -> Path:
+        socket_path = supervised_dir_path / cls.socketFileName
+        if len(str(socket_path)) > cls.maxSocketPathLength:
+            # The unix socket path length is limited, so fall back to a name derived from the supervised folder
+            supervised_dir_path_hash = hashlib.sha256(str(supervised_dir_path.absolute()).encode()).hexdigest()[:16]
+            socket_path = Path(tempfile.gettempdir()) / f"deployer-{supervised_dir_path_hash}.sock"
+        return socket_path
+
+    def serve_forever(self) -> NoReturn:
+        if self.socketPath.exists():
+            self.socketPath.unlink()
+        self.socketPath.parent.mkdir(parents=True, exist_ok=True)
+
+        supervisor = self
+
+        class RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                request_line = self.rfile.readline()
+                try:
+                    request = json.loads(request_line)
+                    response = supervisor.process_the_request(request)
+                except (json.JSONDecodeError, TypeError, ValueError, KeyError, OSError) as e:
+                    response = {"status": "error", "message": str(e)}
+                self.wfile.write((json.dumps(response) + "\n").encode())
+
+        print(f"Process supervisor listening on '{self.socketPath}'")
+        self._server = socketserver.ThreadingUnixStreamServer(str(self.socketPath), RequestHandler)
+        self._server.daemon_threads = True
+        with self._server:
+            self._server.serve_forever()
+
+        if self.socketPath.exists():
+            self.socketPath.unlink()
+        print(f"Process supervisor stopped")
+
+    def process_the_request(self, request: dict) -> dict:
+        action = request.get("action", None)
+        if action == "start":
+            return self._start_process(request["name"], request["arguments"], request.get("environment", None),
+                                       request.get("cwd", None), Path(request["logFilePath"]))
+        if action == "stop":
+            return self._stop_process(request["name"])
+        if action == "status":
+            return {"status": "ok", "processes": self._get_the_processes_status()}
+        if action == "shutdown":
+            # Only the idle supervisor is shut down when asked, so the processes of another deployment mode or not stopped are kept
+            if request.get("ifIdle", False) and len(self._get_the_running_processes()) > 0:
+                return {"status": "ok", "isShutdown": False}
+            self._stop_all_the_processes()
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+            return {"status": "ok", "isShutdown": True}
+        return {"status": "error", "message": f"Unexpected action '{action}'"}
+
+    def _start_process(self, name: str, arguments: list, environment: Optional[dict], cwd: Optional[str], log_file_path: Path) -> dict:
+        with self._lock:
+            process_info = self._processesByName.get(name, None)
+            if process_info is not None and process_info["process"].poll() is None:
+                return {"status": "error", "message": f"The process '{name}' is already running with pid {process_info['process'].pid}"}
+
+            log_file_path.parent.mkdir(parents=True, exist_ok=True)
+            process = subprocess.Popen(arguments,
+                                       env=environment,
+                                       cwd=cwd,
+                                       stdin=subprocess.DEVNULL,
+                                       stdout=subprocess.PIPE,
+                                       stderr=subprocess.STDOUT,
+                                       bufsize=SubprocessLogCapture.chunkSize,
+                                       start_new_session=True)
+            process_info = {
+                "process": process,
+                "logFilePath": str(log_file_path),
+                "startTime": time.time(),
+                "endTime": None,
+            }
+            self._processesByName[name] = process_info
+
+        print(f"Process '{name}' started with pid {process.pid}")
+        threading.Thread(target=self._capture_the_process_output, args=(name, process_info), daemon=True).start()
+        return {"status": "ok", "pid": process.pid}
+
+    @staticmethod
+    def _capture_the_process_output(name: str, process_info: dict) -> NoReturn:
+        process = process_info["process"]
+        try:
+            with Path(process_info["logFilePath"]).open("wb") as log_file:
+                SubprocessLogCapture.copy_the_output_by_chunks(process.stdout, log_file, flush_after_each_chunk=True)
+        except OSError as e:
+            print(f"Process '{name}' output capture failed: {e}")
+        process.wait()
+        process_info["endTime"] = time.time()
+        print(f"Process '{name}' (pid {process.pid}) exited with code {process.returncode}")
+
+    def _stop_process(self, name: str) -> dict:
+        with self._lock:
+            process_info = self._processesByName.get(name, None)
+        if process_info is None:
+            return {"status": "error", "message": f"The process '{name}' is unknown"}
+
+        process = process_info["process"]
+        if process.poll() is None:
+            threading.Thread(target=ProcessGroupStopper.stop_the_process_group, args=(process.pid,), daemon=True).start()
+        return {"status": "ok", "pid": process.pid}
+
+    def _get_the_running_processes(self) -> List[subprocess.Popen]:
+        with self._lock:
+            return [process_info["process"] for process_info in self._processesByName.values() if process_info["process"].poll() is None]
+
+    def _stop_all_the_processes(self) -> NoReturn:
+        running_processes = self._get_the_running_processes()
+        if len(running_processes) == 0:
+            return
+
+        print(f"Stop the {len(running_processes)} running processes")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(running_processes), 32)) as executor:
+            executor.map(lambda running_process: ProcessGroupStopper.stop_the_process_group(running_process.pid), running_processes)
+
+    def _get_the_processes_status(self) -> List[dict]:
+        processes_status = []
+        with self._lock:
+            process_info_by_name = dict(self._processesByName)
+        for process_name, process_info in process_info_by_name.items():
+            process = process_info["process"]
+            processes_status.append({
+                "name": process_name,
+                "pid": process.pid,
+                "isRunning": process.poll() is None,
+                "returnCode": process.returncode,
+                "startTime": process_info["startTime"],
+                "endTime": process_info["endTime"],
+                "logFilePath": process_info["logFilePath"],
+            })
+        return processes_status
+
+
+class ProcessSupervisorClient:
+    supervisorStartupTimeoutInSeconds = 10
+    requestTimeoutInSeconds = 30
+
+    def __init__(self, supervised_dir_path: Path):
+        self.socketPath = ProcessSupervisor.get_the_socket_path(supervised_dir_path)
+        self.supervisorLogFilePath = supervised_dir_path / ProcessSupervisor.supervisorLogFileName
+
+    def send_request(self, request: dict) -> Optional[dict]:
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+                client_socket.settimeout(self.requestTimeoutInSeconds)
+                client_socket.connect(str(self.socketPath))
+                client_socket.sendall((json.dumps(request) + "\n").encode())
+                with client_socket.makefile("rb") as response_file:
+                    response_line = response_file.readline()
+            return json.loads(response_line)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def is_supervisor_running(self) -> bool:
+        return self.send_request({"action": "status"}) is not None
+
+    def ensure_the_supervisor_is_running(self) -> bool:
+        if self.is_supervisor_running():
+            return True
+
+        if getattr(sys, 'frozen', False):
+            command_arguments = [sys.executable]
+        else:
+            command_arguments = [sys.executable, str(Path(__file__).resolve())]
+        command_arguments += ["run-process-supervisor", str(self.socketPath)]
+
+        print(f"    - Start the process supervisor on '{self.socketPath}'")
+        self.supervisorLogFilePath.parent.mkdir(parents=True, exist_ok=True)
+        with self.supervisorLogFilePath.open("a") as supervisor_log_file:
+            subprocess.Popen(command_arguments, stdin=subprocess.DEVNULL, stdout=supervisor_log_file, stderr=subprocess.STDOUT, start_new_session=True)
+
+        deadline = time.monotonic() + self.supervisorStartupTimeoutInSeconds
+        while time.monotonic() < deadline:
+            if self.is_supervisor_running():
+                return True
+            time.sleep(0.1)
+
+        print(f"    ! The process supervisor doesn't answer on '{self.socketPath}'")
+        return False
+
+    def start_process(self, name: str, log_file_path: Path, arguments: list, environment_variables: dict = None, current_working_directory: Path = None) -> Optional[int]:
+        if not self.ensure_the_supervisor_is_running():
+            return None
+
+        response = self.send_request({
+            "action": "start",
+            "name": name,
+            "arguments": arguments,
+            "environment": environment_variables,
+            "cwd": str(current_working_directory) if current_working_directory is not None else None,
+            "logFilePath": str(log_file_path.absolute()),
+        })
+        if response is None or response.get("status", None) != "ok":
+            print(f"    ! The process supervisor failed to start '{name}': {None if response is None else response.get('message', None)}")
+            return None
+        return response["pid"]
+
+    def stop_process(self, name: str) -> bool:
+        response = self.send_request({"action": "stop", "name": name})
+        return response is not None and response.get("status", None) == "ok"
+
+    def get_the_processes_status(self) -> Optional[List[dict]]:
+        response = self.send_request({"action": "status"})
+        if response is None:
+            return None
+        return response.get("processes", [])
+
+    def shutdown_the_supervisor(self, if_idle: bool = False) -> bool:
+        response = self.send_request({"action": "shutdown", "ifIdle": if_idle})
+        return response is not None and response.get("isShutdown", True)
+
+
+class FileLinker:
+    linkMergeMode = "link"
+    copyMergeMode = "copy"
+    mergeModes = [linkMergeMode, copyMergeMode]
+    reflinkIoctlRequest = 0x40049409     # FICLONE on Linux
+    hardlinkNotPossibleErrnos = (errno.EXDEV, errno.ENOTSUP, errno.EOPNOTSUPP)
+
+    def __init__(self, merge_mode: str = linkMergeMode):
+        if merge_mode not in self.mergeModes:
+            raise UserWarning(f"The merge mode '{merge_mode}' is not one of {self.mergeModes}")
+        self.mergeMode = merge_mode
+        self.filesCountByLinkType = collections.Counter()
+        self._isHardlinkPossibleByDevices = {}
+        self._isReflinkPossibleByDevices = {}
+
+    def link_the_file(self, source_file_path: Path, target_file_path: Path) -> str:
+        """
+        Make the target file share the source file content: by a hardlink when possible, else by a reflink (copy on write),
+        else by a copy. The target parent folder must exist, an existing target file is kept when it is already up to date.
+        """
+        if target_file_path.exists():
+            if self.is_the_target_file_up_to_date(source_file_path, target_file_path):
+                self.filesCountByLinkType["unchanged"] += 1
+                return "unchanged"
+            target_file_path.unlink()
+
+        link_type = "copy"
+        if self.mergeMode == self.linkMergeMode:
+            devices = (source_file_path.stat().st_dev, target_file_path.parent.stat().st_dev)
+            if self._isHardlinkPossibleByDevices.get(devices, True):
+                try:
+                    os.link(str(source_file_path), str(target_file_path))
+                    link_type = "hardlink"
+                except OSError as e:
+                    # Only a devices pair error is kept for the next files, a file error (EPERM, EMLINK, ...) only makes this file reflinked or copied
+                    if e.errno in self.hardlinkNotPossibleErrnos:
+                        self._isHardlinkPossibleByDevices[devices] = False
+            if link_type == "copy" and self._isReflinkPossibleByDevices.get(devices, True):
+                if self._reflink_the_file(source_file_path, target_file_path):
+                    link_type = "reflink"
+                else:
+                    self._isReflinkPossibleByDevices[devices] = False
+
+        if link_type == "copy":
+            shutil.copy2(str(source_file_path), str(target_file_path))
+        self.filesCountByLinkType[link_type] += 1
+        return link_type
+
+    @staticmethod
+    def is_the_target_file_up_to_date(source_file_path: Path, target_file_path: Path) -> bool:
+        # The copies and the reflinks keep the source modification time
+        source_stat = source_file_path.stat()
+        target_stat = target_file_path.stat()
+        if (source_stat.st_dev, source_stat.st_ino) == (target_stat.st_dev, target_stat.st_ino):
+            return True
+        return source_stat.st_size == target_stat.st_size and source_stat.st_mtime_ns == target_stat.st_mtime_ns
+
+    @staticmethod
+    def remove_the_stale_files(target_dir_path: Path, kept_file_paths: set, protected_file_names: List[str] = ()) -> int:
+        removed_files_count = 0
+        for target_sub_dir_path, _, file_names in os.walk(str(target_dir_path)):
+            for file_name in file_names:
+                target_file_path = Path(target_sub_dir_path) / file_name
+                if target_file_path not in kept_file_paths and file_name not in protected_file_names:
+                    target_file_path.unlink()
+                    removed_files_count += 1
+        return removed_files_count
+
+    def _reflink_the_file(self, source_file_path: Path, target_file_path: Path) -> bool:
+        if platform.system() != "Linux":
+            return False
+        import fcntl
+
+        try:
+            with source_file_path.open("rb") as source_file, target_file_path.open("wb") as target_file:
+                fcntl.ioctl(target_file.fileno(), self.reflinkIoctlRequest, source_file.fileno())
+        except OSError:
+            target_file_path.unlink(missing_ok=True)
+            return False
+        shutil.copystat(str(source_file_path), str(target_file_path))
+        return True
+
+    def link_the_tree(self, source_dir_path: Path, target_dir_path: Path) -> NoReturn:
+        linked_file_paths = set()
+        for source_sub_dir_path, _, file_names in os.walk(str(source_dir_path)):
+            target_sub_dir_path = target_dir_path / Path(source_sub_dir_path).relative_to(source_dir_path)
+            target_sub_dir_path.mkdir(parents=True, exist_ok=True)
+            for file_name in file_names:
+                self.link_the_file(Path(source_sub_dir_path) / file_name, target_sub_dir_path / file_name)
+                linked_file_paths.add(target_sub_dir_path / file_name)
+        self.filesCountByLinkType["removed"] += self.remove_the_stale_files(target_dir_path, linked_file_paths)
+
+    def get_the_files_count_resume(self) -> str:
+        return ", ".join(f"{count} {link_type}" for link_type, count in sorted(self.filesCountByLinkType.items()) if count > 0) or "no file"
+
+
+class RotatingLogFile:
+    """
+    Log file rolled over by size as the log4j appenders do, the rotated files are '<name>-1.log' (the most recent) to '<name>-<max>.log'
+    """
+    def __init__(self, log_file_path: Path, max_log_file_size: int, max_log_files_count: int):
+        self.logFilePath = log_file_path
+        self.maxLogFileSize = max_log_file_size
+        self.maxLogFilesCount = max_log_files_count
+        self._logFile = self.logFilePath.open("ab")
+        self._logFileSize = self._logFile.tell()
+
+    def write(self, data: bytes) -> NoReturn:
+        if self._logFileSize > 0 and self._logFileSize + len(data) > self.maxLogFileSize:
+            self._rotate()
+        self._logFile.write(data)
+        self._logFileSize += len(data)
+
+    def close(self) -> NoReturn:
+        self._logFile.close()
+
+    def _rotate(self) -> NoReturn:
+        self._logFile.close()
+        for log_file_index in range(self.maxLogFilesCount - 1, 0, -1):
+            rotated_log_file_path = self.logFilePath.with_name(f"{self.logFilePath.stem}-{log_file_index}.log")
+            if rotated_log_file_path.exists():
+                rotated_log_file_path.replace(self.logFilePath.with_name(f"{self.logFilePath.stem}-{log_file_index + 1}.log"))
+        if self.maxLogFilesCount > 0:
+            self.logFilePath.replace(self.logFilePath.with_name(f"{self.logFilePath.stem}-1.log"))
+        self._logFile = self.logFilePath.open("wb")
+        self._logFileSize = 0
+
+
+class LogArchiver:
+    archivesFolderName = "log-archives"
+    archivedLogsJsonFileName = "archived-logs.json"
+    scanParallelism = 8
+    copyParallelism = 8
+    streamParallelism = 8
+    streamMemberSpoolSize = 8 * 1024 * 1024
+    gzipCompressionLevel = 6
+    zstdCompressionLevel = 3
+
+    def __init__(self, archives_dir_path: Path, session_name: str = None, stream_parallelism: int = None):
+        self.archivesDirPath = archives_dir_path
+        self.sessionName = session_name or datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        self.streamParallelism = stream_parallelism or self.streamParallelism
+        self._foldersToArchive: List[Tuple[Path, str, Optional[Callable[[Path], Path]], Optional[Path]]] = []
+        self._tarStreamCommandsToArchive: List[Tuple[List[str], str]] = []
+
+    @staticmethod
+    def get_the_compression() -> str:
+        # zstd is used when its optional module is installed, it compresses logs faster and with several threads
+        try:
+            import zstandard
+        except ImportError:
+            return "gz"
+        return "zst"
+
+    def add_the_folder(self, source_dir_path: Path, archive_dir_name: str, relative_path_mapper: Callable[[Path], Path] = None,
+                       copy_dir_path: Path = None) -> NoReturn:
+        # The copy folder, when given, also receives a plain copy of the folder files, to be read without extracting the archive
+        if source_dir_path.is_dir():
+            self._foldersToArchive.append((source_dir_path, archive_dir_name, relative_path_mapper, copy_dir_path))
+
+    def add_the_tar_stream_command(self, command_arguments: List[str], archive_dir_name: str) -> NoReturn:
+        """
+        Add the files of the tar stream written by the command on its standard output (like 'docker cp <container>:<folder> -'),
+        the first folder of their path is replaced by the archive folder name
+        """
+        self._tarStreamCommandsToArchive.append((command_arguments, archive_dir_name))
+
+    def _archive_the_tar_stream(self, tar_stream_command: Tuple[List[str], str], tar_file: tarfile.TarFile, tar_file_lock: threading.Lock,
+                                archived_logs: dict) -> Tuple[int, int]:
+        command_arguments, archive_dir_name = tar_stream_command
+        archived_files_count = 0
+        skipped_files_count = 0
+        with subprocess.Popen(command_arguments, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as stream_process:
+            try:
+                with tarfile.open(fileobj=stream_process.stdout, mode="r|") as stream_tar_file:
+                    for member in stream_tar_file:
+                        if not member.isfile():
+                            continue
+                        archive_name = (Path(archive_dir_name) / member.name).as_posix()
+                        file_identity = f"{member.size}:{int(member.mtime * 1e9)}"
+                        if archived_logs.get(archive_name, None) == file_identity:
+                            skipped_files_count += 1
+                            continue
+                        # Read outside the lock, so the streams are read at the same time and only the archive writes are serialized
+                        with tempfile.SpooledTemporaryFile(max_size=self.streamMemberSpoolSize) as member_content:
+                            shutil.copyfileobj(stream_tar_file.extractfile(member), member_content)
+                            member_content.seek(0)
+                            member.name = archive_name
+                            with tar_file_lock:
+                                tar_file.addfile(member, member_content)
+                                archived_logs[archive_name] = file_identity
+                        archived_files_count += 1
+            except tarfile.TarError as e:
+                print(f"     ! Archive the output of '{' '.join(command_arguments)}' failed: {e}")
+                # Its output is not read anymore, so the command would be blocked on a full pipe
+                stream_process.kill()
+            error_output = stream_process.stderr.read().decode(errors="replace").strip()
+        if stream_process.returncode != 0:
+            print(f"     ! '{' '.join(command_arguments)}' failed: {error_output}")
+        return archived_files_count, skipped_files_count
+
+    def _scan_the_folder(self, folder_to_archive: Tuple[Path, str, Optional[Callable[[Path], Path]], Optional[Path]]) -> List[Tuple[Path, str, str, Optional[Path]]]:
+        source_dir_path, archive_dir_name, relative_path_mapper, copy_dir_path = folder_to_archive
+        files_to_archive = []
+        for source_sub_dir_path, _, file_names in os.walk(str(source_dir_path)):
+            for file_name in file_names:
+                source_file_path = Path(source_sub_dir_path) / file_name
+                relative_path = source_file_path.relative_to(source_dir_path)
+                if relative_path_mapper is not None:
+                    relative_path = relative_path_mapper(relative_path)
+                try:
+                    source_file_stat = source_file_path.stat()
+                except OSError:
+                    continue
+                files_to_archive.append((source_file_path, (Path(archive_dir_name) / relative_path).as_posix(), f"{source_file_stat.st_size}:{source_file_stat.st_mtime_ns}",
+                                         None if copy_dir_path is None else copy_dir_path / relative_path))
+        return files_to_archive
+
+    def _copy_the_files(self, files_to_archive: List[Tuple[Path, str, str, Optional[Path]]]) -> int:
+        copy_plan = [(source_file_path, target_file_path) for source_file_path, _, _, target_file_path in files_to_archive
+                     if target_file_path is not None and (not target_file_path.exists() or not FileLinker.is_the_target_file_up_to_date(source_file_path, target_file_path))]
+        for target_dir_path in sorted({target_file_path.parent for _, target_file_path in copy_plan}):
+            target_dir_path.mkdir(parents=True, exist_ok=True)
+
+        def copy_the_file(source_and_target: Tuple[Path, Path]) -> bool:
+            source_file_path, target_file_path = source_and_target
+            try:
+                shutil.copy2(str(source_file_path), str(target_file_path))
+            except OSError as e:
+                print(f"     ! Copy the log file '{source_file_path}' failed: {e}")
+                return False
+            return True
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.copyParallelism) as executor:
+            return sum(executor.map(copy_the_file, copy_plan))
+
+    def _create_the_session_archive_file(self, compression: str) -> Tuple[Path, Any]:
+        # An existing archive is never overwritten, as its rotated logs are already recorded as archived
+        archive_index = 1
+        while True:
+            archive_name_suffix = "" if archive_index == 1 else f"-{archive_index}"
+            archive_file_path = self.archivesDirPath / f"logs-{self.sessionName}{archive_name_suffix}.tar.{compression}"
+            try:
+                return archive_file_path, archive_file_path.open("xb")
+            except FileExistsError:
+                archive_index += 1
+
+    def write_the_session_archive(self) -> Optional[Path]:
+        """
+        Stream the added folders into one compressed tar archive of the session.
+        The log files already put unchanged in a previous archive are skipped, like the rotated log files ('-%i.log') which don't change anymore.
+        """
+        if len(self._foldersToArchive) == 0 and len(self._tarStreamCommandsToArchive) == 0:
+            return None
+
+        self.archivesDirPath.mkdir(parents=True, exist_ok=True)
+        archived_logs_json_file_path = self.archivesDirPath / self.archivedLogsJsonFileName
+        archived_logs = {}
+        if archived_logs_json_file_path.exists():
+            try:
+                with archived_logs_json_file_path.open("r") as json_file:
+                    archived_logs = json.load(json_file)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"     ! The archived logs list '{archived_logs_json_file_path}' is ignored: {e}")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.scanParallelism) as executor:
+            files_to_archive = [file_to_archive for folder_files in executor.map(self._scan_the_folder, self._foldersToArchive) for file_to_archive in folder_files]
+        # The log files already archived are still copied, the copy folders are emptied by each start
+        copied_files_count = self._copy_the_files(files_to_archive)
+        if copied_files_count > 0:
+            print(f"     - {copied_files_count} log files copied next to the archive")
+        skipped_files_count = len(files_to_archive)
+        files_to_archive = [(source_file_path, archive_name, file_identity) for source_file_path, archive_name, file_identity, _ in files_to_archive
+                            if archived_logs.get(archive_name, None) != file_identity]
+        skipped_files_count -= len(files_to_archive)
+
+        compression = self.get_the_compression()
+        archive_file_path, archive_file = self._create_the_session_archive_file(compression)
+        archived_files_count = 0
+        with archive_file:
+            if compression == "zst":
+                import zstandard
+                compressed_stream = zstandard.ZstdCompressor(level=self.zstdCompressionLevel, threads=-1).stream_writer(archive_file, closefd=False)
+                tar_file = tarfile.open(fileobj=compressed_stream, mode="w|")
+            else:
+                compressed_stream = None
+                tar_file = tarfile.open(fileobj=archive_file, mode="w:gz", compresslevel=self.gzipCompressionLevel)
+            with tar_file:
+                for source_file_path, archive_name, file_identity in files_to_archive:
+                    try:
+                        tar_file.add(str(source_file_path), arcname=archive_name, recursive=False)
+                    except OSError as e:
+                        print(f"     ! Archive the log file '{source_file_path}' failed: {e}")
+                        continue
+                    archived_files_count += 1
+                    archived_logs[archive_name] = file_identity
+                tar_file_lock = threading.Lock()
+                with concurrent.futures.ThreadPoolExecutor(max_workers=self.streamParallelism) as executor:
+                    for stream_archived_files_count, stream_skipped_files_count in executor.map(
+                            lambda tar_stream_command: self._archive_the_tar_stream(tar_stream_command, tar_file, tar_file_lock, archived_logs),
+                            self._tarStreamCommandsToArchive):
+                        archived_files_count += stream_archived_files_count
+                        skipped_files_count += stream_skipped_files_count
+            if compressed_stream is not None:
+                compressed_stream.close()
+
+        with archived_logs_json_file_path.open("w") as json_file:
+            json.dump(archived_logs, json_file)
+
+        print(f"     - {archived_files_count} log files archived into '{archive_file_path}' ({skipped_files_count} unchanged log files already archived)")
+        return archive_file_path
+
+
+class LogIndex:
+    logIndexJsonFileName = "log-index.json"
+    logLinePattern = re.compile(rb"^(\d\d/\d\d \d\d:\d\d):\d\d\.\d{3} - (\w+)\s*-")
+    timestampTemplates = {"from": "01/01 00:00:00.000", "to": "12/31 23:59:59.999"}
+    rotatedLogFileNameSuffixPattern = re.compile(r"(-\d+)?\.log$")
+
+    def __init__(self, pel_dir_path: Path):
+        self.pelDirPath = pel_dir_path
+        self.logIndexJsonFilePath = pel_dir_path / self.logIndexJsonFileName
+        self.logArchivesDirPath = pel_dir_path / LogArchiver.archivesFolderName
+        self._indexedFilesByPath: Dict[str, dict] = {}
+        self._indexedFilesByMemberNameByArchivePath: Dict[str, Dict[str, dict]] = {}
+
+    def list_the_log_files(self) -> Dict[str, str]:
+        """
+        Return the component deployment path of each log file: the PEL components logs are in their 'logs' folder,
+        the single DSL logs are named after the component topology ('node..group..component.log').
+        """
+        component_by_log_file_path = {}
+        running_deployment_path = self.pelDirPath / PelDeploymentDescriptionParser.runningDeploymentRootFolderName
+        for log_file_path in running_deployment_path.glob("**/logs/**/*.log"):
+            relative_parts = log_file_path.relative_to(running_deployment_path).parts
+            component_by_log_file_path[str(log_file_path)] = "/".join(relative_parts[:relative_parts.index("logs")])
+        single_dsl_deployment_path = self.pelDirPath / SingleDslPel.singleDslPelDeploymentRootFolderName
+        for log_file_path in single_dsl_deployment_path.glob("*/logs/**/*.log"):
+            component_name = self.rotatedLogFileNameSuffixPattern.sub("", log_file_path.name)
+            component_by_log_file_path[str(log_file_path)] = "/".join(component_name.split(".."))
+        return component_by_log_file_path
+
+    @classmethod
+    def get_the_archived_log_component(cls, member_name: str) -> Optional[str]:
+        # The archives keep the single DSL logs in the components topology folders, and the PEL logs in the 'logs' folder of their component
+        member_parts = member_name.split("/")
+        if member_parts[0] == SingleDslPel.singleDslLogFolderName:
+            return cls.rotatedLogFileNameSuffixPattern.sub("", "/".join(member_parts[1:]))
+        if "logs" in member_parts[:-1]:
+            return "/".join(member_parts[:member_parts.index("logs")])
+        return None
+
+    def _load(self) -> NoReturn:
+        self._indexedFilesByPath = {}
+        self._indexedFilesByMemberNameByArchivePath = {}
+        if self.logIndexJsonFilePath.exists():
+            try:
+                with self.logIndexJsonFilePath.open("r") as json_file:
+                    log_index = json.load(json_file)
+                self._indexedFilesByPath = log_index.get("files", {})
+                self._indexedFilesByMemberNameByArchivePath = log_index.get("archives", {})
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"     ! The log index '{self.logIndexJsonFilePath}' is rebuilt: {e}")
+
+    def _index_the_lines(self, log_file, indexed_file: dict) -> NoReturn:
+        blocks = indexed_file["blocks"]
+        offset = indexed_file["indexedOffset"]
+        level = indexed_file["level"]
+        for line in log_file:
+            if not line.endswith(b"\n"):
+                break   # the line is still being written
+            if offset == 0:
+                indexed_file["firstLineHash"] = hashlib.sha1(line).hexdigest()
+            line_match = self.logLinePattern.match(line)
+            if line_match is not None:
+                bucket = line_match.group(1).decode()
+                level = line_match.group(2).decode()
+                if len(blocks) == 0 or blocks[-1][0] != bucket:
+                    blocks.append([bucket, offset, offset, ""])
+            if len(blocks) > 0:
+                blocks[-1][2] = offset + len(line)
+                if level is not None and level not in blocks[-1][3].split(","):
+                    blocks[-1][3] = ",".join(filter(None, [blocks[-1][3], level]))
+            offset += len(line)
+        indexed_file["indexedOffset"] = offset
+        indexed_file["level"] = level
+
+    @staticmethod
+    def _read_the_archive(archive_file_path: Path, read_the_member: Callable[[tarfile.TarInfo, Any], bool]) -> NoReturn:
+        # The archive is read as a stream, the member reader returns False to stop the reading
+        with archive_file_path.open("rb") as archive_file:
+            if archive_file_path.name.endswith(".zst"):
+                import zstandard
+                archive_stream = zstandard.ZstdDecompressor().stream_reader(archive_file)
+                tar_file = tarfile.open(fileobj=archive_stream, mode="r|")
+            else:
+                tar_file = tarfile.open(fileobj=archive_file, mode="r|gz")
+            with tar_file:
+                for member in tar_file:
+                    if member.isfile() and not read_the_member(member, tar_file.extractfile(member)):
+                        break
+
+    def _index_the_archive(self, archive_file_path: Path) -> Optional[Dict[str, dict]]:
+        indexed_files_by_member_name = {}
+
+        def index_the_member(member: tarfile.TarInfo, member_file) -> bool:
+            component = self.get_the_archived_log_component(member.name) if member.name.endswith(".log") else None
+            if component is not None:
+                indexed_file = {"component": component, "firstLineHash": None, "indexedOffset": 0, "level": None, "blocks": []}
+                self._index_the_lines(member_file, indexed_file)
+                indexed_files_by_member_name[member.name] = indexed_file
+            return True
+
+        # An archive which can't be read yet (still being written, zstd module missing) is indexed by a next update
+        try:
+            self._read_the_archive(archive_file_path, index_the_member)
+        except (OSError, EOFError, ImportError, tarfile.TarError) as e:
+            print(f"     ! The log archive '{archive_file_path}' is not indexed: {e}")
+            return None
+        return indexed_files_by_member_name
+
+    def update(self) -> NoReturn:
+        """
+        Index the new lines of the log files by blocks of lines of the same minute: each block keeps its file offsets and its levels.
+        A file already indexed is read from its last indexed offset, unless it was rotated or truncated.
+        The session archives don't change, each one is indexed once.
+        """
+        self._load()
+        component_by_log_file_path = self.list_the_log_files()
+        for log_file_path in list(self._indexedFilesByPath.keys()):
+            if log_file_path not in component_by_log_file_path:
+                del self._indexedFilesByPath[log_file_path]
+
+        def index_the_file(log_file_path: str) -> NoReturn:
+            try:
+                log_file_stat = os.stat(log_file_path)
+            except OSError:
+                return
+            indexed_file = self._indexedFilesByPath.get(log_file_path, None)
+            if indexed_file is None or indexed_file["inode"] != log_file_stat.st_ino or indexed_file["indexedOffset"] > log_file_stat.st_size or "firstLineHash" not in indexed_file:
+                indexed_file = {"component": component_by_log_file_path[log_file_path], "firstLineHash": None, "inode": log_file_stat.st_ino,
+                                "indexedOffset": 0, "level": None, "blocks": []}
+            if indexed_file["indexedOffset"] == log_file_stat.st_size:
+                self._indexedFilesByPath[log_file_path] = indexed_file
+                return
+
+            with open(log_file_path, "rb") as log_file:
+                log_file.seek(indexed_file["indexedOffset"])
+                self._index_the_lines(log_file, indexed_file)
+            self._indexedFilesByPath[log_file_path] = indexed_file
+
+        archive_file_paths = {str(archive_file_path) for archive_file_path in self.logArchivesDirPath.glob("logs-*.tar.*")}
+        for archive_file_path in list(self._indexedFilesByMemberNameByArchivePath.keys()):
+            if archive_file_path not in archive_file_paths:
+                del self._indexedFilesByMemberNameByArchivePath[archive_file_path]
+        archive_file_paths_to_index = sorted(archive_file_paths - self._indexedFilesByMemberNameByArchivePath.keys())
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=LogArchiver.scanParallelism) as executor:
+            for _ in executor.map(index_the_file, component_by_log_file_path.keys()):
+                pass
+            for archive_file_path, indexed_files_by_member_name in zip(archive_file_paths_to_index,
+                                                                      executor.map(lambda path: self._index_the_archive(Path(path)), archive_file_paths_to_index)):
+                if indexed_files_by_member_name is not None:
+                    self._indexedFilesByMemberNameByArchivePath[archive_file_path] = indexed_files_by_member_name
+
+        with self.logIndexJsonFilePath.open("w") as json_file:
+            json.dump({"files": self._indexedFilesByPath, "archives": self._indexedFilesByMemberNameByArchivePath}, json_file)
+
+    def _get_the_files_to_search(self) -> Tuple[Dict[str, Dict[str, dict]], Dict[str, dict]]:
+        """
+        Return the archived and the live log files to search, each log content once: the versions of a log file (live, archived by
+        several sessions, renamed by the rotations) start with the same first line, and the longest version contains the other ones.
+        """
+        longest_files_by_first_line = {}
+        # The live files come first, and then the newest archives, to be kept on a length tie
+        indexed_files = [(None, log_file_path, indexed_file) for log_file_path, indexed_file in self._indexedFilesByPath.items()]
+        for archive_file_path in sorted(self._indexedFilesByMemberNameByArchivePath.keys(), reverse=True):
+            indexed_files.extend((archive_file_path, member_name, indexed_file) for member_name, indexed_file in self._indexedFilesByMemberNameByArchivePath[archive_file_path].items())
+        for archive_file_path, file_name, indexed_file in indexed_files:
+            if indexed_file["firstLineHash"] is None:
+                continue
+            first_line = (indexed_file["component"], indexed_file["firstLineHash"])
+            longest_file = longest_files_by_first_line.get(first_line, None)
+            if longest_file is None or longest_file[2]["indexedOffset"] < indexed_file["indexedOffset"]:
+                longest_files_by_first_line[first_line] = (archive_file_path, file_name, indexed_file)
+
+        indexed_files_by_member_name_by_archive_path = {}
+        indexed_files_by_path = {}
+        for archive_file_path, file_name, indexed_file in longest_files_by_first_line.values():
+            if archive_file_path is None:
+                indexed_files_by_path[file_name] = indexed_file
+            else:
+                indexed_files_by_member_name_by_archive_path.setdefault(archive_file_path, {})[file_name] = indexed_file
+        return indexed_files_by_member_name_by_archive_path, indexed_files_by_path
+
+    @classmethod
+    def _get_the_complete_timestamp(cls, timestamp: Optional[str], bound: str) -> Optional[str]:
+        if timestamp is None:
+            return None
+        if not re.match(r"^\d\d(/\d\d( \d\d(:\d\d(:\d\d(\.\d{1,3})?)?)?)?)?$", timestamp):
+            raise UserWarning(f"The time '{timestamp}' doesn't match the log time format 'MM/dd HH:mm:ss.SSS' (or one of its beginnings)")
+        return timestamp + cls.timestampTemplates[bound][len(timestamp):]
+
+    @staticmethod
+    def _get_the_block_reader(log_file, is_seekable: bool) -> Callable[[int, int], bytes]:
+        # An archive member stream can't seek: its blocks are read in the file order and the lines between them are skipped
+        position = [0]
+
+        def read_the_block(start_offset: int, end_offset: int) -> bytes:
+            if is_seekable:
+                log_file.seek(start_offset)
+            else:
+                while position[0] < start_offset:
+                    skipped_bytes = log_file.read(min(start_offset - position[0], LogArchiver.streamMemberSpoolSize))
+                    if len(skipped_bytes) == 0:
+                        return b""
+                    position[0] += len(skipped_bytes)
+            block = log_file.read(end_offset - start_offset)
+            position[0] = start_offset + len(block)
+            return block
+        return read_the_block
+
+    def search(self, from_time: str = None, to_time: str = None, components: List[str] = None, levels: List[str] = None,
+               text_pattern: str = None, max_lines_count: int = None) -> List[Tuple[str, str]]:
+        from_timestamp = self._get_the_complete_timestamp(from_time, "from")
+        to_timestamp = self._get_the_complete_timestamp(to_time, "to")
+        levels = {level.upper() for level in levels} if levels else None
+        text_regex = re.compile(text_pattern.encode()) if text_pattern else None
+
+        def select_the_blocks(indexed_file: dict) -> list:
+            if components and not any(indexed_file["component"] == component or indexed_file["component"].startswith(component.rstrip("/") + "/") for component in components):
+                return []
+            # Only the blocks of the time window with the searched levels are read
+            return [block for block in indexed_file["blocks"]
+                    if (from_timestamp is None or block[0] >= from_timestamp[:11])
+                    and (to_timestamp is None or block[0] <= to_timestamp[:11])
+                    and (levels is None or not levels.isdisjoint(block[3].split(",")))]
+
+        found_lines = []
+
+        def search_the_blocks(read_the_block: Callable[[int, int], bytes], indexed_file: dict, selected_blocks: list) -> bool:
+            for _, start_offset, end_offset, _ in selected_blocks:
+                line_timestamp, line_level = None, None
+                for line in read_the_block(start_offset, end_offset).splitlines():
+                    line_match = self.logLinePattern.match(line)
+                    if line_match is not None:
+                        line_timestamp, line_level = line[:18].decode(), line_match.group(2).decode()
+                    if from_timestamp is not None and (line_timestamp is None or line_timestamp < from_timestamp):
+                        continue
+                    if to_timestamp is not None and (line_timestamp is None or line_timestamp > to_timestamp):
+                        continue
+                    if levels is not None and line_level not in levels:
+                        continue
+                    if text_regex is not None and text_regex.search(line) is None:
+                        continue
+                    found_lines.append((indexed_file["component"], line.decode(errors="replace")))
+                    if max_lines_count is not None and len(found_lines) >= max_lines_count:
+                        return False
+            return True
+
+        # The archived logs are older than the live ones, so they are searched first
+        indexed_files_by_member_name_by_archive_path, indexed_files_by_path = self._get_the_files_to_search()
+        for archive_file_path, indexed_files_by_member_name in sorted(indexed_files_by_member_name_by_archive_path.items()):
+            selected_blocks_by_member_name = {member_name: select_the_blocks(indexed_file) for member_name, indexed_file in indexed_files_by_member_name.items()}
+            if not any(selected_blocks_by_member_name.values()):
+                continue
+            try:
+                self._read_the_archive(Path(archive_file_path), lambda member, member_file: len(selected_blocks_by_member_name.get(member.name, [])) == 0 or
+                                       search_the_blocks(self._get_the_block_reader(member_file, False), indexed_files_by_member_name[member.name],
+                                                         selected_blocks_by_member_name[member.name]))
+            except (OSError, EOFError, ImportError, tarfile.TarError) as e:
+                print(f"     ! The log archive '{archive_file_path}' is not searched: {e}")
+            if max_lines_count is not None and len(found_lines) >= max_lines_count:
+                return found_lines
+
+        for log_file_path, indexed_file in sorted(indexed_files_by_path.items()):
+            selected_blocks = select_the_blocks(indexed_file)
+            if len(selected_blocks) == 0:
+                continue
+            with open(log_file_path, "rb") as log_file:
+                if not search_the_blocks(self._get_the_block_reader(log_file, True), indexed_file, selected_blocks):
+                    return found_lines
+        return found_lines
+
+
+class JarConflictAnalyzer:
+    jarIndexCacheFileName = "jar-index-cache.json"
+    jarConflictsReportFileName = "jar-conflicts-report.json"
+    analysisParallelism = 8
+
+    def __init__(self, cache_file_path: Path):
+        self.cacheFilePath = cache_file_path
+        self._digestByFileIdentity: Dict[str, str] = {}
+        self._entriesByDigest: Dict[str, List[str]] = {}
+
+    def _load_the_cache(self) -> NoReturn:
+        if not self.cacheFilePath.exists():
+            return
+        try:
+            with self.cacheFilePath.open("r") as cache_file:
+                cache_dict = json.load(cache_file)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"    - The jar index cache '{self.cacheFilePath}' is ignored: {e}")
+            return
+        self._digestByFileIdentity = cache_dict.get("digestByFileIdentity", {})
+        self._entriesByDigest = cache_dict.get("entriesByDigest", {})
+
+    def _save_the_cache(self, used_digests: set) -> NoReturn:
+        # Only the jars still used are kept, so the cache doesn't grow with each deployment
+        cache_dict = {
+            "digestByFileIdentity": {file_identity: digest for file_identity, digest in self._digestByFileIdentity.items() if digest in used_digests},
+            "entriesByDigest": {digest: entries for digest, entries in self._entriesByDigest.items() if digest in used_digests},
+        }
+        self.cacheFilePath.parent.mkdir(parents=True, exist_ok=True)
+        with self.cacheFilePath.open("w") as cache_file:
+            json.dump(cache_dict, cache_file)
+
+    def _get_the_jar_digest(self, jar_path: Path) -> str:
+        # The inode is part of the identity, so the hardlinked copies of a jar share the same cache entry
+        jar_stat = jar_path.stat()
+        file_identity = f"{jar_stat.st_dev}:{jar_stat.st_ino}:{jar_stat.st_size}:{jar_stat.st_mtime_ns}"
+        digest = self._digestByFileIdentity.get(file_identity, None)
+        if digest is None:
+            jar_hash = hashlib.sha256()
+            with jar_path.open("rb") as jar_file:
+                for chunk in iter(lambda: jar_file.read(SubprocessLogCapture.chunkSize), b""):
+                    jar_hash.update(chunk)
+            digest = jar_hash.hexdigest()
+            self._digestByFileIdentity[file_identity] = digest
+        return digest
+
+    def _get_the_jar_entries(self, jar_path: Path) -> Tuple[str, Optional[List[str]]]:
+        digest = self._get_the_jar_digest(jar_path)
+        entries = self._entriesByDigest.get(digest, None)
+        if entries is None:
+            # Only the zip central directory is read, nothing is extracted
+            try:
+                with zipfile.ZipFile(str(jar_path)) as jar_zip_file:
+                    entries = [name for name in jar_zip_file.namelist() if not name.endswith("/") and not name.startswith("META-INF/")]
+            except (OSError, zipfile.BadZipFile) as e:
+                print(f"   ERROR: impossible to read the jar '{jar_path}': {e}")
+                return digest, None
+            self._entriesByDigest[digest] = entries
+        return digest, entries
+
+    def analyze(self, ordered_jar_paths: List[Path]) -> dict:
+        """
+        Index the classes and resources of the jars and report the shadowed ones,
+        the winner being the first jar in the given classpath order.
+        A jar is dead weight when all its classes are shadowed by previous jars.
+        """
+        self._load_the_cache()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.analysisParallelism) as executor:
+            digests_and_entries = list(executor.map(self._get_the_jar_entries, ordered_jar_paths))
+        self._save_the_cache({digest for digest, _ in digests_and_entries})
+
+        winner_jar_by_entry: Dict[str, str] = {}
+        shadowed_jars_by_entry: Dict[str, List[str]] = {}
+        dead_weight_jars = []
+        for jar_path, (_, entries) in zip(ordered_jar_paths, digests_and_entries):
+            if entries is None:
+                continue
+            jar_name = f"{jar_path.parent.name}/{jar_path.name}"
+            class_entries_count = 0
+            shadowed_class_entries_count = 0
+            for entry in entries:
+                is_class_entry = entry.endswith(".class")
+                class_entries_count += is_class_entry
+                winner_jar = winner_jar_by_entry.setdefault(entry, jar_name)
+                if winner_jar != jar_name:
+                    shadowed_jars_by_entry.setdefault(entry, [winner_jar]).append(jar_name)
+                    shadowed_class_entries_count += is_class_entry
+            if class_entries_count > 0 and shadowed_class_entries_count == class_entries_count:
+                dead_weight_jars.append(jar_name)
+
+        shadowing_count_by_jars = collections.Counter()
+        for entry, jars in shadowed_jars_by_entry.items():
+            if entry.endswith(".class"):
+                for shadowed_jar in jars[1:]:
+                    shadowing_count_by_jars[(jars[0], shadowed_jar)] += 1
+
+        return {
+            "shadowedClasses": {entry: {"winner": jars[0], "shadowed": jars[1:]} for entry, jars in sorted(shadowed_jars_by_entry.items()) if entry.endswith(".class")},
+            "shadowedResources": {entry: {"winner": jars[0], "shadowed": jars[1:]} for entry, jars in sorted(shadowed_jars_by_entry.items()) if not entry.endswith(".class")},
+            "shadowedClassesCountByJars": [{"winner": winner_jar, "shadowed": shadowed_jar, "count": count}
+                                           for (winner_jar, shadowed_jar), count in shadowing_count_by_jars.most_common()],
+            "deadWeightJars": dead_weight_jars,
+        }
+
+
+class DockerImagePullManager:
+    pullParallelism = 4
+    maxPullAttemptsCount = 4
+    firstRetryDelayInSeconds = 2.0
+    maxRetryDelayInSeconds = 30.0
+
+    def __init__(self, log_dir_path: Path, pull_parallelism: int = None):
+        self.logDirPath = log_dir_path
+        self.pullParallelism = pull_parallelism or self.pullParallelism
+        self._progressLock = threading.Lock()
+        self._completedPullsCount = 0
+
+    def pull_the_images(self, image_names: List[str], expected_digest_by_image_name: dict = None) -> Dict[str, Optional[str]]:
+        """
+        Pull the images in parallel, except the ones whose local digest is the expected one, and give the digest of each image,
+        None when its pull failed
+        """
+        expected_digest_by_image_name = expected_digest_by_image_name or {}
+        self._completedPullsCount = 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.pullParallelism) as executor:
+            digests = list(executor.map(lambda image_name: self._pull_the_image_if_needed(image_name, expected_digest_by_image_name.get(image_name, None), len(image_names)),
+                                        image_names))
+        return dict(zip(image_names, digests))
+
+    def pull_the_image(self, image_name: str) -> Optional[str]:
+        log_file_path = self.logDirPath / f"pull-{re.sub(r'[^A-Za-z0-9_.-]', '_', image_name)}.log"
+        log_file_path.parent.mkdir(parents=True, exist_ok=True)
+        retry_delay_in_seconds = self.firstRetryDelayInSeconds
+        for attempt_number in range(1, self.maxPullAttemptsCount + 1):
+            with log_file_path.open("a") as log_file:
+                complete_process = subprocess.run(["docker", "pull", image_name], stdout=log_file, stderr=subprocess.STDOUT)
+            if complete_process.returncode == 0:
+                return self.get_the_local_image_digest(image_name)
+            if attempt_number < self.maxPullAttemptsCount:
+                print(f"        ! Pull {image_name} failed (attempt {attempt_number}/{self.maxPullAttemptsCount}), retry in {retry_delay_in_seconds:.0f}s")
+                time.sleep(retry_delay_in_seconds)
+                retry_delay_in_seconds = min(self.maxRetryDelayInSeconds, retry_delay_in_seconds * 2)
+        print(f"        ! Pull {image_name} failed, see '{log_file_path}'")
+        return None
+
+    @staticmethod
+    def get_the_local_image_digest(image_name: str) -> Optional[str]:
+        complete_process = subprocess.run(["docker", "image", "inspect", "--format", "{{json .RepoDigests}}", image_name], capture_output=True, text=True)
+        if complete_process.returncode != 0:
+            return None
+        try:
+            repository_digests = json.loads(complete_process.stdout) or []
+        except json.JSONDecodeError:
+            return None
+        # A repository digest is 'repository@sha256:...', the one of the image repository is preferred
+        image_repository = image_name.rsplit("@", 1)[0]
+        if ":" in image_repository.rsplit("/", 1)[-1]:
+            image_repository = image_repository.rsplit(":", 1)[0]
+        for repository_digest in repository_digests:
+            if repository_digest.split("@", 1)[0] == image_repository:
+                return repository_digest.split("@", 1)[1]
+        return repository_digests[0].split("@", 1)[1] if len(repository_digests) > 0 else None
+
+    def _pull_the_image_if_needed(self, image_name: str, expected_digest: Optional[str], images_count: int) -> Optional[str]:
+        if expected_digest is not None and self.get_the_local_image_digest(image_name) == expected_digest:
+            digest, status = expected_digest, "already present"
+        else:
+            digest = self.pull_the_image(image_name)
+            status = "pulled" if digest is not None else "FAILED"
+        with self._progressLock:
+            self._completedPullsCount += 1
+            print(f"      - [{self._completedPullsCount}/{images_count}] {image_name}: {status}")
+        return digest
+
+
+class DockerImageBundle:
+    manifestFileName = "manifest.json"
+    lockFileName = "bundle.lock"
+    transferParallelism = 4
+    copyChunkSize = 1024 * 1024
+    gzipCompressionLevel = 6
+    zstdCompressionLevel = 3
+
+    def __init__(self, bundle_dir_path: Path, transfer_parallelism: int = None):
+        self.bundleDirPath = bundle_dir_path
+        self.transferParallelism = transfer_parallelism or self.transferParallelism
+        self.compression = self.get_the_compression()
+        self._lockFile = None
+
+    @staticmethod
+    def get_the_compression() -> str:
+        # zstd (command or optional module) compresses faster and with several threads, else gzip (by pigz when present)
+        if shutil.which("zstd") is not None:
+            return "zst"
+        try:
+            import zstandard
+        except ImportError:
+            return "gz"
+        return "zst"
+
+    @staticmethod
+    def get_the_local_image_identifier(image_name: str) -> Optional[str]:
+        complete_process = subprocess.run(["docker", "image", "inspect", "--format", "{{.Id}}", image_name], capture_output=True, text=True)
+        if complete_process.returncode != 0:
+            return None
+        return complete_process.stdout.strip() or None
+
+    def lock(self, is_exclusive: bool = True, is_blocking: bool = True) -> bool:
+        """
+        Lock the bundle against the other deployers sharing the cache: exclusively to write it or remove it, shared to read it.
+        Without blocking, False is returned when the bundle is already locked.
+        """
+        import fcntl
+        lock_file_path = self.bundleDirPath / self.lockFileName
+        self.bundleDirPath.mkdir(parents=True, exist_ok=True)
+        while True:
+            lock_file = lock_file_path.open("a")
+            try:
+                fcntl.flock(lock_file.fileno(), (fcntl.LOCK_EX if is_exclusive else fcntl.LOCK_SH) | (0 if is_blocking else fcntl.LOCK_NB))
+            except BlockingIOError:
+                lock_file.close()
+                return False
+            # The lock got on a bundle removed meanwhile is taken again on the new lock file
+            try:
+                if os.stat(lock_file_path).st_ino == os.fstat(lock_file.fileno()).st_ino:
+                    self._lockFile = lock_file
+                    return True
+            except FileNotFoundError:
+                self.bundleDirPath.mkdir(parents=True, exist_ok=True)
+            lock_file.close()
+
+    def unlock(self) -> NoReturn:
+        if self._lockFile is not None:
+            self._lockFile.close()
+            self._lockFile = None
+
+    def read_the_manifest(self) -> dict:
+        manifest_file_path = self.bundleDirPath / self.manifestFileName
+        if not manifest_file_path.exists():
+            return {"images": []}
+        try:
+            with manifest_file_path.open("r") as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"     ! The docker images bundle manifest '{manifest_file_path}' is ignored: {e}")
+            return {"images": []}
+
+    def save(self, image_names: List[str], digest_by_image_name: dict = None, reusable_image_file_path_by_identifier: Dict[str, Path] = None) -> bool:
+        """
+        Export each image into its own compressed archive, in parallel, the archives of the images whose identifier
+        is the one of the existing manifest are kept, the reusable ones are hardlinked, then write the manifest of the bundle
+        """
+        digest_by_image_name = digest_by_image_name or {}
+        reusable_image_file_path_by_identifier = reusable_image_file_path_by_identifier or {}
+        self.bundleDirPath.mkdir(parents=True, exist_ok=True)
+        previous_entry_by_image_name = {image_entry["name"]: image_entry for image_entry in self.read_the_manifest().get("images", [])}
+
+        def save_the_image(image_name: str) -> Optional[dict]:
+            image_identifier = self.get_the_local_image_identifier(image_name)
+            if image_identifier is None:
+                print(f"      ! The docker image {image_name} is not present")
+                return None
+            previous_entry = previous_entry_by_image_name.get(image_name, None)
+            if previous_entry is not None and previous_entry.get("identifier", None) == image_identifier and (self.bundleDirPath / previous_entry["file"]).exists():
+                print(f"      - {image_name} is already exported")
+                return previous_entry
+            reusable_image_file_path = reusable_image_file_path_by_identifier.get(image_identifier, None)
+            if reusable_image_file_path is not None:
+                image_file_name = f"{re.sub(r'[^A-Za-z0-9_.-]', '_', image_name)}.tar.{reusable_image_file_path.name.rsplit('.tar.', 1)[-1]}"
+                if self._reuse_the_image_file(reusable_image_file_path, self.bundleDirPath / image_file_name):
+                    print(f"      - {image_name} reused from '{reusable_image_file_path.parent.name}'")
+                else:
+                    reusable_image_file_path = None
+            if reusable_image_file_path is None:
+                image_file_name = f"{re.sub(r'[^A-Za-z0-9_.-]', '_', image_name)}.tar.{self.compression}"
+                if not self._export_the_image(image_name, self.bundleDirPath / image_file_name):
+                    return None
+                print(f"      - {image_name} exported")
+            return {"name": image_name, "digest": digest_by_image_name.get(image_name, None), "identifier": image_identifier,
+                    "file": image_file_name, "size": (self.bundleDirPath / image_file_name).stat().st_size}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.transferParallelism) as executor:
+            image_entries = list(executor.map(save_the_image, image_names))
+        if None in image_entries:
+            return False
+
+        # The archives of the images not used anymore are removed
+        for previous_entry in previous_entry_by_image_name.values():
+            if previous_entry["name"] not in image_names:
+                (self.bundleDirPath / previous_entry["file"]).unlink(missing_ok=True)
+
+        self.write_the_manifest({"images": image_entries})
+        return True
+
+    def write_the_manifest(self, manifest: dict) -> NoReturn:
+        # Written aside and renamed, so the manifest read by another deployer is always complete
+        temporary_file_path = self._get_the_temporary_file_path(self.bundleDirPath / self.manifestFileName)
+        with temporary_file_path.open("w") as manifest_file:
+            json.dump(manifest, manifest_file, indent=4)
+        temporary_file_path.replace(self.bundleDirPath / self.manifestFileName)
+
+    @staticmethod
+    def _get_the_temporary_file_path(file_path: Path) -> Path:
+        # Unique by process and thread, so the deployers and the threads writing the same file don't mix their writes
+        return file_path.with_name(f"{file_path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+
+    def load(self) -> bool:
+        """
+        Load, in parallel, the images of the bundle whose identifier is not present locally
+        """
+        image_entries = self.read_the_manifest().get("images", [])
+        if len(image_entries) == 0:
+            print(f"      ! No docker image in the bundle '{self.bundleDirPath}'")
+            return False
+
+        def load_the_image(image_entry: dict) -> bool:
+            if self.get_the_local_image_identifier(image_entry["name"]) == image_entry["identifier"]:
+                print(f"      - {image_entry['name']} is already present")
+                return True
+            if not self._import_the_image(self.bundleDirPath / image_entry["file"]):
+                print(f"      ! Load {image_entry['name']} failed")
+                return False
+            print(f"      - {image_entry['name']} loaded")
+            return True
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.transferParallelism) as executor:
+            return all(list(executor.map(load_the_image, image_entries)))
+
+    @classmethod
+    def _reuse_the_image_file(cls, reusable_image_file_path: Path, image_file_path: Path) -> bool:
+        # Linked or copied aside and renamed, the reused archive can be removed meanwhile by the eviction of its bundle
+        temporary_file_path = cls._get_the_temporary_file_path(image_file_path)
+        temporary_file_path.unlink(missing_ok=True)
+        try:
+            try:
+                os.link(str(reusable_image_file_path), str(temporary_file_path))
+            except OSError:
+                shutil.copy2(str(reusable_image_file_path), str(temporary_file_path))
+        except OSError as e:
+            print(f"      ! Reuse '{reusable_image_file_path}' failed: {e}")
+            temporary_file_path.unlink(missing_ok=True)
+            return False
+        temporary_file_path.replace(image_file_path)
+        return True
+
+    def _export_the_image(self, image_name: str, image_file_path: Path) -> bool:
+        # Written aside with a unique name, so an interrupted export doesn't leave an archive taken as complete
+        temporary_file_path = self._get_the_temporary_file_path(image_file_path)
+        with temporary_file_path.open("wb") as image_file:
+            save_process = subprocess.Popen(["docker", "save", image_name], stdout=subprocess.PIPE)
+            compressor_arguments = self._get_the_compressor_arguments(image_file_path.suffix[1:])
+            if compressor_arguments is not None:
+                compressor_process = subprocess.Popen(compressor_arguments, stdin=save_process.stdout, stdout=image_file)
+                save_process.stdout.close()
+                is_compressed = compressor_process.wait() == 0
+            else:
+                with self._open_the_python_compressed_stream(image_file, image_file_path.suffix[1:], "w") as compressed_stream:
+                    shutil.copyfileobj(save_process.stdout, compressed_stream, self.copyChunkSize)
+                is_compressed = True
+            is_saved = save_process.wait() == 0
+        if not is_saved or not is_compressed:
+            print(f"      ! Export {image_name} failed")
+            temporary_file_path.unlink(missing_ok=True)
+            return False
+        temporary_file_path.replace(image_file_path)
+        return True
+
+    def _import_the_image(self, image_file_path: Path) -> bool:
+        load_process = subprocess.Popen(["docker", "load", "-q"], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL)
+        decompressor_arguments = self._get_the_decompressor_arguments(image_file_path.suffix[1:])
+        if decompressor_arguments is not None:
+            with image_file_path.open("rb") as image_file:
+                is_decompressed = subprocess.run(decompressor_arguments, stdin=image_file, stdout=load_process.stdin).returncode == 0
+        else:
+            try:
+                with image_file_path.open("rb") as image_file, self._open_the_python_compressed_stream(image_file, image_file_path.suffix[1:], "r") as compressed_stream:
+                    shutil.copyfileobj(compressed_stream, load_process.stdin, self.copyChunkSize)
+                is_decompressed = True
+            except (OSError, EOFError) as e:
+                print(f"      ! Decompress '{image_file_path}' failed: {e}")
+                is_decompressed = False
+        load_process.stdin.close()
+        return load_process.wait() == 0 and is_decompressed
+
+    def _get_the_compressor_arguments(self, compression: str) -> Optional[List[str]]:
+        if compression == "zst" and shutil.which("zstd") is not None:
+            return ["zstd", "-q", "-c", "-T0", f"-{self.zstdCompressionLevel}"]
+        if compression == "gz" and shutil.which("pigz") is not None:
+            return ["pigz", "-c", f"-{self.gzipCompressionLevel}"]
+        return None
+
+    @staticmethod
+    def _get_the_decompressor_arguments(compression: str) -> Optional[List[str]]:
+        if compression == "zst" and shutil.which("zstd") is not None:
+            return ["zstd", "-q", "-d", "-c"]
+        if compression == "gz":
+            for gzip_command in ("pigz", "gzip"):
+                if shutil.which(gzip_command) is not None:
+                    return [gzip_command, "-d", "-c"]
+        return None
+
+    def _open_the_python_compressed_stream(self, file_object, compression: str, mode: str):
+        if compression == "zst":
+            import zstandard
+            if mode == "w":
+                return zstandard.ZstdCompressor(level=self.zstdCompressionLevel, threads=-1).stream_writer(file_object, closefd=False)
+            return zstandard.ZstdDecompressor().stream_reader(file_object, closefd=False)
+        import gzip
+        return gzip.GzipFile(fileobj=file_object, mode=f"{mode}b", compresslevel=self.gzipCompressionLevel)
+
+
+class DockerImageBundleCache:
+    cacheFolderEnvironmentVariableName = "PIL_DOCKER_IMAGES_BUNDLE_CACHE"
+    defaultMaxSizeInGb = 20
+
+    def __init__(self, cache_dir_path: Path = None, max_size_in_gb: float = None):
+        self.cacheDirPath = cache_dir_path or self.get_the_default_cache_dir_path()
+        self.maxSizeInBytes = int((max_size_in_gb if max_size_in_gb is not None else self.defaultMaxSizeInGb) * 1024 ** 3)
+
+    @classmethod
+    def get_the_default_cache_dir_path(cls) -> Path:
+        if os.environ.get(cls.cacheFolderEnvironmentVariableName, None):
+            return Path(os.environ[cls.cacheFolderEnvironmentVariableName])
+        return Path.home() / ".cache" / "gan-deployer" / "docker-images-bundles"
+
+    @staticmethod
+    def get_the_bundle_identity(image_digests: List[str]) -> str:
+        # The same images give the same identity, whatever their order, names or tags
+        return hashlib.sha256("\n".join(sorted(set(image_digests))).encode()).hexdigest()
+
+    def get_the_bundle_dir_path(self, bundle_identity: str) -> Path:
+        return self.cacheDirPath / f"pil-docker-images-{bundle_identity}"
+
+    def list_the_bundle_dir_paths(self) -> List[Path]:
+        if not self.cacheDirPath.is_dir():
+            return []
+        return [bundle_dir_path for bundle_dir_path in self.cacheDirPath.glob("pil-docker-images-*") if (bundle_dir_path / DockerImageBundle.manifestFileName).is_file()]
 
-    python_command_arguments = ["python", "-c", python_command_string]
+    def get_the_image_file_path_by_identifier(self) -> Dict[str, Path]:
+        """
+        Give the archive of each image present in a cached bundle, so another bundle reuses it instead of exporting it again
+        """
+        image_file_path_by_identifier = {}
+        for bundle_dir_path in self.list_the_bundle_dir_paths():
+            for image_entry in DockerImageBundle(bundle_dir_path).read_the_manifest().get("images", []):
+                image_file_path = bundle_dir_path / image_entry["file"]
+                if image_file_path.is_file():
+                    image_file_path_by_identifier.setdefault(image_entry["identifier"], image_file_path)
+        return image_file_path_by_identifier
+
+    def mark_the_bundle_as_used(self, bundle_dir_path: Path) -> NoReturn:
+        # The manifest modification time gives the last use of the bundle
+        os.utime(bundle_dir_path / DockerImageBundle.manifestFileName)
+
+    def evict_the_least_recently_used_bundles(self, kept_bundle_dir_path: Path = None) -> NoReturn:
+        # The archives shared by hardlinks are counted once, and only freed with the last bundle using them
+        file_size_by_inode = {}
+        inodes_by_bundle_dir_path = {}
+        last_use_by_bundle_dir_path = {}
+        for bundle_dir_path in self.list_the_bundle_dir_paths():
+            # The files removed meanwhile by another deployer are skipped
+            try:
+                last_use_by_bundle_dir_path[bundle_dir_path] = (bundle_dir_path / DockerImageBundle.manifestFileName).stat().st_mtime
+                file_paths = list(bundle_dir_path.iterdir())
+            except FileNotFoundError:
+                last_use_by_bundle_dir_path.pop(bundle_dir_path, None)
+                continue
+            inodes_by_bundle_dir_path[bundle_dir_path] = set()
+            for file_path in file_paths:
+                try:
+                    if not file_path.is_file():
+                        continue
+                    file_stat = file_path.stat()
+                except FileNotFoundError:
+                    continue
+                file_size_by_inode[(file_stat.st_dev, file_stat.st_ino)] = file_stat.st_size
+                inodes_by_bundle_dir_path[bundle_dir_path].add((file_stat.st_dev, file_stat.st_ino))
+        bundles_count_by_inode = collections.Counter(inode for inodes in inodes_by_bundle_dir_path.values() for inode in inodes)
 
-    if platform.system() == "Windows":
-        process = subprocess.Popen(python_command_arguments, cwd=current_working_directory.parent, creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP)
-    else:
-        process = subprocess.Popen(python_command_arguments, cwd=current_working_directory.parent, start_new_session=True)    # Try adding this in case of terminal problems: , stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+        cache_size = sum(file_size_by_inode[inode] for inode in bundles_count_by_inode)
+        for bundle_dir_path, _ in sorted(last_use_by_bundle_dir_path.items(), key=lambda item: item[1]):
+            if cache_size <= self.maxSizeInBytes:
+                break
+            if bundle_dir_path == kept_bundle_dir_path:
+                continue
+            bundle_size = sum(file_size_by_inode[inode] for inode in inodes_by_bundle_dir_path[bundle_dir_path] if bundles_count_by_inode[inode] == 1)
+            # A bundle being saved or loaded by another deployer is kept
+            docker_image_bundle = DockerImageBundle(bundle_dir_path)
+            if not docker_image_bundle.lock(is_blocking=False):
+                print(f"      - The docker images bundle '{bundle_dir_path.name}' is in use, so it is not evicted from the cache")
+                continue
+            try:
+                print(f"      - Evict the docker images bundle '{bundle_dir_path.name}' from the cache ({bundle_size // 1024 ** 2} MB freed)")
+                shutil.rmtree(bundle_dir_path, ignore_errors=True)
+            finally:
+                docker_image_bundle.unlock()
+            bundles_count_by_inode.subtract(inodes_by_bundle_dir_path[bundle_dir_path])
+            cache_size -= bundle_size
+
+
+class DockerComposeModel:
+    version = "2.2"
+    indentation = "    "
+
+    def __init__(self, file_path: Path, header_comment_lines: List[str] = None):
+        self.filePath = file_path
+        self.headerCommentLines = header_comment_lines or []
+        self.servicesByName = {}
+        self.networksByName = {}
+        self.volumesByName = {}
+
+    def add_service(self, service_name: str, service_dict: dict) -> dict:
+        if service_name in self.servicesByName:
+            raise UserWarning(f"The service '{service_name}' is already defined in the dockercompose file '{self.filePath.name}'")
+        self.servicesByName[service_name] = service_dict
+        return service_dict
+
+    def add_network(self, network_name: str, network_dict: dict) -> NoReturn:
+        self.networksByName[network_name] = network_dict
+
+    def add_volume(self, volume_name: str, volume_dict: dict = None) -> NoReturn:
+        self.volumesByName[volume_name] = volume_dict
+
+    def get_the_referenced_service_names_by_service_name(self) -> Dict[str, List[str]]:
+        """
+        Give the services each service depends on or shares the network of
+        """
+        referenced_service_names_by_service_name = {}
+        for service_name, service_dict in self.servicesByName.items():
+            referenced_service_names = list(service_dict.get("depends_on", {}).keys())
+            network_mode = service_dict.get("network_mode", "")
+            if network_mode.startswith("service:"):
+                referenced_service_names.append(network_mode[len("service:"):])
+            referenced_service_names_by_service_name[service_name] = referenced_service_names
+        return referenced_service_names_by_service_name
 
-    return process
+    @staticmethod
+    def get_the_startup_stages(referenced_service_names_by_service_name: Dict[str, List[str]]) -> List[List[str]]:
+        """
+        Give the services grouped by stage of the dependency graph, each service being in the stage following the last of its referenced services
+        """
+        stage_index_by_service_name = {}
+        remaining_service_names = sorted(referenced_service_names_by_service_name)
+        while len(remaining_service_names) > 0:
+            startable_service_names = [service_name for service_name in remaining_service_names
+                                       if all(referenced_service_name in stage_index_by_service_name
+                                              for referenced_service_name in referenced_service_names_by_service_name[service_name])]
+            if len(startable_service_names) == 0:
+                raise UserWarning(f"The services {remaining_service_names} have cyclic dependencies")
+            for service_name in startable_service_names:
+                stage_index_by_service_name[service_name] = 1 + max([stage_index_by_service_name[referenced_service_name]
+                                                                     for referenced_service_name in referenced_service_names_by_service_name[service_name]], default=-1)
+            remaining_service_names = [service_name for service_name in remaining_service_names if service_name not in stage_index_by_service_name]
+
+        startup_stages = [[] for _ in range(1 + max(stage_index_by_service_name.values(), default=-1))]
+        for service_name, stage_index in stage_index_by_service_name.items():
+            startup_stages[stage_index].append(service_name)
+        return startup_stages
+
+    def get_the_content(self) -> str:
+        lines = [f"# {header_comment_line}" for header_comment_line in self.headerCommentLines]
+        if len(lines) > 0:
+            lines.append("")
+        lines.append(f"version: {json.dumps(self.version)}")
+        for section_name, section_dict in (("services", self.servicesByName), ("volumes", self.volumesByName), ("networks", self.networksByName)):
+            if len(section_dict) == 0:
+                continue
+            lines.append(f"{section_name}:")
+            for name, value in section_dict.items():
+                self._append_the_value_lines(lines, name, value, 1)
+                # The services are separated by an empty line, the other sections only end by one
+                if section_name == "services":
+                    lines.append("")
+            if section_name != "services":
+                lines.append("")
+        return "".join([f"{line}\n" for line in lines])
+
+    def write(self) -> NoReturn:
+        try:
+            with self.filePath.open("w", newline="\n") as target:
+                target.write(self.get_the_content())
+        except (OSError, TypeError, ValueError) as e:
+            raise UserWarning(f"Write '{self.filePath}' file failed: {e}")
+
+    @classmethod
+    def _append_the_value_lines(cls, lines: List[str], key: str, value: Any, depth: int) -> NoReturn:
+        indentation = cls.indentation * depth
+        if isinstance(value, dict):
+            lines.append(f"{indentation}{key}:")
+            for child_key, child_value in value.items():
+                cls._append_the_value_lines(lines, child_key, child_value, depth + 1)
+        elif isinstance(value, list):
+            lines.append(f"{indentation}{key}:")
+            for item in value:
+                if isinstance(item, dict):
+                    # The item keys are aligned after the "- " of the first one
+                    item_lines = []
+                    for item_key, item_value in item.items():
+                        cls._append_the_value_lines(item_lines, item_key, item_value, depth + 1)
+                    item_lines = [f"  {item_line}" for item_line in item_lines]
+                    item_lines[0] = f"{indentation}{cls.indentation}- {item_lines[0].lstrip()}"
+                    lines += item_lines
+                else:
+                    lines.append(f"{indentation}{cls.indentation}- {cls._get_the_scalar_text(item)}")
+        elif value is None:
+            lines.append(f"{indentation}{key}:")
+        else:
+            lines.append(f"{indentation}{key}: {cls._get_the_scalar_text(value)}")
+
+    @staticmethod
+    def _get_the_scalar_text(value: Any) -> str:
+        # A JSON scalar is a valid YAML flow scalar, and the strings are always quoted so "true", "8080" or "a: b" keep their type
+        if isinstance(value, bool) or isinstance(value, (int, float)):
+            return json.dumps(value)
+        return json.dumps(str(value))
 
 
 class DictPath:
@@ -1171,12 +2828,17 @@ class DeploymentDescriptionDeployer(DeploymentDescriptionParser):
     runningDeploymentStatusKey = "deploymentRunningStatus"
     isDeployedKey = "isDeployed"
     isGanComponentsRunningKey = "isGanComponentsRunning"
+    ganComponentsStartTimeKey = "ganComponentsStartTime"
+    runningDeploymentIndexJsonFileName = "running-deployment-index.json"
+    # The running status values only used by the deployer itself, not copied into the index and so not printed by the status
+    internalRunningStatusNames = []
 
     def __init__(self, deployment_folder_path: Path):
         DeploymentDescriptionParser.__init__(self)
 
         self.deploymentDirPath = deployment_folder_path
         self.runningDeploymentDescriptionJsonFile = self.deploymentDirPath / self.runningDeploymentDescriptionJsonFileName
+        self.runningDeploymentIndexJsonFile = self.deploymentDirPath / self.runningDeploymentIndexJsonFileName
 
     def _parse_the_deployment_description_json_file(self, deployment_description_json_file_path) -> NoReturn:
         self._deployment_dict = self._get_dict_from_json_file(deployment_description_json_file_path)
@@ -1300,6 +2962,11 @@ class DeploymentDescriptionDeployer(DeploymentDescriptionParser):
         self._set_running_status_to_running_deployment_dict(self.isDeployedKey, status_value)
 
     def _set_gan_components_running_status(self, status_value: bool) -> NoReturn:
+        running_status_dict = self._deployment_dict.setdefault(self.runningDeploymentStatusKey, {})
+        if not status_value:
+            running_status_dict.pop(self.ganComponentsStartTimeKey, None)
+        elif not running_status_dict.get(self.isGanComponentsRunningKey, False):
+            running_status_dict[self.ganComponentsStartTimeKey] = time.time()
         self._set_running_status_to_running_deployment_dict(self.isGanComponentsRunningKey, status_value)
 
     def _parse_the_running_deployment_dict(self) -> NoReturn:
@@ -1315,11 +2982,131 @@ class DeploymentDescriptionDeployer(DeploymentDescriptionParser):
 
     def _write_the_running_deployment_dict_to_json_file(self) -> NoReturn:
         self._write_dict_to_json_file(self._deployment_dict, self.runningDeploymentDescriptionJsonFile)
+        self._write_dict_to_json_file(self._build_the_running_deployment_index(self._deployment_dict), self.runningDeploymentIndexJsonFile)
 
     def _set_running_status_to_running_deployment_dict(self, running_status_name: str, running_status_value: Any) -> NoReturn:
         self._deployment_dict.setdefault(self.runningDeploymentStatusKey, {})[running_status_name] = running_status_value
         self._write_the_running_deployment_dict_to_json_file()
 
+    def _build_the_running_deployment_index(self, deployment_dict: dict) -> dict:
+        """
+        Build a flat index of the nodes, groups, components and databases of the running deployment,
+        so the status can be read without a full description parse.
+        """
+        running_deployment_index = {
+            self.runningDeploymentStatusKey: self._get_the_indexed_running_status(deployment_dict.get(self.runningDeploymentStatusKey, {})),
+            "components": [],
+            "databases": [],
+        }
+
+        def index_the_dict(value: dict, nodes_names: List[str], groups_names: List[str], parent_key: Optional[str]) -> NoReturn:
+            for key, sub_value in value.items():
+                if not isinstance(sub_value, dict):
+                    continue
+                if parent_key == self.key_words["label_of_a_component_dictionary"]:
+                    component_index_entry = {
+                        "node": "/".join(nodes_names),
+                        "group": "/".join(groups_names),
+                        "component": key,
+                        "componentName": sub_value.get(self.key_words["label_of_the_component_name"], None),
+                        "deploymentPath": "/".join(nodes_names + groups_names + [key]),
+                    }
+                    component_index_entry.update(self._get_the_component_index_entry_details(groups_names, key, sub_value))
+                    running_deployment_index["components"].append(component_index_entry)
+                elif key == self.key_words["label_of_a_database_dictionary"]:
+                    running_deployment_index["databases"].append({
+                        "node": "/".join(nodes_names),
+                        "group": "/".join(groups_names),
+                        "host": sub_value.get(self.key_words["label_of_the_database_host"], None),
+                        "port": sub_value.get(self.key_words["label_of_the_database_port"], None),
+                    })
+                elif key in (self.key_words["label_of_a_node_dictionary"], self.key_words["label_of_a_component_dictionary"]):
+                    index_the_dict(sub_value, nodes_names, groups_names, key)
+                elif key.startswith(self.key_words["label_of_a_components_group"]):
+                    index_the_dict(sub_value, nodes_names, groups_names + [self._get_group_name_from_definition_key(key)], key)
+                elif parent_key == self.key_words["label_of_a_node_dictionary"]:
+                    index_the_dict(sub_value, nodes_names + [key], groups_names, key)
+
+        index_the_dict(deployment_dict, [], [], None)
+        return running_deployment_index
+
+    def _get_the_component_index_entry_details(self, groups_names: List[str], component_description_name: str, component_description_dict: dict) -> dict:
+        return {}
+
+    def _get_the_indexed_running_status(self, running_status_dict: dict) -> dict:
+        return {running_status_name: running_status_value for running_status_name, running_status_value in running_status_dict.items()
+                if running_status_name not in self.internalRunningStatusNames}
+
+    def get_the_running_deployment_status(self) -> Optional[dict]:
+        if self.runningDeploymentIndexJsonFile.exists():
+            try:
+                with self.runningDeploymentIndexJsonFile.open("r") as index_json_file:
+                    running_deployment_index = json.load(index_json_file)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f" ! Load the running deployment index '{self.runningDeploymentIndexJsonFile}' failed: {e}")
+                return None
+        elif self.runningDeploymentDescriptionJsonFile.exists():
+            # Deployment made before the index existence, so build it once
+            self._deployment_dict = self._get_dict_from_json_file(self.runningDeploymentDescriptionJsonFile)
+            running_deployment_index = self._build_the_running_deployment_index(self._deployment_dict)
+            self._write_dict_to_json_file(running_deployment_index, self.runningDeploymentIndexJsonFile)
+            self._deployment_dict = None
+        else:
+            return None
+
+        now = time.time()
+        # An index written before the internal running status values were left out still has them
+        running_status_dict = self._get_the_indexed_running_status(running_deployment_index.get(self.runningDeploymentStatusKey, {}))
+        running_deployment_index[self.runningDeploymentStatusKey] = running_status_dict
+        is_gan_components_running = running_status_dict.get(self.isGanComponentsRunningKey, False)
+        gan_components_start_time = running_status_dict.get(self.ganComponentsStartTimeKey, None)
+        for component_index_entry in running_deployment_index["components"]:
+            component_index_entry.setdefault("isRunning", is_gan_components_running)
+            start_time = component_index_entry.get("startTime", None) or gan_components_start_time
+            if component_index_entry["isRunning"] and start_time is not None:
+                component_index_entry["uptimeInSeconds"] = round(now - start_time, 1)
+            else:
+                component_index_entry["uptimeInSeconds"] = None
+
+        return running_deployment_index
+
+    def print_the_running_deployment_status(self, as_json: bool = False) -> bool:
+        running_deployment_status = self.get_the_running_deployment_status()
+        if running_deployment_status is None:
+            if as_json:
+                print(json.dumps(None))
+            else:
+                print(f" - No deployment in the folder '{self.deploymentDirPath}'")
+            return False
+
+        if as_json:
+            print(json.dumps(running_deployment_status, indent=4))
+            return True
+
+        def format_uptime(uptime_in_seconds: Optional[float]) -> str:
+            if uptime_in_seconds is None:
+                return "-"
+            minutes, seconds = divmod(int(uptime_in_seconds), 60)
+            hours, minutes = divmod(minutes, 60)
+            return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+        def print_table(header: List[str], rows: List[List[str]]) -> NoReturn:
+            column_widths = [max([len(header[i])] + [len(row[i]) for row in rows]) for i in range(len(header))]
+            print("  ".join(header[i].ljust(column_widths[i]) for i in range(len(header))))
+            for row in rows:
+                print("  ".join(row[i].ljust(column_widths[i]) for i in range(len(header))))
+
+        print(f"Running status: {json.dumps(running_deployment_status.get(self.runningDeploymentStatusKey, {}))}")
+        print("")
+        print_table(["NODE", "GROUP", "COMPONENT", "STATE", "PID", "UPTIME"],
+                    [[entry["node"], entry["group"], entry["component"], "running" if entry["isRunning"] else "stopped",
+                      str(entry.get("pid", None) or "-"), format_uptime(entry["uptimeInSeconds"])] for entry in running_deployment_status["components"]])
+        if len(running_deployment_status["databases"]) > 0:
+            print("")
+            print_table(["NODE", "GROUP", "DATABASE HOST", "DATABASE PORT"],
+                        [[entry["node"], entry["group"], str(entry["host"]), str(entry["port"])] for entry in running_deployment_status["databases"]])
+        return True
+
     def _get_running_status_from_running_deployment_dict(self, running_status_name: str, default_value=None) -> Optional[Any]:
         if self._deployment_dict is not None:
             return self._deployment_dict.get(self.runningDeploymentStatusKey, {}).get(running_status_name, default_value)
@@ -1341,6 +3128,8 @@ class PelDeploymentDescriptionParser(DeploymentDescriptionDeployer):
     runningDeploymentOriginalDatabasesRootFolderName = "pg-data-root-original"
     runningDeploymentLogFolderName = "logs"
     componentEquinoxShPid = "equinox-sh-pid"
+    componentEquinoxShPidStartIdentity = "equinox-sh-pid-start-identity"
+    componentStartTime = "componentStartTime"
     isComponentRunning = "isComponentRunning"
     launcherShLogFileName = "launcher-sh.log"
     equinoxShLogFileName = "equinox-sh.log"
@@ -1359,9 +3148,18 @@ class PelDeploymentDescriptionParser(DeploymentDescriptionDeployer):
         self.databasesDirPath = self.pelDirPath / self.runningDeploymentDatabasesRootFolderName
         self.originalDatabasesDirPath = self.pelDirPath / self.runningDeploymentOriginalDatabasesRootFolderName
         self.logDirPath = self.pelDirPath / self.runningDeploymentLogFolderName
+        self.logArchivesDirPath = self.pelDirPath / LogArchiver.archivesFolderName
+        self.processSupervisorClient = ProcessSupervisorClient(self.pelDirPath)
 
         self._deployment_dict = None
 
+    def _get_the_component_index_entry_details(self, groups_names: List[str], component_description_name: str, component_description_dict: dict) -> dict:
+        return {
+            "isRunning": component_description_dict.get(self.isComponentRunning, False),
+            "pid": component_description_dict.get(self.componentEquinoxShPid, None),
+            "startTime": component_description_dict.get(self.componentStartTime, None),
+        }
+
     def is_gan_components_single_dsl_deployed(self) -> bool:
         return self._get_running_status_from_running_deployment_dict(self.isSingleDslDeployedKey, default_value=False)
 
@@ -1533,13 +3331,26 @@ class PelDeployer(PelDeploymentDescriptionParser):
         else:
             self._set_gan_components_running_status(True)
 
-            print(f"                     - Detach process...")
-            process = run_detach_subprocess(log_file_path, command_arguments, environment_variables=subprocess_environment_variables, current_working_directory=component_equinox_destination_file_path.parent)
+            if ProcessSupervisor.is_available():
+                print(f"                     - Start the process through the deployment process supervisor...")
+                process_pid = self.processSupervisorClient.start_process(component_deployment_name, log_file_path, command_arguments,
+                                                                         environment_variables=subprocess_environment_variables,
+                                                                         current_working_directory=component_equinox_destination_file_path.parent)
+                if process_pid is None:
+                    raise UserWarning(f"The '{component_deployment_name}' component start through the process supervisor failed")
+                print(f"                     - Supervised process pid: {process_pid}")
+            else:
+                print(f"                     - Detach process...")
+                process_pid = run_detach_subprocess(log_file_path, command_arguments, environment_variables=subprocess_environment_variables, current_working_directory=component_equinox_destination_file_path.parent).pid
+                print(f"                     - Detach process pid: {process_pid}")
 
-            print(f"                     - Detach process pid: {process.pid}")
-            path_based_dict.set_the_value_pointed_by_a_dict_path(process.pid, dict_path.get_the_path_to_a_following_step(self.componentEquinoxShPid))
+            path_based_dict.set_the_value_pointed_by_a_dict_path(process_pid, dict_path.get_the_path_to_a_following_step(self.componentEquinoxShPid))
+            process_start_identity = ProcessLivenessProbe.get_the_process_start_identity(process_pid)
+            if process_start_identity is not None:
+                path_based_dict.set_the_value_pointed_by_a_dict_path(process_start_identity, dict_path.get_the_path_to_a_following_step(self.componentEquinoxShPidStartIdentity))
 
             path_based_dict.set_the_value_pointed_by_a_dict_path(True, dict_path.get_the_path_to_a_following_step(self.isComponentRunning))
+            path_based_dict.set_the_value_pointed_by_a_dict_path(time.time(), dict_path.get_the_path_to_a_following_step(self.componentStartTime))
 
     @staticmethod
     def _get_component_associated_tgz_name(component_name: str, gan_version: str, gan_project_name) -> str:
@@ -1553,12 +3364,20 @@ class PelRunning(PelDeploymentDescriptionParser):
         self._singleDslPel = SingleDslPel(deployment_folder_path)
         self._actionToBePerformed = None
         self._runningComponentsCount = None
+        self._componentsToStop = []
+        self._componentsToProbe = []
+        self.stopTimeoutInSeconds = ProcessGroupStopper.gracefulStopTimeoutInSeconds
+        self.stopParallelism = 8
 
     def start(self, component_deployment_path: str = None) -> NoReturn:
         if not self.is_gan_components_deployed():
             print(" - The gan components are not deployed")
             return
 
+        # The stored running status can be wrong after a crash or a reboot
+        if not self.is_single_dsl_gan_components_running():
+            self.reconcile_the_components_running_status()
+
         if component_deployment_path is not None:
             if self.is_single_dsl_gan_components_running():
                 print(" - Not available while a single DSL deployment is running")
@@ -1607,6 +3426,84 @@ class PelRunning(PelDeploymentDescriptionParser):
                 self._perform_the_action("stop")
                 self._set_gan_components_running_status(False)
 
+            if ProcessSupervisor.is_available() and self.processSupervisorClient.shutdown_the_supervisor(if_idle=True):
+                print(" - The process supervisor is stopped")
+
+    def probe_the_components_liveness(self) -> List[dict]:
+        self._componentsToProbe = []
+        self._actionToBePerformed = "probeLiveness"
+        self._parse_the_running_deployment_dict()
+
+        if len(self._componentsToProbe) == 0:
+            return []
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(self._componentsToProbe), 32)) as executor:
+            return list(executor.map(lambda component_to_probe: self._probe_one_component(*component_to_probe[1:]), self._componentsToProbe))
+
+    def reconcile_the_components_running_status(self) -> List[dict]:
+        print(f" - Probe the components liveness and reconcile the running status")
+        probe_results = self.probe_the_components_liveness()
+        path_based_dict = PathBasedDictionary(self._deployment_dict)
+
+        is_some_component_alive = False
+        for (dict_path, _, _, _, _, _), probe_result in zip(self._componentsToProbe, probe_results):
+            if probe_result["isAlive"] is None:
+                is_some_component_alive |= probe_result["isRunningAsStored"]
+                continue
+
+            is_some_component_alive |= probe_result["isAlive"]
+            if probe_result["isAlive"] != probe_result["isRunningAsStored"]:
+                print(f"     - The component '{probe_result['name']}' is stored as {'running' if probe_result['isRunningAsStored'] else 'stopped'}"
+                      f" but it is {'alive' if probe_result['isAlive'] else 'not alive'}, so the running status is updated")
+                path_based_dict.set_the_value_pointed_by_a_dict_path(probe_result["isAlive"], dict_path.get_the_path_to_a_following_step(self.isComponentRunning))
+
+            if not probe_result["isAlive"]:
+                path_based_dict.delete_the_last_key_given_by_a_dict_path(dict_path.get_the_path_to_a_following_step(self.componentStartTime))
+            if not probe_result["isAlive"] and probe_result["pid"] is not None:
+                path_based_dict.delete_the_last_key_given_by_a_dict_path(dict_path.get_the_path_to_a_following_step(self.componentEquinoxShPid))
+                path_based_dict.delete_the_last_key_given_by_a_dict_path(dict_path.get_the_path_to_a_following_step(self.componentEquinoxShPidStartIdentity))
+
+        if len(probe_results) > 0:
+            self._set_running_status_to_running_deployment_dict(self.isGanComponentsRunningKey, is_some_component_alive)
+
+        self._componentsToProbe = []
+        self._deployment_dict = None
+        return probe_results
+
+    def _get_the_listen_port_environment_variable_names(self) -> List[str]:
+        return self._deployment_dict.get(self.key_words["label_of_a_pel_section"], {}).get("livenessProbe", {}).get("listenPortEnvironmentVariableNames", [])
+
+    def _get_the_component_listen_address(self, dict_path: DictPath, path_based_dict: PathBasedDictionary) -> Optional[Tuple[str, int]]:
+        component_environment_variables_by_name = self._get_the_component_environments_variables(dict_path, path_based_dict)
+        for listen_port_environment_variable_name in self._get_the_listen_port_environment_variable_names():
+            if listen_port_environment_variable_name in component_environment_variables_by_name:
+                return component_environment_variables_by_name.get("host", "127.0.0.1"), component_environment_variables_by_name[listen_port_environment_variable_name]
+        return None
+
+    def _probe_one_component(self, component_deployment_name: str, is_running_as_stored: bool, component_pid: Optional[int],
+                             component_pid_start_identity: Optional[str], component_listen_address: Optional[Tuple[str, int]]) -> dict:
+        is_process_alive = None
+        if component_pid is not None:
+            is_process_alive = ProcessLivenessProbe.is_process_alive(component_pid, component_pid_start_identity)
+            if not is_process_alive and platform.system() != "Windows":
+                # The recorded pid is a process group leader, its children can still be alive
+                is_process_alive = ProcessLivenessProbe.get_the_process_start_identity(component_pid) is None and ProcessGroupStopper.is_process_group_alive(component_pid, component_pid)
+
+        is_port_listening = None
+        if component_listen_address is not None:
+            is_port_listening = ProcessLivenessProbe.is_port_listening(*component_listen_address)
+
+        is_alive = is_process_alive if is_process_alive is not None else is_port_listening
+
+        return {
+            "name": component_deployment_name,
+            "pid": component_pid,
+            "isRunningAsStored": is_running_as_stored,
+            "isProcessAlive": is_process_alive,
+            "isPortListening": is_port_listening,
+            "isAlive": is_alive,
+        }
+
     def _count_the_running_components(self) -> int:
         self._runningComponentsCount = 0
         self._actionToBePerformed = "countRunning"
@@ -1621,12 +3518,15 @@ class PelRunning(PelDeploymentDescriptionParser):
 
     def _perform_the_action(self, action: str) -> NoReturn:
         self._actionToBePerformed = action
+        self._componentsToStop = []
 
         self._parse_the_running_deployment_dict()
+        self._stop_the_collected_components(PathBasedDictionary(self._deployment_dict))
         self._write_the_running_deployment_dict_to_json_file()
 
     def _perform_the_action_on_one_component(self, component_deployment_path: str, action: str) -> NoReturn:
         self._actionToBePerformed = action
+        self._componentsToStop = []
 
         if not self.logDirPath.exists():
             self.logDirPath.mkdir(parents=True, exist_ok=True)
@@ -1642,8 +3542,77 @@ class PelRunning(PelDeploymentDescriptionParser):
             return
 
         self._component_deployment_starting(dict_path, path_base_dict)
+        self._stop_the_collected_components(path_base_dict)
         self._write_the_running_deployment_dict_to_json_file()
 
+    def _stop_the_collected_components(self, path_based_dict: PathBasedDictionary) -> NoReturn:
+        if len(self._componentsToStop) == 0:
+            return
+
+        print(f" - Stop {len(self._componentsToStop)} components with a parallelism of {self.stopParallelism} and a timeout of {self.stopTimeoutInSeconds}s")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, self.stopParallelism)) as executor:
+            stop_results = list(executor.map(lambda component_to_stop: self._stop_one_component(*component_to_stop), self._componentsToStop))
+
+        # The logs of all the stopped components go into one archive of this stop session
+        print(f" - Archive the components logs into '{self.logArchivesDirPath}' and copy them into '{self.logDirPath}'")
+        log_archiver = LogArchiver(self.logArchivesDirPath)
+        for dict_path, _, component_deployment_path, _, _, _, _ in self._componentsToStop:
+            component_log_dir_path = self._get_the_component_log_file_path(dict_path)
+            log_archiver.add_the_folder(component_deployment_path / "logs", (component_log_dir_path.relative_to(self.logDirPath) / "logs").as_posix(), copy_dir_path=component_log_dir_path)
+        log_archiver.write_the_session_archive()
+        LogIndex(self.pelDirPath).update()
+
+        print(f" - Components stop durations:")
+        for (dict_path, component_deployment_name, _, _, component_equinox_sh_pid, _, _), (is_stopped, is_killed, stop_duration) in zip(self._componentsToStop, stop_results):
+            stop_status = "killed" if is_killed else ("stopped" if is_stopped else "NOT stopped")
+            print(f"     - '{component_deployment_name}' {stop_status} in {stop_duration:.1f}s")
+
+            if is_stopped:
+                path_based_dict.set_the_value_pointed_by_a_dict_path(False, dict_path.get_the_path_to_a_following_step(self.isComponentRunning))
+                path_based_dict.delete_the_last_key_given_by_a_dict_path(dict_path.get_the_path_to_a_following_step(self.componentStartTime))
+            if is_stopped and component_equinox_sh_pid is not None:
+                path_based_dict.delete_the_last_key_given_by_a_dict_path(dict_path.get_the_path_to_a_following_step(self.componentEquinoxShPid))
+                path_based_dict.delete_the_last_key_given_by_a_dict_path(dict_path.get_the_path_to_a_following_step(self.componentEquinoxShPidStartIdentity))
+
+        self._componentsToStop = []
+
+    def _stop_one_component(self, dict_path: DictPath, component_deployment_name: str, component_deployment_path: Path,
+                            subprocess_environment_variables: dict, component_equinox_sh_pid: Optional[int],
+                            component_equinox_sh_pid_start_identity: Optional[str] = None, component_listen_address: Optional[Tuple[str, int]] = None) -> Tuple[bool, bool, float]:
+        stop_start_time = time.monotonic()
+        component_launcher_file_path = component_deployment_path / "launcher.sh"
+
+        print(f"     - Stop the component '{component_deployment_name}', so run this script file '{component_launcher_file_path.name} stop'")
+        command_arguments = ["./" + component_launcher_file_path.name, "stop"]
+        command_arguments = adapt_the_command_arguments_when_using_bash_on_windows(command_arguments)
+
+        log_file_path = self._get_the_component_log_file_path(dict_path) / f"stop-{self.launcherShLogFileName}"
+        log_file_path.parent.mkdir(parents=True, exist_ok=True)
+        complete_process = run_subprocess(log_file_path, command_arguments, environment_variables=subprocess_environment_variables, current_working_directory=component_launcher_file_path.parent)
+        is_stopped = complete_process.returncode == 0
+        if not is_stopped:
+            print(f"        ! Stop the component '{component_deployment_name}' failed")
+
+        is_killed = False
+        if component_equinox_sh_pid is not None and not ProcessLivenessProbe.is_process_alive(component_equinox_sh_pid, component_equinox_sh_pid_start_identity):
+            # After a reboot or a pid reuse, the recorded pid is not the started equinox.sh process any more, so its group is not signaled,
+            # the component can still run from another process, so a failed stop is only taken as done when its listen port is closed
+            print(f"     - The '{component_deployment_name}' component equinox.sh process of pid {component_equinox_sh_pid} is not running any more")
+            if not is_stopped and component_listen_address is not None and not ProcessLivenessProbe.is_port_listening(*component_listen_address):
+                print(f"     - The '{component_deployment_name}' component listen port {component_listen_address[1]} is closed, so it is stopped")
+                is_stopped = True
+        elif component_equinox_sh_pid is not None:
+            print(f"     - Stop the '{component_deployment_name}' component equinox.sh process group of pid {component_equinox_sh_pid}")
+            if platform.system() == "Windows":
+                log_file_path = self._get_the_component_log_file_path(dict_path) / self.killEquinoxShLogFileName
+                log_file_path.parent.mkdir(parents=True, exist_ok=True)
+                run_subprocess(log_file_path, ['taskkill', '/F', '/T', '/PID', str(component_equinox_sh_pid)])
+                is_stopped, is_killed = True, True
+            else:
+                is_stopped, is_killed = ProcessGroupStopper.stop_the_process_group(component_equinox_sh_pid, self.stopTimeoutInSeconds)
+
+        return is_stopped, is_killed, time.monotonic() - stop_start_time
+
     def _component_group_database_deployment(self, dict_path: DictPath, path_based_dict: PathBasedDictionary) -> NoReturn:
         if self._actionToBePerformed == "start-databases":
             database_dir_path, _, database_port = self._get_database_folder_path_host_and_port_from_description_dict_path(dict_path, path_based_dict)
@@ -1664,10 +3633,18 @@ class PelRunning(PelDeploymentDescriptionParser):
 
     # noinspection PyUnusedLocal
     def _component_deployment_starting(self, dict_path: DictPath, path_based_dict: PathBasedDictionary) -> NoReturn:
-        if self._actionToBePerformed not in ("start", "stop", "countRunning", "getComponentsPath"):
+        if self._actionToBePerformed not in ("start", "stop", "countRunning", "getComponentsPath", "probeLiveness"):
             return
 
         component_deployment_name, component_deployment_path = self._get_the_component_deployment_name_and_path(dict_path)
+
+        if self._actionToBePerformed == "probeLiveness":
+            component_description_dict = path_based_dict.get_the_value_pointed_by_a_dict_path(dict_path)
+            self._componentsToProbe.append((dict_path, component_deployment_name, component_description_dict.get(self.isComponentRunning, False),
+                                            component_description_dict.get(self.componentEquinoxShPid, None),
+                                            component_description_dict.get(self.componentEquinoxShPidStartIdentity, None),
+                                            self._get_the_component_listen_address(dict_path, path_based_dict)))
+            return
         subprocess_environment_variables = self._get_the_component_environments_variables_for_subprocess(dict_path, path_based_dict)
 
         is_component_running_dict_path = dict_path.get_the_path_to_a_following_step(self.isComponentRunning)
@@ -1688,12 +3665,19 @@ class PelRunning(PelDeploymentDescriptionParser):
 
         component_equinox_sh_pid_dict_path = dict_path.get_the_path_to_a_following_step(self.componentEquinoxShPid)
         component_equinox_sh_pid = path_based_dict.get_the_value_pointed_by_a_dict_path(component_equinox_sh_pid_dict_path, default_value=None)
+        component_equinox_sh_pid_start_identity = path_based_dict.get_the_value_pointed_by_a_dict_path(dict_path.get_the_path_to_a_following_step(self.componentEquinoxShPidStartIdentity), default_value=None)
         component_launcher_file_path = component_deployment_path / "launcher.sh"
 
         if self._actionToBePerformed == "getComponentsPath":
             self._componentsPathInDescriptionOrder.append(component_deployment_path)
             return
 
+        if self._actionToBePerformed == "stop":
+            # The stops are done in parallel once all the components to stop are collected
+            self._componentsToStop.append((dict_path, component_deployment_name, component_deployment_path, subprocess_environment_variables, component_equinox_sh_pid,
+                                           component_equinox_sh_pid_start_identity, self._get_the_component_listen_address(dict_path, path_based_dict)))
+            return
+
         print(f"     - {self._actionToBePerformed.capitalize()} the component '{component_deployment_name}', so run this script file '{component_launcher_file_path.name} {self._actionToBePerformed}'")
         command_arguments = ["./" + component_launcher_file_path.name, self._actionToBePerformed]
         command_arguments = adapt_the_command_arguments_when_using_bash_on_windows(command_arguments)
@@ -1705,26 +3689,11 @@ class PelRunning(PelDeploymentDescriptionParser):
             print(f"        ! {self._actionToBePerformed.capitalize()} the component '{component_deployment_name}' failed")
         else:
             path_based_dict.set_the_value_pointed_by_a_dict_path(self._actionToBePerformed == "start", dict_path.get_the_path_to_a_following_step(self.isComponentRunning))
+            path_based_dict.set_the_value_pointed_by_a_dict_path(time.time(), dict_path.get_the_path_to_a_following_step(self.componentStartTime))
 
-        if self._actionToBePerformed == "stop":
-            if component_equinox_sh_pid is not None:
-                print(f"     - Kill the '{dict_path}' component equinox.sh process pid {component_equinox_sh_pid}")
-                if platform.system() == "Windows":
-                    # # os.kill(component_equinox_sh_pid, signal.SIGTERM)
-                    log_file_path = self._get_the_component_log_file_path(dict_path) / self.killEquinoxShLogFileName
-                    log_file_path.parent.mkdir(parents=True, exist_ok=True)
-                    run_subprocess(log_file_path, ['taskkill', '/F', '/T', '/PID', str(component_equinox_sh_pid)])
-                else:
-                    os.kill(component_equinox_sh_pid, signal.SIGTERM)
-                path_based_dict.delete_the_last_key_given_by_a_dict_path(component_equinox_sh_pid_dict_path)
-
-            if (component_deployment_path / "logs").exists():
-                log_file_dir_path = self._get_the_component_log_file_path(dict_path)
-                log_file_dir_path.parent.mkdir(parents=True, exist_ok=True)
-                print(f"     - Copy the '{component_deployment_name}' component logs to '{log_file_dir_path.relative_to(self.logDirPath)}'")
-                copy_tree(str(component_deployment_path / "logs"), str(log_file_dir_path), preserve_mode=True)
-
-    def build_single_dsl_pel(self, dsl_log_xml_trace_level: str = "DEBUG", dsl_log_xml_max_log_file_size: int = 10240000):
+    def build_single_dsl_pel(self, dsl_log_xml_trace_level: str = "DEBUG", dsl_log_xml_max_log_file_size: int = 10240000, merge_mode: str = FileLinker.linkMergeMode,
+                             check_resources_conflicts: bool = False, analyze_jar_conflicts: bool = False, force_full_rebuild: bool = False,
+                             log_xml_options: dict = None):
         if not self.is_gan_components_deployed():
             print(" - The gan components are not deployed")
             return
@@ -1736,10 +3705,14 @@ class PelRunning(PelDeploymentDescriptionParser):
         ordered_dsl_paths = self._get_components_path_in_description_order()
 
         self._read_the_running_deployment_dict()
-        self._singleDslPel.build_single_dsl_pel_deployment(dsl_log_xml_trace_level, dsl_log_xml_max_log_file_size, ordered_dsl_paths)
+        self._singleDslPel.isResourcesContentConflictCheckEnabled = check_resources_conflicts
+        self._singleDslPel.isJarConflictsAnalysisEnabled = analyze_jar_conflicts
+        packing_settings = self._deployment_dict.get(self.key_words["label_of_a_pel_section"], {}).get("singleDsl", {})
+        self._singleDslPel.build_single_dsl_pel_deployment(dsl_log_xml_trace_level, dsl_log_xml_max_log_file_size, ordered_dsl_paths, merge_mode, force_full_rebuild,
+                                                           packing_settings, log_xml_options)
         self._set_single_dsl_deployed_status(True)
 
-    def start_single_dsl_pel(self):
+    def start_single_dsl_pel(self, start_timeout_in_seconds: float = None):
         if not self.is_gan_components_single_dsl_deployed():
             print(" - The gan components are not deployed as single DSL")
             return
@@ -1756,6 +3729,8 @@ class PelRunning(PelDeploymentDescriptionParser):
             print(" - Gan components are already running")
         else:
             self._read_the_running_deployment_dict()
+            if start_timeout_in_seconds is not None:
+                self._singleDslPel.startTimeoutInSeconds = start_timeout_in_seconds
             self._singleDslPel.start_single_dsl()
             self._set_gan_components_running_status(True)
             self._set_single_dsl_gan_components_running_status(True)
@@ -1779,6 +3754,9 @@ class PelRunning(PelDeploymentDescriptionParser):
             self._set_gan_components_running_status(False)
             self._set_single_dsl_gan_components_running_status(False)
 
+        if ProcessSupervisor.is_available() and self.processSupervisorClient.shutdown_the_supervisor(if_idle=True):
+            print(" - The process supervisor is stopped")
+
     def copy_working_databases_data_root_folder_as_original(self) -> NoReturn:
         if self.is_databases_running():
             print("Databases are running, so impossible to make the original copy")
@@ -2066,24 +4044,39 @@ class SingleDslPel:
     singleDslPelDeploymentRootFolderName = "single-dsl-pel-deployment"
     consoleSingleDslLogFileName = "single-dsl-console.log"
     singleDslLogFolderName = "single-dsl-logs"
+    copyParallelism = 8
+    buildManifestFileName = "single-dsl-build-manifest.json"
+    buildManifestInputNames = ["bin", "lib", "resources", "etc", "dsl.json"]
+    dslJvmsJsonFileName = "single-dsl-jvms.json"
+    readinessFirstPollingPeriodInSeconds = 0.1
+    readinessMaxPollingPeriodInSeconds = 2.0
+    dslProcessJsonFileName = "dsl-process.json"
+    stopRequestConnectTimeoutInSeconds = 2
+    stopRequestReadTimeoutInSeconds = 10
+    defaultLogXmlOptions = {"isAsync": False, "isRandomAccessFile": False, "isImmediateFlush": True, "isPasswordMasked": True, "bufferSize": None,
+                            "optionsByServiceNamePattern": {}}
+    defaultIsolationRules = [{"jarPrefixes": ["bin/generic-snmp", "bin/dio-snmp-mock"], "xms": "64m", "xmx": "256m"}]
 
     def __init__(self, deployment_folder_path: Path):
         self.allDslRootDirPath = deployment_folder_path / PelDeploymentDescriptionParser.pelFolderName / PelDeploymentDescriptionParser.runningDeploymentRootFolderName
         self.singleDslTargetDirPath = deployment_folder_path / PelDeploymentDescriptionParser.pelFolderName / self.singleDslPelDeploymentRootFolderName
         self.logDirPath = deployment_folder_path / PelDeploymentDescriptionParser.pelFolderName / PelDeploymentDescriptionParser.runningDeploymentLogFolderName
         self.singleDslLogFolderPath = self.logDirPath / self.singleDslLogFolderName
+        self.logArchivesDirPath = deployment_folder_path / PelDeploymentDescriptionParser.pelFolderName / LogArchiver.archivesFolderName
+        self.processSupervisorClient = ProcessSupervisorClient(deployment_folder_path / PelDeploymentDescriptionParser.pelFolderName)
+        self.isResourcesContentConflictCheckEnabled = False
+        self.isJarConflictsAnalysisEnabled = False
+        self.startTimeoutInSeconds = 120
+        self.stopTimeoutInSeconds = ProcessGroupStopper.gracefulStopTimeoutInSeconds
+        self.jarConflictAnalyzer = JarConflictAnalyzer(deployment_folder_path / PelDeploymentDescriptionParser.pelFolderName / JarConflictAnalyzer.jarIndexCacheFileName)
 
     # noinspection GrazieInspection
     def build_single_dsl_pel_deployment(self, dsl_log_xml_trace_level: str = "DEBUG", dsl_log_xml_max_log_file_size: int = 10240000,
-                                        ordered_dsl_paths: List[Path] = None) -> bool:
+                                        ordered_dsl_paths: List[Path] = None, merge_mode: str = FileLinker.linkMergeMode, force_full_rebuild: bool = False,
+                                        packing_settings: dict = None, log_xml_options: dict = None) -> bool:
         if not self.allDslRootDirPath.is_dir():
             raise UserWarning(f"The PEL deployment folder '{self.allDslRootDirPath}' doesn't exist !")
 
-        if self.singleDslTargetDirPath.exists():
-            print(f"Delete exiting '{self.singleDslTargetDirPath}'")
-            shutil.rmtree(self.singleDslTargetDirPath, ignore_errors=True)
-        self.singleDslTargetDirPath.mkdir(parents=True, exist_ok=True)
-
         self.logDirPath.mkdir(parents=True, exist_ok=True)
 
         # List the DSLs
@@ -2092,20 +4085,52 @@ class SingleDslPel:
         else:
             dsl_paths = ordered_dsl_paths
 
+        # Compare the inputs with the ones of the previous build, to re-merge only what changed
+        build_manifest_file_path = self.singleDslTargetDirPath / self.buildManifestFileName
+        build_manifest = self._get_the_build_manifest(dsl_paths, merge_mode)
+        previous_build_manifest = None
+        if not force_full_rebuild and build_manifest_file_path.exists():
+            previous_build_manifest = self._get_dict_from_json_file(build_manifest_file_path)
+        if previous_build_manifest is None or previous_build_manifest.get("mergeMode", None) != merge_mode:
+            if self.singleDslTargetDirPath.exists():
+                print(f"Delete exiting '{self.singleDslTargetDirPath}'")
+                shutil.rmtree(self.singleDslTargetDirPath, ignore_errors=True)
+            changed_inputs = set(self.buildManifestInputNames)
+        else:
+            changed_inputs = {input_name for input_name in self.buildManifestInputNames
+                              if previous_build_manifest.get("inputDigests", {}).get(input_name, None) != build_manifest["inputDigests"][input_name]}
+            print(f"- Incremental build of '{self.singleDslTargetDirPath}', the changed inputs are: {sorted(changed_inputs) or 'none'}")
+        self.singleDslTargetDirPath.mkdir(parents=True, exist_ok=True)
+
+        # A build interrupted in the middle must not be taken as up to date
+        build_manifest_file_path.unlink(missing_ok=True)
+
+        # The same file linker is used for the main and the special DSL folders, so all of them share the jar files content
+        file_linker = FileLinker(merge_mode)
+
         # Merge the jar files from "bin" DSLs folders into one folder
-        self._merge_the_jar_files_from_dsl_folders_into_one_folder("bin", dsl_paths)
+        if "bin" in changed_inputs:
+            self._merge_the_jar_files_from_dsl_folders_into_one_folder("bin", dsl_paths, file_linker)
 
         # Merge the jar files from "lib" DSLs folders into one folder
-        self._merge_the_jar_files_from_dsl_folders_into_one_folder("lib", dsl_paths)
+        if "lib" in changed_inputs:
+            self._merge_the_jar_files_from_dsl_folders_into_one_folder("lib", dsl_paths, file_linker)
+
+        # Report the classes shadowed between the merged jar files
+        if self.isJarConflictsAnalysisEnabled and ("bin" in changed_inputs or "lib" in changed_inputs):
+            self._analyze_the_jar_conflicts_of_the_main_dsl_folder()
 
         # Merge the resources files from "resources" DSLs folders into one folder
-        self._merge_the_resources_files_from_dsl_folders_into_one_folder("resources", dsl_paths)
+        if "resources" in changed_inputs:
+            self._merge_the_resources_files_from_dsl_folders_into_one_folder("resources", dsl_paths)
 
         # Merge the resources file store in DSLs definition folder
-        self._merge_the_files_other_than_the_dsl_definition_files_from_dsl_folders_into_one_folder(["dsl.json", dsl_log_file], "etc", dsl_paths)
+        if "etc" in changed_inputs:
+            self._merge_the_files_other_than_the_dsl_definition_files_from_dsl_folders_into_one_folder(["dsl.json", dsl_log_file], "etc", dsl_paths)
 
         # Merge the dsl.json files from "etc" DSLs folders into one file
-        single_dsl_json_file_path, special_dsl_json_file_path_list = self._merge_the_dsl_json_file_from_dsl_folders_into_one_file("dsl.json", "etc", dsl_paths)
+        single_dsl_json_file_path, special_dsl_json_file_path_list = self._merge_the_dsl_json_file_from_dsl_folders_into_one_file("dsl.json", "etc", dsl_paths,
+                                                                                                                                   packing_settings=packing_settings)
         if single_dsl_json_file_path is None:
             print(f"   ERROR: impossible to make the DLS json file, so abort !")
             return False
@@ -2114,7 +4139,8 @@ class SingleDslPel:
         if not self._build_the_single_dsl_log_xml_file_from_the_single_dsl_json_file(dsl_log_file,
                                                                                      single_dsl_json_file_path,
                                                                                      trace_level=dsl_log_xml_trace_level,
-                                                                                     max_log_file_size=dsl_log_xml_max_log_file_size):
+                                                                                     max_log_file_size=dsl_log_xml_max_log_file_size,
+                                                                                     log_xml_options=log_xml_options):
             print(f"   ERROR: impossible to build the DLS log4j.xml file, so abort !")
             return False
 
@@ -2123,41 +4149,133 @@ class SingleDslPel:
             if not self._build_the_single_dsl_log_xml_file_from_the_single_dsl_json_file(dsl_log_file,
                                                                                          special_dsl_json_file_path,
                                                                                          trace_level=dsl_log_xml_trace_level,
-                                                                                         max_log_file_size=dsl_log_xml_max_log_file_size):
+                                                                                         max_log_file_size=dsl_log_xml_max_log_file_size,
+                                                                                         log_xml_options=log_xml_options):
                 print(f"   ERROR: impossible to build the DLS log4j.xml file, so abort !")
                 return False
 
             # Copy the others folder
             single_dsl_folder_path = single_dsl_json_file_path.parent.parent
             special_dsl_folder_path = special_dsl_json_file_path.parent.parent
-            shutil.copytree(str(single_dsl_folder_path / "bin"), str(special_dsl_folder_path / "bin"))
-            shutil.copytree(str(single_dsl_folder_path / "lib"), str(special_dsl_folder_path / "lib"))
-            shutil.copytree(str(single_dsl_folder_path / "resources"), str(special_dsl_folder_path / "resources"))
-
+            file_linker.link_the_tree(single_dsl_folder_path / "bin", special_dsl_folder_path / "bin")
+            file_linker.link_the_tree(single_dsl_folder_path / "lib", special_dsl_folder_path / "lib")
+            file_linker.link_the_tree(single_dsl_folder_path / "resources", special_dsl_folder_path / "resources")
+
+        # Remove the special DSL folders not produced by this build
+        special_dsl_folder_paths = [special_dsl_json_file_path.parent.parent for special_dsl_json_file_path in special_dsl_json_file_path_list]
+        for single_dsl_folder_path in self.singleDslTargetDirPath.glob("dsl-folder-*"):
+            if single_dsl_folder_path not in special_dsl_folder_paths:
+                print(f"- Delete the stale special DSL folder '{single_dsl_folder_path}'")
+                shutil.rmtree(single_dsl_folder_path, ignore_errors=True)
+
+        print(f"- The jar files of the single DSL folders were merged in '{merge_mode}' mode: {file_linker.get_the_files_count_resume()}")
+        self._write_dict_to_json_file(build_manifest, build_manifest_file_path)
         return True
 
+    def _get_the_build_manifest(self, dsl_paths: List[Path], merge_mode: str) -> dict:
+        """
+        Fingerprint the inputs of the single DSL build: the files of each DSL folder are identified by their size and modification time,
+        the dsl.json files by their content digest. The inputs digests also depend on the DSLs order, which decides the merge winners.
+        """
+        inputs_by_dsl = {}
+        for dsl_path in dsl_paths:
+            dsl_inputs = {}
+            for input_name in ("bin", "lib", "resources", "etc"):
+                input_dir_path = dsl_path / input_name
+                input_files = []
+                for input_sub_dir_path, _, file_names in os.walk(str(input_dir_path)):
+                    for file_name in file_names:
+                        if input_name == "etc" and file_name in ("dsl.json", dsl_log_file):
+                            continue
+                        input_file_path = Path(input_sub_dir_path) / file_name
+                        input_file_stat = input_file_path.stat()
+                        input_files.append(f"{input_file_path.relative_to(input_dir_path)}:{input_file_stat.st_size}:{input_file_stat.st_mtime_ns}")
+                dsl_inputs[input_name] = hashlib.sha256("\n".join(sorted(input_files)).encode()).hexdigest()
+            dsl_json_file_path = dsl_path / "etc" / "dsl.json"
+            dsl_inputs["dsl.json"] = hashlib.sha256(dsl_json_file_path.read_bytes()).hexdigest() if dsl_json_file_path.is_file() else None
+            inputs_by_dsl[str(dsl_path.relative_to(self.allDslRootDirPath))] = dsl_inputs
+
+        input_digests = {}
+        for input_name in self.buildManifestInputNames:
+            ordered_dsl_inputs = [(dsl_name, dsl_inputs[input_name]) for dsl_name, dsl_inputs in inputs_by_dsl.items()]
+            input_digests[input_name] = hashlib.sha256(json.dumps(ordered_dsl_inputs).encode()).hexdigest()
+
+        return {
+            "mergeMode": merge_mode,
+            "inputDigests": input_digests,
+            "inputsByDsl": inputs_by_dsl,
+        }
+
     def start_single_dsl(self) -> bool:
-        if not self.start_dsl(self.singleDslTargetDirPath / "main-dsl-folder"):
-            return True
+        # The heap options are given by the packing done at build time, the previous builds used fixed options
+        dsl_jvms = {}
+        if (self.singleDslTargetDirPath / self.dslJvmsJsonFileName).exists():
+            dsl_jvms = self._get_dict_from_json_file(self.singleDslTargetDirPath / self.dslJvmsJsonFileName) or {}
 
-        has_some_failures = False
-        single_dsl_folders = self.singleDslTargetDirPath.glob(f"*dsl-folder*")
-        for single_dsl_folder in single_dsl_folders:
-            if single_dsl_folder.name == "main-dsl-folder":
-                continue
+        if self.singleDslLogFolderPath.exists():
+            shutil.rmtree(self.singleDslLogFolderPath, ignore_errors=True)
+        self.singleDslLogFolderPath.mkdir(parents=True, exist_ok=True)
 
-            if not self.start_dsl(single_dsl_folder, xms_option_value="64m", xmx_option_value="256m"):
-                has_some_failures = True
+        # All the JVMs are launched together, so the start lasts as long as the slowest one
+        dsl_folder_paths = [self.singleDslTargetDirPath / "main-dsl-folder"]
+        dsl_folder_paths += sorted(p for p in self.singleDslTargetDirPath.glob(f"*dsl-folder*") if p.name != "main-dsl-folder")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(dsl_folder_paths)) as executor:
+            start_reports = list(executor.map(lambda dsl_folder_path: self._start_the_dsl_and_wait_for_its_readiness(dsl_folder_path, dsl_jvms), dsl_folder_paths))
+
+        has_some_failures = False
+        print(f"- Single DSL JVMs startup report:")
+        for start_report in start_reports:
+            has_some_failures |= not start_report["isReady"]
+            print(f"    - '{start_report['name']}' {start_report['status']} after {start_report['durationInSeconds']:.1f}s")
         return has_some_failures
 
+    def _start_the_dsl_and_wait_for_its_readiness(self, dsl_folder_path: Path, dsl_jvms: dict) -> dict:
+        start_time = time.monotonic()
+        start_report = {"name": dsl_folder_path.name, "isReady": False}
+
+        dsl_jvm = dsl_jvms.get(dsl_folder_path.name, {"xms": "64m", "xmx": "256m"} if dsl_folder_path.name != "main-dsl-folder" else {})
+        process_pid = self._launch_the_dsl(dsl_folder_path, xms_option_value=dsl_jvm.get("xms", None), xmx_option_value=dsl_jvm.get("xmx", None))
+        dsl_host_and_port = self._get_the_dsl_host_and_port(dsl_folder_path)
+        if process_pid is None:
+            start_report["status"] = "launch failed"
+        elif dsl_host_and_port is None:
+            start_report["status"] = "launched without readiness check (no dsl.host/dsl.port)"
+            start_report["isReady"] = True
+        else:
+            dsl_host, dsl_port = dsl_host_and_port
+            start_report["isReady"], start_report["status"] = self._wait_for_the_dsl_readiness(dsl_host, dsl_port, process_pid, start_time + self.startTimeoutInSeconds)
+        start_report["durationInSeconds"] = time.monotonic() - start_time
+        return start_report
+
+    def _wait_for_the_dsl_readiness(self, dsl_host: str, dsl_port: int, process_pid: int, deadline: float) -> Tuple[bool, str]:
+        polling_period_in_seconds = self.readinessFirstPollingPeriodInSeconds
+        while True:
+            if ProcessLivenessProbe.is_port_listening(dsl_host, dsl_port):
+                return True, f"ready on {dsl_host}:{dsl_port}"
+            if not ProcessLivenessProbe.is_process_alive(process_pid):
+                return False, f"ended (pid {process_pid}) before answering on {dsl_host}:{dsl_port}"
+            if time.monotonic() >= deadline:
+                return False, f"not answering on {dsl_host}:{dsl_port}"
+            time.sleep(min(polling_period_in_seconds, max(0.0, deadline - time.monotonic())))
+            polling_period_in_seconds = min(polling_period_in_seconds * 2, self.readinessMaxPollingPeriodInSeconds)
+
+    def _get_the_dsl_host_and_port(self, dsl_folder_path: Path) -> Optional[Tuple[str, int]]:
+        dsl_conf_dict = self._get_dict_from_json_file(dsl_folder_path / "etc" / "dsl.json")
+        if dsl_conf_dict is None or dsl_conf_dict.get("dsl.host", None) is None or dsl_conf_dict.get("dsl.port", None) is None:
+            return None
+        return dsl_conf_dict["dsl.host"], dsl_conf_dict["dsl.port"]
+
     def start_dsl(self, dsl_folder_path: Path, xms_option_value: str = None, xmx_option_value: str = None) -> bool:
+        return self._launch_the_dsl(dsl_folder_path, xms_option_value, xmx_option_value) is not None
+
+    def _launch_the_dsl(self, dsl_folder_path: Path, xms_option_value: str = None, xmx_option_value: str = None) -> Optional[int]:
         print(f"Start '{dsl_folder_path}' DSL...")
 
         dsl_bin_dir_path = dsl_folder_path / "bin"
         results = list(dsl_bin_dir_path.glob("dsl-*.jar"))
         if len(results) != 1:
             print(f"    ! Cannot find a single corresponding jar to dsl component in folder '{dsl_bin_dir_path}'")
-            return False
+            return None
 
         dsl_jar_path = results[0]
 
@@ -2182,77 +4300,107 @@ class SingleDslPel:
             r"-conf", r"./etc/dsl.json",
         ]
 
-        if self.singleDslLogFolderPath.exists():
-            shutil.rmtree(self.singleDslLogFolderPath, ignore_errors=True)
-        self.singleDslLogFolderPath.mkdir(parents=True, exist_ok=True)
+        # Each JVM has its own console log, as they are started together
+        if dsl_folder_path.name == "main-dsl-folder":
+            dsl_log_file_path = self.logDirPath / self.consoleSingleDslLogFileName
+        else:
+            dsl_log_file_path = self.logDirPath / f"{Path(self.consoleSingleDslLogFileName).stem}-{dsl_folder_path.name}.log"
+        if ProcessSupervisor.is_available():
+            print(f"    - Start the process through the deployment process supervisor...")
+            process_pid = self.processSupervisorClient.start_process(f"{self.singleDslPelDeploymentRootFolderName}/{dsl_folder_path.name}", dsl_log_file_path, command_arguments,
+                                                                     current_working_directory=dsl_folder_path)
+            if process_pid is None:
+                print(f"    ! The '{dsl_folder_path}' DSL start through the process supervisor failed")
+                return None
+            print(f"    - Supervised process pid: {process_pid}")
+        else:
+            with dsl_log_file_path.open("w"):
+                print(f"    - Detach process...")
+                process = run_detach_subprocess(dsl_log_file_path, command_arguments, current_working_directory=dsl_folder_path)
+                process_pid = process.pid
+                print(f"    - Detach process pid: {process_pid}")
 
-        dsl_log_file_path = self.logDirPath / self.consoleSingleDslLogFileName
-        with dsl_log_file_path.open("w"):
-            print(f"    - Detach process...")
-            process = run_detach_subprocess(dsl_log_file_path, command_arguments, current_working_directory=dsl_folder_path)
-            print(f"    - Detach process pid: {process.pid}")
+        # Memorize the process, so the stop can wait for its end and kill it if needed
+        self._write_dict_to_json_file({"pid": process_pid, "startIdentity": ProcessLivenessProbe.get_the_process_start_identity(process_pid)},
+                                      dsl_folder_path / self.dslProcessJsonFileName)
 
         print(f"The '{dsl_folder_path}' DSL was launched")
-        return True
+        return process_pid
 
     def stop_single_dsl(self) -> bool:
-        has_some_failures = False
-        single_dsl_folders = self.singleDslTargetDirPath.glob(f"*dsl-folder*")
-        for single_dsl_folder in single_dsl_folders:
-            if not self.stop_dsl(single_dsl_folder):
-                has_some_failures = True
-        return has_some_failures
-
-    def stop_dsl(self, dsl_folder_path: Path) -> bool:
         import requests
 
-        print(f"Stop '{dsl_folder_path}' DSL...")
-
-        dsl_conf_path = dsl_folder_path / "etc" / "dsl.json"
-        try:
-            with dsl_conf_path.open("r") as json_file:
-                dsl_conf_dict = json.load(json_file)
-        except (OSError, json.JSONDecodeError) as e:
-            print(f"    ! Load json from file '{dsl_conf_path}' failed: ", e)
+        dsl_folder_paths = sorted(self.singleDslTargetDirPath.glob(f"*dsl-folder*"))
+        if len(dsl_folder_paths) == 0:
             return False
 
-        if not isinstance(dsl_conf_dict, dict):
-            print(f"    ! Json from file '{dsl_conf_path}' is not a dict ({dsl_conf_dict})")
-            return False
+        # One pooled client sends all the stop requests together
+        with requests.Session() as http_session:
+            http_session.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=len(dsl_folder_paths)))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(dsl_folder_paths)) as executor:
+                stop_statuses = list(executor.map(lambda dsl_folder_path: self.stop_dsl(dsl_folder_path, http_session), dsl_folder_paths))
 
-        dsl_host = dsl_conf_dict.get("dsl.host", None)
-        dsl_port = dsl_conf_dict.get("dsl.port", None)
+        self._collect_the_single_dsl_logs(dsl_folder_paths)
+        return not all(stop_statuses)
 
-        if dsl_host is None or dsl_port is None:
-            print(f"    ! Impossible to get correct dsl host or port in dict ({dsl_conf_dict})")
-            return False
+    def stop_dsl(self, dsl_folder_path: Path, http_session=None) -> bool:
+        import requests
 
-        print(f"    - Attempt to post on url 'http://{dsl_host}:{dsl_port}/api/v1/stop'...")
-        try:
-            r = requests.post(f"http://{dsl_host}:{dsl_port}/api/v1/stop", json=None)
-        except requests.exceptions.RequestException as e:
-            print(f"Send post request failed:", e)
+        print(f"Stop '{dsl_folder_path}' DSL...")
+
+        is_stop_requested = False
+        dsl_host_and_port = self._get_the_dsl_host_and_port(dsl_folder_path)
+        if dsl_host_and_port is None:
+            print(f"    ! Impossible to get correct dsl host or port from '{dsl_folder_path / 'etc' / 'dsl.json'}'")
         else:
-            if r.status_code == requests.codes.ok:
-                print(f"    - Post request successful: {r.status_code}")
-            else:
-                print(f"    - Post request failed: {r.status_code}")
-                # TODO: kill the process ?
-
-        print(f"     - Copy the single DSL logs to '{self.singleDslLogFolderPath}'")
-        single_dsl_logs_folder_path = dsl_folder_path / "logs"
-        single_dsl_log_files_path = list(single_dsl_logs_folder_path.glob(f"**/*.log"))
-        for single_dsl_log_file_path in single_dsl_log_files_path:
-            log_file_name_parts = single_dsl_log_file_path.name.split("..")
-            target_log_file_path = self.singleDslLogFolderPath.joinpath(*log_file_name_parts)
-            print(f"         - Copy the single DSL log file '{single_dsl_log_file_path}' to '{target_log_file_path}'")
-            target_log_file_path.parent.mkdir(parents=True, exist_ok=True)
+            dsl_host, dsl_port = dsl_host_and_port
+            print(f"    - Attempt to post on url 'http://{dsl_host}:{dsl_port}/api/v1/stop'...")
             try:
-                shutil.copy2(str(single_dsl_log_file_path), str(target_log_file_path))
-            except OSError as e:
-                print(f"             ! Copy failed: {e}")
-
-        return True
+                r = (http_session or requests).post(f"http://{dsl_host}:{dsl_port}/api/v1/stop", json=None,
+                                                    timeout=(self.stopRequestConnectTimeoutInSeconds, self.stopRequestReadTimeoutInSeconds))
+            except requests.exceptions.RequestException as e:
+                print(f"    - '{dsl_folder_path.name}' send post request failed:", e)
+            else:
+                if r.status_code == requests.codes.ok:
+                    print(f"    - '{dsl_folder_path.name}' post request successful: {r.status_code}")
+                    is_stop_requested = True
+                else:
+                    print(f"    - '{dsl_folder_path.name}' post request failed: {r.status_code}")
+
+        # Wait for the JVM end, and kill it when it doesn't stop by itself
+        dsl_process_json_file_path = dsl_folder_path / self.dslProcessJsonFileName
+        if not dsl_process_json_file_path.exists():
+            return is_stop_requested
+        dsl_process_dict = self._get_dict_from_json_file(dsl_process_json_file_path) or {}
+        process_pid = dsl_process_dict.get("pid", None)
+        process_start_identity = dsl_process_dict.get("startIdentity", None)
+        if process_pid is None:
+            return is_stop_requested
+
+        deadline = time.monotonic() + (self.stopTimeoutInSeconds if is_stop_requested else 0)
+        while ProcessLivenessProbe.is_process_alive(process_pid, process_start_identity) and time.monotonic() < deadline:
+            time.sleep(ProcessGroupStopper.pollingPeriodInSeconds)
+
+        is_stopped = True
+        if ProcessLivenessProbe.is_process_alive(process_pid, process_start_identity):
+            print(f"    - '{dsl_folder_path.name}' (pid {process_pid}) is still running, so kill it")
+            if platform.system() == "Windows":
+                is_stopped = subprocess.run(["taskkill", "/F", "/T", "/PID", str(process_pid)], capture_output=True).returncode == 0
+            else:
+                is_stopped, _ = ProcessGroupStopper.stop_the_process_group(process_pid, ProcessGroupStopper.killTimeoutInSeconds)
+        if is_stopped:
+            dsl_process_json_file_path.unlink(missing_ok=True)
+        return is_stopped
+
+    def _collect_the_single_dsl_logs(self, dsl_folder_paths: List[Path]) -> NoReturn:
+        # The single DSL log files are named after the components topology ('node..group..component.log')
+        print(f"     - Archive the single DSL logs into '{self.logArchivesDirPath}' and copy them into '{self.singleDslLogFolderPath}'")
+        log_archiver = LogArchiver(self.logArchivesDirPath)
+        for dsl_folder_path in dsl_folder_paths:
+            log_archiver.add_the_folder(dsl_folder_path / "logs", self.singleDslLogFolderName,
+                                        lambda relative_path: relative_path.parent.joinpath(*relative_path.name.split("..")), self.singleDslLogFolderPath)
+        log_archiver.write_the_session_archive()
+        LogIndex(self.logArchivesDirPath.parent).update()
 
     @staticmethod
     def check_dsl_folder_is_complete(dsl_dir_path: Path) -> bool:
@@ -2270,7 +4418,7 @@ class SingleDslPel:
             print(f"    - {result_path.relative_to(self.allDslRootDirPath)}")
         return dsl_results
 
-    def _merge_the_jar_files_from_dsl_folders_into_one_folder(self, jar_files_folder_name: str, dsl_dir_paths: List[Path]) -> NoReturn:
+    def _merge_the_jar_files_from_dsl_folders_into_one_folder(self, jar_files_folder_name: str, dsl_dir_paths: List[Path], file_linker: FileLinker) -> NoReturn:
         # Create the target folder
         jar_files_target_dir_path = self.singleDslTargetDirPath / "main-dsl-folder" / jar_files_folder_name
         print(f"- Create the jar files target folder '{jar_files_target_dir_path}'")
@@ -2289,8 +4437,8 @@ class SingleDslPel:
                     # Memorize the jar full name
                     exiting_jar_full_names.append(jar_full_name)
 
-                    # Copy the jar file into the target folder
-                    shutil.copy2(str(jar_path), str(jar_files_target_dir_path))
+                    # Link (or copy) the jar file into the target folder
+                    file_linker.link_the_file(jar_path, jar_files_target_dir_path / jar_full_name)
 
                     # Get the jar name and version
                     jar_nam_and_version_pattern = "^(?P<jar_name>(?:(?!-\d).)*)(-(?P<jar_version>\d+(?:(?!\.jar)\.\w+)*(?:-SNAPSHOT)*)|(\.jar))"
@@ -2322,10 +4470,30 @@ class SingleDslPel:
         # for jar_full_name in exiting_jar_full_names:
         #     print(f"    - The '{jar_full_name}' was copied to the target '{jar_files_folder_name}'")
 
+        # Remove the jar files left by a previous build
+        FileLinker.remove_the_stale_files(jar_files_target_dir_path, {jar_files_target_dir_path / jar_full_name for jar_full_name in exiting_jar_full_names})
+
         print(f"    - Resume of the used '{jar_files_folder_name}' versions of jar files by jar file name:")
         for jar_name, jar_versions in exiting_jar_versions_by_name.items():
             print(f"        - '{jar_name}' with the versions: {jar_versions}")
 
+    def _analyze_the_jar_conflicts_of_the_main_dsl_folder(self) -> NoReturn:
+        main_dsl_folder_path = self.singleDslTargetDirPath / "main-dsl-folder"
+        ordered_jar_paths = sorted((main_dsl_folder_path / "bin").glob("*.jar")) + sorted((main_dsl_folder_path / "lib").glob("*.jar"))
+        print(f"- Analyze the conflicts between the {len(ordered_jar_paths)} jar files of the main DSL folder ('bin' then 'lib', by name)")
+        jar_conflicts_report = self.jarConflictAnalyzer.analyze(ordered_jar_paths)
+
+        jar_conflicts_report_file_path = self.singleDslTargetDirPath / JarConflictAnalyzer.jarConflictsReportFileName
+        with jar_conflicts_report_file_path.open("w") as jar_conflicts_report_file:
+            json.dump(jar_conflicts_report, jar_conflicts_report_file, indent=4)
+
+        print(f"    - {len(jar_conflicts_report['shadowedClasses'])} shadowed classes and {len(jar_conflicts_report['shadowedResources'])} shadowed resources,"
+              f" the details are in '{jar_conflicts_report_file_path}'")
+        for shadowing in jar_conflicts_report["shadowedClassesCountByJars"]:
+            print(f"   WARNING: '{shadowing['winner']}' shadows {shadowing['count']} classes of '{shadowing['shadowed']}'")
+        for dead_weight_jar in jar_conflicts_report["deadWeightJars"]:
+            print(f"   WARNING: all the classes of '{dead_weight_jar}' are shadowed, so it is dead weight")
+
     def _merge_the_resources_files_from_dsl_folders_into_one_folder(self, resources_files_folder_name: str,
                                                                     dsl_dir_paths: List[Path]) -> NoReturn:
         # Create the target folder
@@ -2335,24 +4503,9 @@ class SingleDslPel:
 
         # Merge files
         print(f"- Merge the resources files from each 'DSL/{resources_files_folder_name}' folder into the target '{resources_files_folder_name}'")
-        exiting_resource_relative_paths: List[Path] = []
-        for dsl_dir_path in dsl_dir_paths:
-            resource_file_path_results: List[Path] = [p for p in list((dsl_dir_path / resources_files_folder_name).glob(f"**/*"))if p.is_file()]
-            for resource_path in resource_file_path_results:
-                resource_relative_path = resource_path.relative_to(dsl_dir_path / resources_files_folder_name)
-
-                if resource_relative_path not in exiting_resource_relative_paths:
-                    # Memorize the resource relative path
-                    exiting_resource_relative_paths.append(resource_relative_path)
-
-                    # Copy the resource file into the target folder
-                    resource_file_target_dir_path = resources_files_target_dir_path / resource_relative_path.parent
-                    if not resource_file_target_dir_path.exists():
-                        print(f"    - Create the resources folder '{resource_file_target_dir_path.relative_to(self.singleDslTargetDirPath)}'")
-                        resource_file_target_dir_path.mkdir(parents=True, exist_ok=True)
-                    print(f"    - Copy '{resource_path.relative_to(self.allDslRootDirPath)}' file to target folder"
-                          f" '{resource_file_target_dir_path.relative_to(self.singleDslTargetDirPath)}'")
-                    shutil.copy2(str(resource_path), str(resource_file_target_dir_path))
+        copy_plan, duplicated_resource_paths = self._get_the_resources_files_copy_plan(resources_files_folder_name, resources_files_target_dir_path, dsl_dir_paths)
+        self._check_the_duplicated_resources_files_content(duplicated_resource_paths)
+        self._execute_the_resources_files_copy_plan(copy_plan, resources_files_target_dir_path)
 
     def _merge_the_files_other_than_the_dsl_definition_files_from_dsl_folders_into_one_folder(self, dsl_definition_file_names: List[str],
                                                                                               dsl_definition_files_folder_name: str,
@@ -2364,28 +4517,85 @@ class SingleDslPel:
 
         # Merge files
         print(f"- Merge the resources files from each 'DSL/{dsl_definition_files_folder_name}' folder into the target '{resources_files_target_dir_path}'")
-        exiting_resource_relative_paths: List[Path] = []
+        copy_plan, duplicated_resource_paths = self._get_the_resources_files_copy_plan(dsl_definition_files_folder_name, resources_files_target_dir_path, dsl_dir_paths,
+                                                                                       excluded_file_names=dsl_definition_file_names)
+        for resource_path, _ in duplicated_resource_paths:
+            print(f"   WARNING: the file name of the resource '{resource_path.relative_to(self.allDslRootDirPath)}' is already existing in the target folder !")
+        self._check_the_duplicated_resources_files_content(duplicated_resource_paths)
+        self._execute_the_resources_files_copy_plan(copy_plan, resources_files_target_dir_path, protected_file_names=dsl_definition_file_names)
+
+    @staticmethod
+    def _get_the_resources_files_copy_plan(resources_files_folder_name: str, resources_files_target_dir_path: Path, dsl_dir_paths: List[Path],
+                                           excluded_file_names: List[str] = None) -> Tuple[List[Tuple[Path, Path]], List[Tuple[Path, Path]]]:
+        """
+        Return the (source file, target file) copies to do, the first DSL giving a relative path wins,
+        and the (ignored source file, kept source file) pairs of the duplicated relative paths.
+        """
+        excluded_file_names = set(excluded_file_names or [])
+        copy_plan = []
+        duplicated_resource_paths = []
+        kept_resource_path_by_relative_path: Dict[str, Path] = {}
         for dsl_dir_path in dsl_dir_paths:
-            resource_file_path_results: List[Path] = [p for p in list(
-                (dsl_dir_path / dsl_definition_files_folder_name).glob(f"**/*")) if
-                                                      p.is_file() and p.name not in dsl_definition_file_names]
-            for resource_path in resource_file_path_results:
-                resource_relative_path = resource_path.relative_to(dsl_dir_path / dsl_definition_files_folder_name)
-
-                if resource_relative_path not in exiting_resource_relative_paths:
-                    # Memorize the resource relative path
-                    exiting_resource_relative_paths.append(resource_relative_path)
-
-                    # Copy the resource file into the target folder
-                    resource_file_target_dir_path = resources_files_target_dir_path / resource_relative_path.parent
-                    if not resource_file_target_dir_path.exists():
-                        print(f"    - Create the resources folder '{resource_file_target_dir_path.relative_to(self.singleDslTargetDirPath)}'")
-                        resource_file_target_dir_path.mkdir(parents=True, exist_ok=True)
-                    print(f"    - Copy '{resource_path.relative_to(self.allDslRootDirPath)}' file to target folder"
-                          f" '{resource_file_target_dir_path.relative_to(self.singleDslTargetDirPath)}'")
-                    shutil.copy2(str(resource_path), str(resource_file_target_dir_path))
-                else:
-                    print(f"   WARNING: the file name of the resource '{resource_path.relative_to(self.allDslRootDirPath)}' is already existing in the target folder !")
+            resources_dir_path = dsl_dir_path / resources_files_folder_name
+            for resource_dir_path, _, file_names in os.walk(str(resources_dir_path)):
+                relative_dir_path = Path(resource_dir_path).relative_to(resources_dir_path)
+                for file_name in sorted(file_names):
+                    if file_name in excluded_file_names:
+                        continue
+                    resource_path = Path(resource_dir_path) / file_name
+                    resource_relative_path = str(relative_dir_path / file_name)
+                    kept_resource_path = kept_resource_path_by_relative_path.setdefault(resource_relative_path, resource_path)
+                    if kept_resource_path is resource_path:
+                        copy_plan.append((resource_path, resources_files_target_dir_path / resource_relative_path))
+                    else:
+                        duplicated_resource_paths.append((resource_path, kept_resource_path))
+        return copy_plan, duplicated_resource_paths
+
+    def _check_the_duplicated_resources_files_content(self, duplicated_resource_paths: List[Tuple[Path, Path]]) -> NoReturn:
+        if not self.isResourcesContentConflictCheckEnabled or len(duplicated_resource_paths) == 0:
+            return
+
+        digest_by_path = {}
+
+        def get_the_file_digest(file_path: Path) -> str:
+            if file_path not in digest_by_path:
+                file_hash = hashlib.sha256()
+                with file_path.open("rb") as file:
+                    for chunk in iter(lambda: file.read(SubprocessLogCapture.chunkSize), b""):
+                        file_hash.update(chunk)
+                digest_by_path[file_path] = file_hash.hexdigest()
+            return digest_by_path[file_path]
+
+        conflicts_count = 0
+        for resource_path, kept_resource_path in duplicated_resource_paths:
+            if resource_path.stat().st_size != kept_resource_path.stat().st_size or get_the_file_digest(resource_path) != get_the_file_digest(kept_resource_path):
+                conflicts_count += 1
+                print(f"   WARNING: the resource '{resource_path.relative_to(self.allDslRootDirPath)}' is ignored but its content differs from"
+                      f" the kept '{kept_resource_path.relative_to(self.allDslRootDirPath)}' !")
+        print(f"    - {conflicts_count} content conflicts over {len(duplicated_resource_paths)} duplicated resources files")
+
+    def _execute_the_resources_files_copy_plan(self, copy_plan: List[Tuple[Path, Path]], resources_files_target_dir_path: Path,
+                                               protected_file_names: List[str] = ()) -> NoReturn:
+        # Keep the files already up to date and remove the ones left by a previous build
+        removed_files_count = FileLinker.remove_the_stale_files(resources_files_target_dir_path, {target_file_path for _, target_file_path in copy_plan}, protected_file_names)
+        planned_files_count = len(copy_plan)
+        copy_plan = [(source_file_path, target_file_path) for source_file_path, target_file_path in copy_plan
+                     if not target_file_path.exists() or not FileLinker.is_the_target_file_up_to_date(source_file_path, target_file_path)]
+
+        # Create all the target folders at once, the parents first
+        for target_dir_path in sorted({target_file_path.parent for _, target_file_path in copy_plan}):
+            target_dir_path.mkdir(parents=True, exist_ok=True)
+
+        def copy_the_file(source_and_target: Tuple[Path, Path]) -> NoReturn:
+            # The outdated target can be hardlinked by a special DSL folder, so it is replaced and not written through
+            source_file_path, target_file_path = source_and_target
+            target_file_path.unlink(missing_ok=True)
+            shutil.copy2(str(source_file_path), str(target_file_path))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.copyParallelism) as executor:
+            for _ in executor.map(copy_the_file, copy_plan):
+                pass
+        print(f"    - {len(copy_plan)} resources files copied to the target folder ({planned_files_count - len(copy_plan)} unchanged, {removed_files_count} removed)")
 
     @staticmethod
     def _get_dict_from_json_file(json_file_path: Path) -> Optional[dict]:
@@ -2402,20 +4612,33 @@ class SingleDslPel:
 
         return file_content_as_dict
 
-    @staticmethod
-    def _write_dict_to_json_file(input_dict: dict, output_json_file_path: Path) -> bool:
+    @classmethod
+    def _write_dict_to_json_file(cls, input_dict: dict, output_json_file_path: Path) -> bool:
         try:
-            with output_json_file_path.open("w", newline="\n") as json_file:
-                json.dump(input_dict, json_file, indent=4)
+            cls._write_the_file_content_if_changed(json.dumps(input_dict, indent=4), output_json_file_path)
         except (OSError, TypeError, ValueError, OverflowError) as e:
             print(f"        - Write json to file '{output_json_file_path}' failed: ", e)
             return False
         return True
 
+    @staticmethod
+    def _write_the_file_content_if_changed(file_content: str, file_path: Path) -> bool:
+        # An unchanged file keeps its modification time, so the DSL doesn't see a new configuration
+        try:
+            with file_path.open("r", newline="") as existing_file:
+                if existing_file.read() == file_content:
+                    return False
+        except (OSError, UnicodeDecodeError):
+            pass
+        with file_path.open("w", newline="\n") as file:
+            file.write(file_content)
+        return True
+
     def _merge_the_dsl_json_file_from_dsl_folders_into_one_file(self, dsl_json_file_name: str,
                                                                 dsl_definition_files_folder_name: str,
                                                                 dsl_dir_paths: List[Path],
-                                                                dsl_host="127.169.0.0", dsl_port=40000) -> Optional[Tuple[Optional[Path], Optional[List[Path]]]]:
+                                                                dsl_host="127.169.0.0", dsl_port=40000,
+                                                                packing_settings: dict = None) -> Optional[Tuple[Optional[Path], Optional[List[Path]]]]:
         # Create the target folder and the single DSL json file path
         dsl_folder_target_path = self.singleDslTargetDirPath / "main-dsl-folder"
         dsl_json_file_target_dir_path = dsl_folder_target_path / dsl_definition_files_folder_name
@@ -2428,11 +4651,9 @@ class SingleDslPel:
         # Merge dsl json files
         print(f"- Merge the {dsl_json_file_name} files from each 'DSL/{dsl_definition_files_folder_name}' into a single"
               f" {dsl_json_file_name} file in target '{dsl_definition_files_folder_name}'")
-        single_dsl_json_dict = {
-            "dsl.host": dsl_host,
-            "dsl.port": dsl_port,
-            "components": [],
-        }
+        packing_settings = self._get_the_packing_settings(packing_settings)
+        isolated_dsl_json_dicts = []
+        packed_components = []
         for dsl_dir_path_index, dsl_dir_path in enumerate(dsl_dir_paths):
             dsl_json_file_path = dsl_dir_path / dsl_definition_files_folder_name / dsl_json_file_name
             dsl_json_dict = self._get_dict_from_json_file(dsl_json_file_path)
@@ -2446,6 +4667,7 @@ class SingleDslPel:
                 "dsl.port": dsl_port + dsl_dir_path_index + 1,
                 "components": [],
             }
+            matching_isolation_rules = []
 
             # Merge component in the single dsl json file
             dsl_json_components = dsl_json_dict.get("components", None)
@@ -2491,33 +4713,159 @@ class SingleDslPel:
                 # print(f"    - Update the component configuration 'srv.instance' from '{dsl_json_component_configuration_srv_instance}' to '{updated_name}'")
                 dsl_json_component["configuration"]["srv.instance"] = updated_name
 
-                # Add the component to the single DSL json file
-                if dsl_json_component_jar.startswith("bin/generic-snmp") or dsl_json_component_jar.startswith("bin/dio-snmp-mock"):
+                # Add the component to the DSL of its source DSL when an isolation rule matches it, else to the packed ones
+                isolation_rule = self._get_the_matching_isolation_rule(packing_settings, dsl_json_component_jar)
+                if isolation_rule is not None:
                     special_single_dsl_json_dict["components"].append(dsl_json_component)
+                    if isolation_rule not in matching_isolation_rules:
+                        matching_isolation_rules.append(isolation_rule)
                 else:
-                    single_dsl_json_dict["components"].append(dsl_json_component)
+                    heap_weight_in_mb = self._get_the_component_heap_weight_in_mb(packing_settings, dsl_json_component_name, dsl_json_component_jar)
+                    packed_components.append((len(packed_components), heap_weight_in_mb, dsl_json_component))
 
             if len(special_single_dsl_json_dict["components"]) > 0:
-                # Create the special target folder and the single DSL json file path
-                special_dsl_folder_target_path = self.singleDslTargetDirPath / f"dsl-folder-{special_single_dsl_json_dict['dsl.port']}"
-                special_dsl_json_file_target_dir_path = special_dsl_folder_target_path / dsl_definition_files_folder_name
-                print(f"- Create the special single DSL json file target folder '{special_dsl_json_file_target_dir_path}'")
-                special_dsl_json_file_target_dir_path.mkdir(parents=True, exist_ok=True)
-                special_dsl_json_file_target_path = special_dsl_json_file_target_dir_path / dsl_json_file_name
-
-                if not self._write_dict_to_json_file(special_single_dsl_json_dict, special_dsl_json_file_target_path):
-                    print(f"   ERROR: impossible to write the single dsl json file '{special_dsl_json_file_target_path}' !")
-                    return None
+                special_single_dsl_json_dict["isolationRule"] = self._merge_the_isolation_rules(matching_isolation_rules, dsl_dir_path.name)
+                isolated_dsl_json_dicts.append(special_single_dsl_json_dict)
+
+        # Pack the other components into the JVMs, the first one being the main DSL folder
+        jvm_count = packing_settings["jvmCount"]
+        components_by_jvm_index = self._pack_the_components_by_heap_weight(packed_components, jvm_count)
+        dsl_jvms = {}
+        for jvm_index, jvm_components in enumerate(components_by_jvm_index):
+            jvm_dsl_json_dict = {
+                "dsl.host": dsl_host,
+                "dsl.port": dsl_port if jvm_index == 0 else dsl_port + len(dsl_dir_paths) + jvm_index,
+                "components": [dsl_json_component for _, _, dsl_json_component in jvm_components],
+            }
+            if jvm_index == 0:
+                jvm_dsl_folder_target_path = dsl_folder_target_path
+            else:
+                jvm_dsl_folder_target_path = self.singleDslTargetDirPath / f"dsl-folder-{jvm_dsl_json_dict['dsl.port']}"
+            if jvm_index > 0 and len(jvm_components) == 0:
+                continue
+
+            jvm_heap_weight_in_mb = sum(heap_weight_in_mb for _, heap_weight_in_mb, _ in jvm_components)
+            dsl_jvms[jvm_dsl_folder_target_path.name] = {
+                "port": jvm_dsl_json_dict["dsl.port"],
+                "componentsCount": len(jvm_components),
+                "heapWeightInMb": jvm_heap_weight_in_mb,
+            }
+            if packing_settings["isHeapSized"]:
+                dsl_jvms[jvm_dsl_folder_target_path.name].update(self._get_the_jvm_heap_options(packing_settings, jvm_heap_weight_in_mb))
+
+            jvm_dsl_json_file_target_dir_path = jvm_dsl_folder_target_path / dsl_definition_files_folder_name
+            jvm_dsl_json_file_target_dir_path.mkdir(parents=True, exist_ok=True)
+            if not self._write_dict_to_json_file(jvm_dsl_json_dict, jvm_dsl_json_file_target_dir_path / dsl_json_file_name):
+                print(f"   ERROR: impossible to write the single dsl json file '{jvm_dsl_json_file_target_dir_path / dsl_json_file_name}' !")
+                return None
+            if jvm_index > 0:
+                special_dsl_json_file_target_path_list.append(jvm_dsl_json_file_target_dir_path / dsl_json_file_name)
+        if jvm_count > 1:
+            print(f"- The components are packed into {jvm_count} JVMs: "
+                  + ", ".join(f"'{name}' {jvm['componentsCount']} components for {jvm['heapWeightInMb']}MB" for name, jvm in dsl_jvms.items()))
+
+        for special_single_dsl_json_dict in isolated_dsl_json_dicts:
+            # Create the special target folder and the single DSL json file path
+            isolation_rule = special_single_dsl_json_dict.pop("isolationRule")
+            special_dsl_folder_target_path = self.singleDslTargetDirPath / f"dsl-folder-{special_single_dsl_json_dict['dsl.port']}"
+            special_dsl_json_file_target_dir_path = special_dsl_folder_target_path / dsl_definition_files_folder_name
+            print(f"- Create the special single DSL json file target folder '{special_dsl_json_file_target_dir_path}'")
+            special_dsl_json_file_target_dir_path.mkdir(parents=True, exist_ok=True)
+            special_dsl_json_file_target_path = special_dsl_json_file_target_dir_path / dsl_json_file_name
+
+            if not self._write_dict_to_json_file(special_single_dsl_json_dict, special_dsl_json_file_target_path):
+                print(f"   ERROR: impossible to write the single dsl json file '{special_dsl_json_file_target_path}' !")
+                return None
 
-                special_dsl_json_file_target_path_list.append(special_dsl_json_file_target_path)
+            special_dsl_json_file_target_path_list.append(special_dsl_json_file_target_path)
+            dsl_jvms[special_dsl_folder_target_path.name] = {
+                "port": special_single_dsl_json_dict["dsl.port"],
+                "componentsCount": len(special_single_dsl_json_dict["components"]),
+                "xms": isolation_rule.get("xms", None),
+                "xmx": isolation_rule.get("xmx", None),
+            }
 
-        # Write the single DSL json file to the target folder
-        if not self._write_dict_to_json_file(single_dsl_json_dict, dsl_json_file_target_path):
-            print(f"   ERROR: impossible to write the single dsl json file '{dsl_json_file_target_path}' !")
+        # Memorize the JVMs heap options for the start
+        if not self._write_dict_to_json_file(dsl_jvms, self.singleDslTargetDirPath / self.dslJvmsJsonFileName):
+            print(f"   ERROR: impossible to write the DSL JVMs file '{self.singleDslTargetDirPath / self.dslJvmsJsonFileName}' !")
             return None
 
         return dsl_json_file_target_path, special_dsl_json_file_target_path_list
 
+    def _get_the_packing_settings(self, packing_settings: Optional[dict]) -> dict:
+        packing_settings = dict(packing_settings or {})
+        packing_settings["isHeapSized"] = packing_settings.get("jvmCount", None) is not None
+        packing_settings.setdefault("jvmCount", 1)
+        if not isinstance(packing_settings["jvmCount"], int) or packing_settings["jvmCount"] < 1:
+            raise UserWarning(f"The single DSL 'jvmCount' must be a positive integer, not '{packing_settings['jvmCount']}'")
+        packing_settings.setdefault("isolationRules", self.defaultIsolationRules)
+        packing_settings.setdefault("heapWeightInMbByComponentName", {})
+        packing_settings.setdefault("heapWeightInMbByJarPrefix", {})
+        packing_settings.setdefault("defaultHeapWeightInMb", 128)
+        packing_settings.setdefault("heapHeadroomPercent", 50)
+        packing_settings.setdefault("minimumXmxInMb", 256)
+        return packing_settings
+
+    @staticmethod
+    def _get_the_matching_isolation_rule(packing_settings: dict, dsl_json_component_jar: str) -> Optional[dict]:
+        for isolation_rule in packing_settings["isolationRules"]:
+            if any(dsl_json_component_jar.startswith(jar_prefix) for jar_prefix in isolation_rule.get("jarPrefixes", [])):
+                return isolation_rule
+        return None
+
+    @staticmethod
+    def _get_the_component_heap_weight_in_mb(packing_settings: dict, dsl_json_component_name: str, dsl_json_component_jar: str) -> int:
+        # The weights by component name (declared or measured on a previous run) win over the weights by jar prefix
+        heap_weight_in_mb = packing_settings["heapWeightInMbByComponentName"].get(dsl_json_component_name, None)
+        if heap_weight_in_mb is not None:
+            return heap_weight_in_mb
+        matching_jar_prefixes = [jar_prefix for jar_prefix in packing_settings["heapWeightInMbByJarPrefix"].keys() if dsl_json_component_jar.startswith(jar_prefix)]
+        if len(matching_jar_prefixes) > 0:
+            return packing_settings["heapWeightInMbByJarPrefix"][max(matching_jar_prefixes, key=len)]
+        return packing_settings["defaultHeapWeightInMb"]
+
+    @staticmethod
+    def _pack_the_components_by_heap_weight(packed_components: List[Tuple[int, int, dict]], jvm_count: int) -> List[List[Tuple[int, int, dict]]]:
+        """
+        Assign each component, the heaviest first, to the JVM with the lowest heap weight (longest processing time first heuristic),
+        then keep the description order of the components inside each JVM.
+        """
+        components_by_jvm_index = [[] for _ in range(jvm_count)]
+        heap_weight_by_jvm_index = [0] * jvm_count
+        for packed_component in sorted(packed_components, key=lambda component: (-component[1], component[0])):
+            jvm_index = min(range(jvm_count), key=lambda index: (heap_weight_by_jvm_index[index], index))
+            components_by_jvm_index[jvm_index].append(packed_component)
+            heap_weight_by_jvm_index[jvm_index] += packed_component[1]
+        return [sorted(jvm_components, key=lambda component: component[0]) for jvm_components in components_by_jvm_index]
+
+    @classmethod
+    def _merge_the_isolation_rules(cls, isolation_rules: List[dict], dsl_name: str) -> dict:
+        # The isolated components of a DSL share its JVM, so when they match rules of different heap options, the largest ones are used
+        merged_isolation_rule = dict(isolation_rules[0])
+        for heap_option_name in ("xms", "xmx"):
+            heap_sizes = [isolation_rule[heap_option_name] for isolation_rule in isolation_rules if isolation_rule.get(heap_option_name, None) is not None]
+            merged_isolation_rule[heap_option_name] = max(heap_sizes, key=cls._get_the_heap_size_in_bytes, default=None)
+        if len({(isolation_rule.get("xms", None), isolation_rule.get("xmx", None)) for isolation_rule in isolation_rules}) > 1:
+            print(f"   WARNING: the isolated components of the DSL '{dsl_name}' match {len(isolation_rules)} isolation rules of different heap options,"
+                  f" so its JVM uses the largest ones: xms '{merged_isolation_rule['xms']}' and xmx '{merged_isolation_rule['xmx']}'")
+        return merged_isolation_rule
+
+    @staticmethod
+    def _get_the_heap_size_in_bytes(heap_size: str) -> int:
+        # Same units as the JVM heap options, "256m" or "1g", and a number of bytes without unit
+        heap_size_match = re.fullmatch(r"\s*(\d+)\s*([kmg]?)\s*", str(heap_size).lower())
+        if heap_size_match is None:
+            raise UserWarning(f"The isolation rule heap size '{heap_size}' is not valid")
+        return int(heap_size_match.group(1)) * 1024 ** " kmg".index(heap_size_match.group(2) or " ")
+
+    @staticmethod
+    def _get_the_jvm_heap_options(packing_settings: dict, jvm_heap_weight_in_mb: int) -> dict:
+        # The initial heap is the expected usage, the maximum one adds the headroom, rounded up to 64MB
+        xmx_in_mb = max(packing_settings["minimumXmxInMb"], jvm_heap_weight_in_mb * (100 + packing_settings["heapHeadroomPercent"]) // 100)
+        xmx_in_mb = -(-xmx_in_mb // 64) * 64
+        xms_in_mb = min(xmx_in_mb, max(64, jvm_heap_weight_in_mb))
+        return {"xms": f"{xms_in_mb}m", "xmx": f"{xmx_in_mb}m"}
+
     @staticmethod
     def _initialise_log_xml_lines() -> List[str]:
         return [
@@ -2525,36 +4873,84 @@ class SingleDslPel:
             r"""<Configuration>""",
         ]
 
+    @classmethod
+    def get_the_log_xml_options(cls, log_xml_options: dict = None) -> dict:
+        complete_log_xml_options = dict(cls.defaultLogXmlOptions)
+        complete_log_xml_options.update(log_xml_options or {})
+        return complete_log_xml_options
+
+    @staticmethod
+    def get_the_log_xml_options_by_service_name_pattern(service_option_strings: List[str]) -> Dict[str, dict]:
+        """
+        Read the 'SERVICE-NAME-PATTERN=TRACE-LEVEL[:BUFFER-SIZE]' strings, the trace level can be empty to only set the buffer size
+        """
+        options_by_service_name_pattern = {}
+        for service_option_string in service_option_strings or []:
+            service_option_match = re.match(r"^(?P<pattern>[^=]+)=(?P<level>[A-Za-z]*)(:(?P<bufferSize>\d+))?$", service_option_string)
+            if service_option_match is None:
+                raise UserWarning(f"The DSL log XML service option '{service_option_string}' doesn't match 'SERVICE-NAME-PATTERN=TRACE-LEVEL[:BUFFER-SIZE]'")
+            buffer_size = service_option_match.group("bufferSize")
+            options_by_service_name_pattern[service_option_match.group("pattern")] = {
+                "traceLevel": service_option_match.group("level").upper() or None,
+                "bufferSize": int(buffer_size) if buffer_size is not None else None,
+            }
+        return options_by_service_name_pattern
+
+    @staticmethod
+    def _get_the_service_trace_level_and_buffer_size(log_xml_options: dict, service_name: str, default_trace_level: str) -> Tuple[str, Optional[int]]:
+        # The first service name pattern matching gives the options of the service
+        for service_name_pattern, service_options in log_xml_options["optionsByServiceNamePattern"].items():
+            if fnmatch.fnmatchcase(service_name, service_name_pattern):
+                trace_level = service_options.get("traceLevel", None) or default_trace_level
+                buffer_size = service_options.get("bufferSize", None) or log_xml_options["bufferSize"]
+                return trace_level, buffer_size
+        return default_trace_level, log_xml_options["bufferSize"]
+
     @staticmethod
-    def _append_appender_to_log_xml_lines(dsl_log_xml_lines: list, log_dir: str, service_name: str, max_log_file_size: int) -> NoReturn:
-        dsl_log_xml_lines.append(f"""        <RollingFile name="{service_name}" fileName="{log_dir}/{service_name}.log" filePattern="{log_dir}/{service_name}-%i.log" >""")
+    def _append_appender_to_log_xml_lines(dsl_log_xml_lines: list, log_dir: str, service_name: str, max_log_file_size: int,
+                                          log_xml_options: dict = None, buffer_size: int = None) -> NoReturn:
+        log_xml_options = SingleDslPel.get_the_log_xml_options(log_xml_options)
+        appender_element_name = "RollingRandomAccessFile" if log_xml_options["isRandomAccessFile"] else "RollingFile"
+        appender_attributes = f'name="{service_name}" fileName="{log_dir}/{service_name}.log" filePattern="{log_dir}/{service_name}-%i.log"'
+        if not log_xml_options["isImmediateFlush"]:
+            appender_attributes += ' immediateFlush="false"'
+        if buffer_size is not None:
+            if not log_xml_options["isRandomAccessFile"]:
+                appender_attributes += ' bufferedIO="true"'
+            appender_attributes += f' bufferSize="{buffer_size}"'
+        dsl_log_xml_lines.append(f"""        <{appender_element_name} {appender_attributes} >""")
         dsl_log_xml_lines.append(r"""            <Policies>""")
         dsl_log_xml_lines.append(f"""               <SizeBasedTriggeringPolicy size="{max_log_file_size}"/>""")
         dsl_log_xml_lines.append(r"""            </Policies>""")
         dsl_log_xml_lines.append(r"""            <PatternLayout>""")
-        dsl_log_xml_lines.append(r"""                <Pattern>%d{MM/dd HH:mm:ss.SSS} - %-5level - %replace{%-200msg}{'"password":"[^"]*"'}{'"password":"*****"'} %n</Pattern>""")
+        if log_xml_options["isPasswordMasked"]:
+            dsl_log_xml_lines.append(r"""                <Pattern>%d{MM/dd HH:mm:ss.SSS} - %-5level - %replace{%-200msg}{'"password":"[^"]*"'}{'"password":"*****"'} %n</Pattern>""")
+        else:
+            # Neither the regex replacement nor the padding is evaluated for each log event
+            dsl_log_xml_lines.append(r"""                <Pattern>%d{MM/dd HH:mm:ss.SSS} - %-5level - %msg %n</Pattern>""")
         dsl_log_xml_lines.append(r"""            </PatternLayout>""")
         dsl_log_xml_lines.append(r"""            <DefaultRolloverStrategy max="10"/>""")
-        dsl_log_xml_lines.append(r"""        </RollingFile>""")
+        dsl_log_xml_lines.append(f"""        </{appender_element_name}>""")
         dsl_log_xml_lines.append(r"""""")
 
     @staticmethod
-    def _append_logger_to_log_xml_lines(dsl_log_xml_lines: list, service_name: str, namespace: str, trace_level: str) -> NoReturn:
-        dsl_log_xml_lines.append(f"""        <Logger name="{namespace}" level="{trace_level}" additivity="false">""")
+    def _append_logger_to_log_xml_lines(dsl_log_xml_lines: list, service_name: str, namespace: str, trace_level: str, is_async: bool = False) -> NoReturn:
+        logger_element_name = "AsyncLogger" if is_async else "Logger"
+        dsl_log_xml_lines.append(f"""        <{logger_element_name} name="{namespace}" level="{trace_level}" additivity="false">""")
         dsl_log_xml_lines.append(f"""            <AppenderRef ref="{service_name}"/>""")
-        dsl_log_xml_lines.append(r"""        </Logger>""")
+        dsl_log_xml_lines.append(f"""        </{logger_element_name}>""")
 
     @staticmethod
-    def _write_log_xml_lines(dsl_log_xml_lines: list, dsl_log_xml_path: Path) -> bool:
-        dsl_log_xml_lines.append(r"""        <Root level="WARN">""")
+    def _write_log_xml_lines(dsl_log_xml_lines: list, dsl_log_xml_path: Path, is_async: bool = False) -> bool:
+        root_element_name = "AsyncRoot" if is_async else "Root"
+        dsl_log_xml_lines.append(f"""        <{root_element_name} level="WARN">""")
         dsl_log_xml_lines.append(r"""            <AppenderRef ref="dsl" />""")
-        dsl_log_xml_lines.append(r"""        </Root>""")
+        dsl_log_xml_lines.append(f"""        </{root_element_name}>""")
         dsl_log_xml_lines.append(r"""    </Loggers>""")
         dsl_log_xml_lines.append(r"""</Configuration>""")
 
         try:
-            with dsl_log_xml_path.open("w", newline="\n") as target:
-                target.writelines([f"{line}\n" for line in dsl_log_xml_lines])
+            SingleDslPel._write_the_file_content_if_changed("".join([f"{line}\n" for line in dsl_log_xml_lines]), dsl_log_xml_path)
         except (OSError, TypeError, ValueError) as e:
             print(f"        - Write '{dsl_log_xml_path}' file failed: ", e)
             return False
@@ -2564,7 +4960,10 @@ class SingleDslPel:
     def _build_the_single_dsl_log_xml_file_from_the_single_dsl_json_file(self, dsl_log_xml_file_name: str,
                                                                          dsl_json_file_path: Path,
                                                                          trace_level: str = "DEBUG",
-                                                                         max_log_file_size: int = 10240000) -> bool:
+                                                                         max_log_file_size: int = 10240000,
+                                                                         log_xml_options: dict = None) -> bool:
+        log_xml_options = self.get_the_log_xml_options(log_xml_options)
+
         # Create the single DSL log4j.xml file path
         dsl_log_xml_file_path = dsl_json_file_path.parent / dsl_log_xml_file_name
 
@@ -2612,38 +5011,153 @@ class SingleDslPel:
         dsl_log_xml_lines.append(r"""    <Appenders>""")
         for service_name in dsl_namespaces_by_service_name.keys():
             # print(f"    - Append the '{dsl_json_component_name}' component configuration to the single DLS {dsl_log_xml_file_name} file lines")
-            self._append_appender_to_log_xml_lines(dsl_log_xml_lines, "logs", service_name, max_log_file_size)
+            _, service_buffer_size = self._get_the_service_trace_level_and_buffer_size(log_xml_options, service_name, trace_level)
+            self._append_appender_to_log_xml_lines(dsl_log_xml_lines, "logs", service_name, max_log_file_size, log_xml_options, service_buffer_size)
         dsl_log_xml_lines.append(r"""    </Appenders>""")
 
         # Appends loggers
         dsl_log_xml_lines.append(r"""    <Loggers>""")
         for service_name, namespaces in dsl_namespaces_by_service_name.items():
+            service_trace_level, _ = self._get_the_service_trace_level_and_buffer_size(log_xml_options, service_name, trace_level)
             for namespace in namespaces:
                 # Creates loggers
-                self._append_logger_to_log_xml_lines(dsl_log_xml_lines, service_name, namespace, trace_level)
+                self._append_logger_to_log_xml_lines(dsl_log_xml_lines, service_name, namespace, service_trace_level, log_xml_options["isAsync"])
 
         print(f"    - Write the the single DLS {dsl_log_xml_file_name} file '{dsl_log_xml_file_path}'")
-        if not self._write_log_xml_lines(dsl_log_xml_lines, dsl_log_xml_file_path):
+        if not self._write_log_xml_lines(dsl_log_xml_lines, dsl_log_xml_file_path, log_xml_options["isAsync"]):
             return False
         return True
 
 
+class PilSettings:
+    """
+    PIL and Jaeger sections settings resolved once by deployment, the PIL section values being used before the Jaeger ones
+    and the component values before the '--default--' ones
+    """
+    defaultComponentName = "--default--"
+    javaOptionFormatsByOptionName = {
+        "javaOptionXms": ["-Xms{}"],
+        "javaOptionXmx": ["-Xmx{}"],
+        "javaOptionGc": ["-XX:+Use{}GC"],
+        "javaOptionHeapDumpPath": ["-XX:+HeapDumpOnOutOfMemoryError", "-XX:HeapDumpPath={}"],
+        "javaOptionOthers": ["{}"],
+    }
+
+    def __init__(self, deployment_dict: dict):
+        sections_dicts = [deployment_dict.get(DeploymentDescriptionParser.key_words[section_label], {}) for section_label in ("label_of_a_pil_section", "label_of_a_jaeger_section")]
+
+        self._containerOptionValueByComponentNameByOptionName = {}
+        for section_dict in reversed(sections_dicts):
+            for option_name, option_value_by_component_name in section_dict.get("dockerContainersInfo", {}).items():
+                if isinstance(option_value_by_component_name, dict):
+                    self._containerOptionValueByComponentNameByOptionName.setdefault(option_name, {}).update(option_value_by_component_name)
+
+        self._javaToolOptionsByComponentName = {}
+        for option_name in self.javaOptionFormatsByOptionName:
+            for component_name in self._containerOptionValueByComponentNameByOptionName.get(option_name, {}):
+                self._javaToolOptionsByComponentName.setdefault(component_name, None)
+        self._javaToolOptionsByComponentName.setdefault(self.defaultComponentName, None)
+        for component_name in self._javaToolOptionsByComponentName:
+            self._javaToolOptionsByComponentName[component_name] = self._get_the_resolved_java_tool_options(component_name)
+
+        self.syslogIsEnabled, self.syslogHost, self.syslogPort, self.syslogAppNamePrefix = self._get_the_resolved_syslog_information(sections_dicts)
+
+    def get_the_container_option_value(self, option_name: str, component_name: str) -> Any:
+        # A component value set to null is missing, so the '--default--' one is used
+        option_value_by_component_name = self._containerOptionValueByComponentNameByOptionName.get(option_name, {})
+        component_option_value = option_value_by_component_name.get(component_name, None)
+        if component_option_value is None:
+            component_option_value = option_value_by_component_name.get(self.defaultComponentName, None)
+        return component_option_value
+
+    def get_the_java_tool_options(self, component_name: str) -> List[str]:
+        return list(self._javaToolOptionsByComponentName.get(component_name, self._javaToolOptionsByComponentName[self.defaultComponentName]))
+
+    def _get_the_resolved_java_tool_options(self, component_name: str) -> List[str]:
+        java_tool_options = []
+        for option_name, java_option_formats in self.javaOptionFormatsByOptionName.items():
+            option_value = self.get_the_container_option_value(option_name, component_name)
+            if option_value is not None:
+                java_tool_options += [java_option_format.format(option_value) for java_option_format in java_option_formats]
+        return java_tool_options
+
+    @staticmethod
+    def _get_the_resolved_syslog_information(sections_dicts: List[dict]) -> Tuple[Optional[bool], Optional[str], Optional[Any], Optional[str]]:
+        syslog_dicts = [section_dict["syslog"] for section_dict in sections_dicts if section_dict.get("syslog", None) is not None]
+        if len(syslog_dicts) == 0:
+            raise UserWarning(f"The PIL syslog information are not present")
+
+        syslog_information = {}
+        for syslog_key in ("isEnabled", "host", "port", "appNamePrefix"):
+            syslog_information[syslog_key] = next((syslog_dict[syslog_key] for syslog_dict in syslog_dicts if syslog_dict.get(syslog_key, None) is not None), None)
+        if syslog_information["isEnabled"] is None:
+            raise UserWarning(f"The PIL syslog information 'is_enabled' is not defined")
+
+        if syslog_information["isEnabled"] is not True:
+            return syslog_information["isEnabled"], None, None, None
+        for syslog_key in ("host", "port", "appNamePrefix"):
+            if syslog_information[syslog_key] is None:
+                raise UserWarning(f"The PIL syslog information '{syslog_key}' is not defined")
+        return True, syslog_information["host"], syslog_information["port"], syslog_information["appNamePrefix"]
+
+
 class PilDeploymentDescriptionParser(DeploymentDescriptionDeployer):
     pilFolderName = "pil-target"
     pilDockerFileFolderName = "dockerfiles"
     pilCommonNetworkName = "pil-common-network"
     runningDeploymentLogFolderName = "logs"
     listOfDockerImagesUsedKey = "listOfDockerImagesUsed"
+    dockerImagesDigestByNameKey = "dockerImagesDigestByName"
+    dockerfileNameByServiceNameKey = "dockerfileNameByServiceName"
+    referencedServiceNamesByServiceNameKey = "referencedServiceNamesByServiceName"
+    containerNameByServiceNameKey = "containerNameByServiceName"
+    resourceLimitsByServiceNameKey = "resourceLimitsByServiceName"
+    internalRunningStatusNames = [dockerImagesDigestByNameKey, dockerfileNameByServiceNameKey, referencedServiceNamesByServiceNameKey,
+                                  containerNameByServiceNameKey, resourceLimitsByServiceNameKey]
+    dockercomposeResourceLimitKeyByDescriptionKey = {"cpus": "cpus", "memLimit": "mem_limit", "cpuset": "cpuset", "pidsLimit": "pids_limit"}
+    dockerImagesOverrideFileName = "docker-images.override.yml"
 
     def __init__(self, deployment_folder_path: Path):
         self.pilDirPath = deployment_folder_path / self.pilFolderName
 
         DeploymentDescriptionDeployer.__init__(self, self.pilDirPath)
 
-        self.dockerfilesDirPath = self.pilDirPath / self.pilDockerFileFolderName
-        self.logDirPath = self.pilDirPath / self.runningDeploymentLogFolderName
+        self.dockerfilesDirPath = self.pilDirPath / self.pilDockerFileFolderName
+        self.logDirPath = self.pilDirPath / self.runningDeploymentLogFolderName
+
+        self._deployment_dict = None
+
+    @staticmethod
+    def _get_the_memory_size_in_bytes(memory_size: Union[int, str]) -> int:
+        # Same units as the docker memory options, "512m" or "2g", and a number of bytes without unit
+        memory_size_match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([bkmg]?)b?\s*", str(memory_size).lower())
+        if memory_size_match is None:
+            raise UserWarning(f"The memory size '{memory_size}' is not valid")
+        return int(float(memory_size_match.group(1)) * 1024 ** "bkmg".index(memory_size_match.group(2) or "b"))
+
+    @staticmethod
+    def _get_the_cpuset_cpu_indexes(cpuset: str) -> List[int]:
+        cpu_indexes = []
+        for cpuset_part in str(cpuset).split(","):
+            cpuset_part_match = re.fullmatch(r"\s*(\d+)\s*(?:-\s*(\d+)\s*)?", cpuset_part)
+            if cpuset_part_match is None:
+                raise UserWarning(f"The cpuset '{cpuset}' is not valid")
+            first_cpu_index = int(cpuset_part_match.group(1))
+            cpu_indexes += range(first_cpu_index, int(cpuset_part_match.group(2) or first_cpu_index) + 1)
+        return cpu_indexes
+
+    def _get_the_dockercompose_command_arguments(self) -> List[str]:
+        command_arguments = ["docker-compose", "-p", "pil-session"]
+
+        dockercompose_path_results: List[Path] = sorted(self.pilDirPath.glob(f"./*.dockercompose"))
+        for dockercompose_path in dockercompose_path_results:
+            command_arguments += ["-f", dockercompose_path.name]
+
+        # The images built from the dockerfiles hash replace the ones of the dockercompose files, so this file must be the last one
+        if (self.pilDirPath / self.dockerImagesOverrideFileName).exists():
+            command_arguments += ["-f", self.dockerImagesOverrideFileName]
 
-        self._deployment_dict = None
+        return command_arguments
 
     def _get_the_main_parent_component_group_dockercompose_file_path(self, dict_path: DictPath) -> Path:
         main_parent_component_group_dict_path = self._get_main_parent_component_group_dict_path(dict_path)
@@ -2658,6 +5172,13 @@ class PilDeploymentDescriptionParser(DeploymentDescriptionDeployer):
         service_name_header = "-".join(parents_component_groups_names)
         return service_name_header
 
+    def _get_the_component_index_entry_details(self, groups_names: List[str], component_description_name: str, component_description_dict: dict) -> dict:
+        service_name = self._get_component_associated_service_name("-".join(groups_names), component_description_dict.get(self.key_words["label_of_the_component_name"], None), component_description_name).lower()
+        return {
+            "service": service_name,
+            "container": f"pil-{service_name}",
+        }
+
     def _get_the_component_name_version_environments_variables_and_associated_service_and_container_name(self, dict_path: DictPath, path_based_dict: PathBasedDictionary) -> Tuple[str, str, dict, str, str]:
         service_name_header = self._get_the_service_name_header(dict_path)
 
@@ -2693,9 +5214,10 @@ class PilDeployer(PilDeploymentDescriptionParser):
 
         self.pilDatabaseComponentName = None
         self.jaegerComponentName = None
-        self._first_dockercompose_file_path = None
         self._first_service_by_ip_address_on_all_dockercomposes = None
-        self._main_component_group_dockercompose_final_lines = None
+        self._dockercompose_models = None
+        self._main_component_group_dockercompose_model = None
+        self._pil_settings = None
 
     def deploy_from_deployment_description_json_file(self, deployment_description_json_file_path: Path) -> NoReturn:
         if self.is_gan_components_running():
@@ -2711,23 +5233,25 @@ class PilDeployer(PilDeploymentDescriptionParser):
         if self.jaegerComponentName is None:
             raise UserWarning("The jaeger component name is not defined")
 
+        self._pil_settings = PilSettings(self._deployment_dict)
+
         if self.pilDirPath.exists():
             print(f"     - Delete '{self.pilDirPath}'")
             shutil.rmtree(self.pilDirPath, ignore_errors=True)
         self.pilDirPath.mkdir(parents=True, exist_ok=True)
         self.dockerfilesDirPath.mkdir(parents=True, exist_ok=True)
 
-        self._first_dockercompose_file_path = None
         self._first_service_by_ip_address_on_all_dockercomposes = {}
+        self._dockercompose_models = []
         self._parse_the_deployment_description_json_file(deployment_description_json_file_path)
 
-        self._append_pil_network_definition_to_the_first_dockercompose_file()
-        self._set_deployed_status(True)
-
-    def _append_pil_network_definition_to_the_first_dockercompose_file(self) -> NoReturn:
-        if self._first_dockercompose_file_path is None:
+        if len(self._dockercompose_models) == 0:
             raise UserWarning(f"No dockercompose build !")
+        self._check_the_services_references_of_the_dockercompose_models()
+        self._set_the_services_startup_dependencies()
+        self._set_deployed_status(True)
 
+    def _add_the_pil_network_definition_to_the_dockercompose_model(self, dockercompose_model: DockerComposeModel) -> NoReturn:
         pil_network_dict = self._deployment_dict.get(self.key_words["label_of_a_pil_section"], {}).get("pilNetwork", {})
         pil_subnet = pil_network_dict.get("subnet", None)
         if pil_subnet is None:
@@ -2736,20 +5260,49 @@ class PilDeployer(PilDeploymentDescriptionParser):
         if pil_gateway is None:
             raise UserWarning(f"The PIL network parameter 'gateway' is not defined")
 
-        dockercompose_lines = [
-            f'',
-            f'networks:',
-            f'    {self.pilCommonNetworkName}:',
-            f'        driver: bridge',
-            f'        ipam:',
-            f'            driver: default',
-            f'            config:',
-            f'                - subnet: {pil_subnet}',
-            f'                  gateway: {pil_gateway}',
-            f'',
-        ]
-
-        self._append_file_content(self._first_dockercompose_file_path, dockercompose_lines)
+        dockercompose_model.add_network(self.pilCommonNetworkName, {
+            "driver": "bridge",
+            "ipam": {
+                "driver": "default",
+                "config": [{"subnet": pil_subnet, "gateway": pil_gateway}],
+            },
+        })
+
+    def _check_the_services_references_of_the_dockercompose_models(self) -> NoReturn:
+        # All the dockercompose files are started in the same project, so a service can reference one of another file
+        service_names = set()
+        for dockercompose_model in self._dockercompose_models:
+            duplicated_service_names = service_names.intersection(dockercompose_model.servicesByName)
+            if len(duplicated_service_names) > 0:
+                raise UserWarning(f"The services {sorted(duplicated_service_names)} of the dockercompose file '{dockercompose_model.filePath.name}' are already defined")
+            service_names.update(dockercompose_model.servicesByName)
+
+        for dockercompose_model in self._dockercompose_models:
+            for service_name, referenced_service_names in dockercompose_model.get_the_referenced_service_names_by_service_name().items():
+                unknown_service_names = [referenced_service_name for referenced_service_name in referenced_service_names if referenced_service_name not in service_names]
+                if len(unknown_service_names) > 0:
+                    raise UserWarning(f"The service '{service_name}' of the dockercompose file '{dockercompose_model.filePath.name}' references the unknown services {unknown_service_names}")
+
+    def _set_the_services_startup_dependencies(self) -> NoReturn:
+        # Used at start to start the services by waves following the dependency graph
+        referenced_service_names_by_service_name = {}
+        container_name_by_service_name = {}
+        for dockercompose_model in self._dockercompose_models:
+            referenced_service_names_by_service_name.update(dockercompose_model.get_the_referenced_service_names_by_service_name())
+            container_name_by_service_name.update({service_name: service_dict.get("container_name", service_name) for service_name, service_dict in dockercompose_model.servicesByName.items()})
+
+        startup_stages = DockerComposeModel.get_the_startup_stages(referenced_service_names_by_service_name)
+        print(f"     - The {len(referenced_service_names_by_service_name)} services are started in {len(startup_stages)} dependency stages")
+
+        running_status_dict = self._deployment_dict.setdefault(self.runningDeploymentStatusKey, {})
+        running_status_dict[self.referencedServiceNamesByServiceNameKey] = referenced_service_names_by_service_name
+        running_status_dict[self.containerNameByServiceNameKey] = container_name_by_service_name
+
+    def _get_the_main_parent_component_group_dockercompose_model(self, dict_path: DictPath) -> DockerComposeModel:
+        main_parent_component_group_dockercompose_file_path = self._get_the_main_parent_component_group_dockercompose_file_path(dict_path)
+        if self._main_component_group_dockercompose_model is None or self._main_component_group_dockercompose_model.filePath != main_parent_component_group_dockercompose_file_path:
+            raise UserWarning(f"The dockercompose file '{main_parent_component_group_dockercompose_file_path.name}' is not under construction")
+        return self._main_component_group_dockercompose_model
 
     def _component_group_deployment_starting(self, dict_path: DictPath, path_based_dict: PathBasedDictionary) -> NoReturn:
         if not self._is_parent_group_is_the_main_parent_group(dict_path):
@@ -2757,35 +5310,29 @@ class PilDeployer(PilDeploymentDescriptionParser):
 
         main_parent_component_group_dockercompose_file_path = self._get_the_main_parent_component_group_dockercompose_file_path(dict_path)
 
-        self._main_component_group_dockercompose_final_lines = []
-
-        if self._first_dockercompose_file_path is None:
-            self._first_dockercompose_file_path = main_parent_component_group_dockercompose_file_path
-
         print(f"         - Make a PIL deployment of the '{main_parent_component_group_dockercompose_file_path.stem}' component group"
               f" and build the '{main_parent_component_group_dockercompose_file_path.relative_to(self.deploymentDirPath)}' file")
 
-        dockercompose_lines = [
-            f'# docker-compose -p pil-{main_parent_component_group_dockercompose_file_path.stem}-compose -f "{main_parent_component_group_dockercompose_file_path.name}" up --build -d',
-            f'# docker-compose -p pil-{main_parent_component_group_dockercompose_file_path.stem}-compose -f "{main_parent_component_group_dockercompose_file_path.name}" down --rmi all  --remove-orphans',
-            f'# docker exec -it pil-{main_parent_component_group_dockercompose_file_path.stem}-[container_type] bash',
-            f'',
-            f'version: "2.1"',
-            f'services:',
-            f'',
-        ]
+        self._main_component_group_dockercompose_model = DockerComposeModel(main_parent_component_group_dockercompose_file_path, [
+            f'docker-compose -p pil-{main_parent_component_group_dockercompose_file_path.stem}-compose -f "{main_parent_component_group_dockercompose_file_path.name}" up --build -d',
+            f'docker-compose -p pil-{main_parent_component_group_dockercompose_file_path.stem}-compose -f "{main_parent_component_group_dockercompose_file_path.name}" down --rmi all  --remove-orphans',
+            f'docker exec -it pil-{main_parent_component_group_dockercompose_file_path.stem}-[container_type] bash',
+        ])
 
-        self._initialize_file_content(main_parent_component_group_dockercompose_file_path, dockercompose_lines)
+        # The PIL network is defined by the first dockercompose file
+        if len(self._dockercompose_models) == 0:
+            self._add_the_pil_network_definition_to_the_dockercompose_model(self._main_component_group_dockercompose_model)
+        self._dockercompose_models.append(self._main_component_group_dockercompose_model)
 
     def _component_group_deployment_ending(self, dict_path: DictPath, path_based_dict: PathBasedDictionary) -> NoReturn:
         if not self._is_parent_group_is_the_main_parent_group(dict_path):
             return
 
-        main_parent_component_group_dockercompose_file_path = self._get_the_main_parent_component_group_dockercompose_file_path(dict_path)
+        dockercompose_model = self._get_the_main_parent_component_group_dockercompose_model(dict_path)
 
-        if len(self._main_component_group_dockercompose_final_lines) > 0:
-            print(f"         - Finalize the PIL deployment of the '{main_parent_component_group_dockercompose_file_path.stem}' component group")
-            self._append_file_content(main_parent_component_group_dockercompose_file_path, [''] + self._main_component_group_dockercompose_final_lines)
+        print(f"         - Finalize the PIL deployment of the '{dockercompose_model.filePath.stem}' component group")
+        dockercompose_model.write()
+        self._main_component_group_dockercompose_model = None
 
     def _component_group_database_deployment(self, dict_path: DictPath, path_based_dict: PathBasedDictionary) -> NoReturn:
         service_name_header = self._get_the_service_name_header(dict_path)
@@ -2812,42 +5359,39 @@ class PilDeployer(PilDeploymentDescriptionParser):
 
         print(f"             - Create the '{service_name}' service in the dockercompose file '{main_parent_component_group_dockercompose_file_path.relative_to(self.deploymentDirPath)}'")
 
-        syslog_is_enabled, _, _, _ = self._get_syslog_information(path_based_dict)
-
-        dockercompose_lines = [
-            f'    {service_name}:',
-            f'        image: pil-{service_name}:{pil_database_component_image_version}',
-            f'        container_name: pil-{service_name}',
-            f'        build:',
-            f'            context: ./{self.pilDockerFileFolderName}',
-            f'            dockerfile: pil-{component_name}.dockerfile',
-            f'        environment:',
-            f'            POSTGRES_PASSWORD: "postgres"',
-            f'            # Bug with the use of this parameter: POSTGRES_LOG_DEST: "[[ {str(syslog_is_enabled).lower()} ]] && \\"syslog\\" || \\"csvlog\\""',
-            f'            POSTGRES_AUTH_USERS: "postgres,atmosphere"',
-            f'            POSTGRES_LISTENING_PORT: "{database_port}"',
-        ]
-
-        dockercompose_lines += self._get_component_network_mode_dockercompose_lines(service_name, database_host)
-
-        dockercompose_lines += [
-            f'        healthcheck:',
-            f'            test: [ "CMD-SHELL", "pg_isready", "-q", "-h", "{database_host}", "-p", "{database_port}", "||", "exit", "1"]',
-            f'            timeout: 30s',
-            f'            interval: 10s',
-            f'            retries: 3',
-            f'        volumes:',
-            f'            - {service_name}:/var/lib/postgresql/data',
-            f'',
-        ]
-
-        self._append_file_content(main_parent_component_group_dockercompose_file_path, dockercompose_lines)
+        # Bug with the use of this parameter: POSTGRES_LOG_DEST: "[[ syslog_is_enabled ]] && \"syslog\" || \"csvlog\""
+        service_dict = {
+            "image": f"pil-{service_name}:{pil_database_component_image_version}",
+            "container_name": f"pil-{service_name}",
+            "build": {
+                "context": f"./{self.pilDockerFileFolderName}",
+                "dockerfile": f"pil-{component_name}.dockerfile",
+            },
+            "environment": {
+                "POSTGRES_PASSWORD": "postgres",
+                "POSTGRES_AUTH_USERS": "postgres,atmosphere",
+                "POSTGRES_LISTENING_PORT": f"{database_port}",
+            },
+        }
 
-        self._main_component_group_dockercompose_final_lines += [
-            f'volumes:',
-            f'    {service_name}:',
-            f'',
-        ]
+        service_dict.update(self._get_component_network_mode_dockercompose_dict(service_name, database_host))
+        service_dict.update(self._get_the_component_resource_limits_dockercompose_dict(self.pilDatabaseComponentName))
+
+        service_dict.update({
+            "healthcheck": {
+                "test": ["CMD-SHELL", "pg_isready", "-q", "-h", f"{database_host}", "-p", f"{database_port}", "||", "exit", "1"],
+                "timeout": "30s",
+                "interval": "10s",
+                "retries": 3,
+            },
+            "volumes": [f"{service_name}:/var/lib/postgresql/data"],
+        })
+
+        dockercompose_model = self._get_the_main_parent_component_group_dockercompose_model(dict_path)
+        dockercompose_model.add_service(service_name, service_dict)
+        dockercompose_model.add_volume(service_name)
+        self._set_the_service_dockerfile_name(service_name, service_dict)
+        self._set_the_service_resource_limits(service_name, service_dict)
 
     def _component_deployment_starting(self, dict_path: DictPath, path_based_dict: PathBasedDictionary) -> NoReturn:
         main_parent_component_group_dockercompose_file_path = self._get_the_main_parent_component_group_dockercompose_file_path(dict_path)
@@ -2868,8 +5412,6 @@ class PilDeployer(PilDeploymentDescriptionParser):
 
         print(f"- Create the '{service_name}' service in the dockercompose file '{main_parent_component_group_dockercompose_file_path.relative_to(self.deploymentDirPath)}'")
 
-        syslog_is_enabled, syslog_host, syslog_port, syslog_app_name_prefix = self._get_syslog_information(path_based_dict)
-
         gan_component_images_repository_path = self._deployment_dict.get(self.key_words["label_of_a_pil_section"], {}).get("dockerImagesInfo", {}).get("ganComponentImagesRepositoryPath", None)
         if gan_component_images_repository_path is None:
             raise UserWarning(f"The PIL gan component images repository path is not defined")
@@ -2878,21 +5420,19 @@ class PilDeployer(PilDeploymentDescriptionParser):
 
         print(f"             - Create the '{service_name}' service in the dockercompose file '{main_parent_component_group_dockercompose_file_path.relative_to(self.deploymentDirPath)}'")
 
-        syslog_is_enabled, syslog_host, syslog_port, syslog_app_name_prefix = self._get_syslog_information(path_based_dict)
-
-        dockercompose_lines = [
-            f'    {service_name}:',
-            f'        image: pil-{service_name}:{components_version}',
-            f'        container_name: {container_name}',
-            f'        build:',
-            f'            context: ./{self.pilDockerFileFolderName}',
-            f'            dockerfile: pil-{component_name}.dockerfile',
-            f'        environment:',
-        ]
+        service_environment_dict = {}
+        service_dict = {
+            "image": f"pil-{service_name}:{components_version}",
+            "container_name": container_name,
+            "build": {
+                "context": f"./{self.pilDockerFileFolderName}",
+                "dockerfile": f"pil-{component_name}.dockerfile",
+            },
+            "environment": service_environment_dict,
+        }
 
         for environment_name, environment_value in component_environment_variables_by_name.items():
-            environment_value_to_use = json.dumps(environment_value)
-            dockercompose_lines.append(f'            {environment_name}: {environment_value_to_use}')
+            service_environment_dict[environment_name] = environment_value if isinstance(environment_value, str) else json.dumps(environment_value)
 
         pil_postgres_password = self._deployment_dict.get(self.key_words["label_of_a_pil_section"], {}).get("dockerImagesInfo", {}).get("pilPostgresPassword", None)
         if pil_postgres_password is None:
@@ -2903,32 +5443,32 @@ class PilDeployer(PilDeploymentDescriptionParser):
             raise UserWarning(f"The PIL atmosphere user password is not defined")
 
         if "sqlHost" in component_environment_variables_by_name:
-            dockercompose_lines += [
-                f'            POSTGRES_PASSWORD: "{pil_postgres_password}"',
-                f'            PGPASSWORD: "{pil_postgres_password}"',
-                f'            ATMOSPHERE_PASSWORD: "{pil_atmosphere_password}"',
-            ]
-
-        dockercompose_lines += [f'            SYSLOG_ENABLED: "{str(syslog_is_enabled).lower()}"']
-        if syslog_is_enabled:
-            dockercompose_lines += [
-                f'            SYSLOG_HOST: "{syslog_host}"',
-                f'            SYSLOG_PORT: "{syslog_port}"',
-                f'            SYSLOG_APP_NAME_PREFIX: "{syslog_app_name_prefix}"',
-            ]
+            service_environment_dict.update({
+                "POSTGRES_PASSWORD": f"{pil_postgres_password}",
+                "PGPASSWORD": f"{pil_postgres_password}",
+                "ATMOSPHERE_PASSWORD": f"{pil_atmosphere_password}",
+            })
+
+        service_environment_dict["SYSLOG_ENABLED"] = str(self._pil_settings.syslogIsEnabled).lower()
+        if self._pil_settings.syslogIsEnabled:
+            service_environment_dict.update({
+                "SYSLOG_HOST": f"{self._pil_settings.syslogHost}",
+                "SYSLOG_PORT": f"{self._pil_settings.syslogPort}",
+                "SYSLOG_APP_NAME_PREFIX": f"{self._pil_settings.syslogAppNamePrefix}",
+            })
         else:
-            dockercompose_lines += [
-                f'            SYSLOG_HOST: "NOT_USED"',
-                f'            SYSLOG_PORT: "NOT_USED"',
-                f'            SYSLOG_APP_NAME_PREFIX: "NOT_USED"',
-            ]
+            service_environment_dict.update({
+                "SYSLOG_HOST": "NOT_USED",
+                "SYSLOG_PORT": "NOT_USED",
+                "SYSLOG_APP_NAME_PREFIX": "NOT_USED",
+            })
 
         component_host = component_environment_variables_by_name.get("host", None)
         if component_host is None:
             raise UserWarning(f"The '{dict_path}' component parameter 'host' is not defined")
-        dockercompose_lines += self._get_component_network_mode_dockercompose_lines(service_name, component_host)
+        service_dict.update(self._get_component_network_mode_dockercompose_dict(service_name, component_host))
+        service_dict.update(self._get_the_component_resource_limits_dockercompose_dict(component_name))
 
-        self._append_file_content(main_parent_component_group_dockercompose_file_path, dockercompose_lines)
         # Add a dependency on the database to start the backend after the database
         # (except for workstation which has no dependency on the database)
         if self._get_container_group(container_name) != "workstation":
@@ -2936,20 +5476,57 @@ class PilDeployer(PilDeploymentDescriptionParser):
             database_parents_component_groups_names = self._get_parents_component_groups_names(database_dict_path)
             database_parents_component_groups_names.reverse()
             database_service_name_header = "-".join(database_parents_component_groups_names)
+            database_service_name = self._get_component_associated_service_name(database_service_name_header, self.pilDatabaseComponentName).lower()
+
+            service_dict.update({
+                "privileged": True,
+                "depends_on": {
+                    database_service_name: {"condition": "service_healthy"},
+                },
+            })
+
+        self._get_the_main_parent_component_group_dockercompose_model(dict_path).add_service(service_name, service_dict)
+        self._set_the_service_dockerfile_name(service_name, service_dict)
+        self._set_the_service_resource_limits(service_name, service_dict)
+
+    def _set_the_service_dockerfile_name(self, service_name: str, service_dict: dict) -> NoReturn:
+        # Used at start to build only one image by dockerfile, shared by all the services of the same component
+        running_status_dict = self._deployment_dict.setdefault(self.runningDeploymentStatusKey, {})
+        running_status_dict.setdefault(self.dockerfileNameByServiceNameKey, {})[service_name] = service_dict["build"]["dockerfile"]
+
+    def _set_the_service_resource_limits(self, service_name: str, service_dict: dict) -> NoReturn:
+        # Used at start to check the sum of the limits against the docker host capacity
+        resource_limits_dict = {dockercompose_key: service_dict[dockercompose_key] for dockercompose_key in self.dockercomposeResourceLimitKeyByDescriptionKey.values()
+                                if dockercompose_key in service_dict}
+        if len(resource_limits_dict) > 0:
+            running_status_dict = self._deployment_dict.setdefault(self.runningDeploymentStatusKey, {})
+            running_status_dict.setdefault(self.resourceLimitsByServiceNameKey, {})[service_name] = resource_limits_dict
+
+    def _get_the_component_resource_limits_dockercompose_dict(self, component_name: str) -> dict:
+        """
+        Give the container resource limits of the component, each one defined in the 'dockerContainersInfo' by component name or by '--default--'
+        """
+        resource_limits_dict = {}
+        for description_key, dockercompose_key in self.dockercomposeResourceLimitKeyByDescriptionKey.items():
+            resource_limit_value = self._pil_settings.get_the_container_option_value(description_key, component_name)
+            if resource_limit_value is None:
+                continue
 
-            dockercompose_lines += [
-                f'        privileged: true',
-                f'        depends_on:',
-                f'            {self._get_component_associated_service_name(database_service_name_header, self.pilDatabaseComponentName)}:',
-                f'                condition: service_healthy',
-                f'',
-            ]
-
-            dockercompose_lines += [f'']
-            self._append_file_content(main_parent_component_group_dockercompose_file_path, dockercompose_lines)
-
-
-
+            try:
+                if description_key == "cpus":
+                    resource_limit_value = float(resource_limit_value)
+                    if resource_limit_value <= 0:
+                        raise ValueError("not positive")
+                elif description_key == "pidsLimit":
+                    resource_limit_value = int(resource_limit_value)
+                elif description_key == "memLimit":
+                    self._get_the_memory_size_in_bytes(resource_limit_value)
+                elif description_key == "cpuset":
+                    self._get_the_cpuset_cpu_indexes(resource_limit_value)
+            except (TypeError, ValueError, UserWarning) as e:
+                raise UserWarning(f"The '{component_name}' container parameter '{description_key}' value '{resource_limit_value}' is not valid: {e}")
+            resource_limits_dict[dockercompose_key] = resource_limit_value
+        return resource_limits_dict
 
     def _create_the_associated_component_pil_dockerfile(self, component_name: str, components_version: str, image_repository: str):
         dockerfile_path = self.dockerfilesDirPath / f"pil-{component_name}.dockerfile"
@@ -2976,52 +5553,7 @@ class PilDeployer(PilDeploymentDescriptionParser):
             f'',
         ]
 
-        env_java_tool_options = []
-        gan_docker_containers_java_options_xms = self._deployment_dict.get(self.key_words["label_of_a_pil_section"],{}).get("dockerContainersInfo", {}).get("javaOptionXms", {})
-        jaeger_docker_containers_java_options_xms = self._deployment_dict.get(self.key_words["label_of_a_jaeger_section"],{}).get("dockerContainersInfo", {}).get("javaOptionXms", {})
-
-        if component_name in gan_docker_containers_java_options_xms:
-            component_xms_value : Any = gan_docker_containers_java_options_xms[component_name]
-        elif component_name in jaeger_docker_containers_java_options_xms:
-            component_xms_value : Any = jaeger_docker_containers_java_options_xms[component_name]
-        else:
-            component_xms_value = None
-
-        if component_xms_value is not None:
-            env_java_tool_options.append("-Xms" + component_xms_value)
-        else:
-            if "--default--" in gan_docker_containers_java_options_xms:
-                default_xms_value : Any = gan_docker_containers_java_options_xms["--default--"]
-            elif "--default--" in jaeger_docker_containers_java_options_xms:
-                default_xms_value : Any = jaeger_docker_containers_java_options_xms["--default--"]
-            else:
-                default_xms_value = None
-
-            if default_xms_value is not None:
-                env_java_tool_options.append("-Xms" + default_xms_value)
-
-        gan_docker_containers_java_options_xmx = self._deployment_dict.get(self.key_words["label_of_a_pil_section"], {}).get("dockerContainersInfo", {}).get("javaOptionXmx", {})
-        jaeger_docker_containers_java_options_xmx = self._deployment_dict.get(self.key_words["label_of_a_jaeger_section"],{}).get("dockerContainersInfo", {}).get("javaOptionXmx", {})
-
-        if component_name in gan_docker_containers_java_options_xmx:
-            component_xmx_value = gan_docker_containers_java_options_xmx[component_name]
-        elif component_name in jaeger_docker_containers_java_options_xmx:
-            component_xmx_value = jaeger_docker_containers_java_options_xmx[component_name]
-        else:
-            component_xmx_value = None
-
-        if component_xmx_value is not None:
-            env_java_tool_options.append("-Xmx" + component_xmx_value)
-        else:
-            if "--default--" in gan_docker_containers_java_options_xmx:
-                default_xmx_value = gan_docker_containers_java_options_xmx["--default--"]
-            elif "--default--" in jaeger_docker_containers_java_options_xmx:
-                default_xmx_value = jaeger_docker_containers_java_options_xmx["--default--"]
-            else:
-                default_xmx_value = None
-
-            if default_xmx_value is not None:
-                env_java_tool_options.append("-Xmx" + default_xmx_value)
+        env_java_tool_options = self._pil_settings.get_the_java_tool_options(component_name)
 
         if len(env_java_tool_options) > 0:
             dockerfile_lines += [
@@ -3039,50 +5571,6 @@ class PilDeployer(PilDeploymentDescriptionParser):
             print(f"             - Write '{file_path.relative_to(self.deploymentDirPath)}' file failed: ", e)
             raise UserWarning(f"Write '{file_path.relative_to(self.deploymentDirPath)}' file failed: {e}")
 
-    def _append_file_content(self, file_path: Path, content_lines: List[str]) -> NoReturn:
-        try:
-            with file_path.open("a", newline="\n") as target:
-                target.writelines("\n".join(content_lines))
-        except (OSError, TypeError, ValueError) as e:
-            print(f"             - Append '{file_path.relative_to(self.deploymentDirPath)}' file failed: ", e)
-            raise UserWarning(f"Append '{file_path.relative_to(self.deploymentDirPath)}' file failed: {e}")
-
-    def _get_syslog_information(self, path_based_dict: PathBasedDictionary) -> tuple:
-        pil_section_dict = path_based_dict.get_the_value_pointed_by_a_dict_path(
-            DictPath(from_dict_path_as_list=[self.key_words["label_of_a_pil_section"]]))
-        jaeger_section_dict=path_based_dict.get_the_value_pointed_by_a_dict_path(
-            DictPath(from_dict_path_as_list=[self.key_words["label_of_a_jaeger_section"]]))
-        syslog_dict = pil_section_dict.get("syslog", None)
-        syslog_dict_jaeger = jaeger_section_dict.get("syslog", None)
-        if syslog_dict is None and syslog_dict_jaeger is None:
-            raise UserWarning(f"The PIL syslog information are not present")
-
-        is_enabled = syslog_dict.get("isEnabled", None)
-        is_enabled_jaeger=syslog_dict_jaeger.get("isEnabled", None)
-        if is_enabled is None and is_enabled_jaeger is None:
-            raise UserWarning(f"The PIL syslog information 'is_enabled' is not defined")
-
-        if is_enabled is not True and is_enabled_jaeger is not True:
-            #return is_enabled, None, None, None, is_enabled_jaeger
-            return is_enabled, None, None, None
-        host = syslog_dict.get("host", None)
-        host_jaeger=syslog_dict_jaeger.get("host", None)
-        if host is None and host_jaeger is None:
-            raise UserWarning(f"The PIL syslog information 'host' is not defined")
-
-        port = syslog_dict.get("port", None)
-        port_jaeger=syslog_dict_jaeger.get("port", None)
-        if port is None and port_jaeger is None:
-            raise UserWarning(f"The PIL syslog information 'port' is not defined")
-
-        app_name_prefix = syslog_dict.get("appNamePrefix", None)
-        app_name_prefix_jaeger=syslog_dict_jaeger.get("appNamePrefix", None)
-        if app_name_prefix is None and app_name_prefix_jaeger is None:
-            raise UserWarning(f"The PIL syslog information 'appNamePrefix' is not defined")
-
-       # return is_enabled, host, port, app_name_prefix, is_enabled_jaeger,host_jaeger,port_jaeger,app_name_prefix_jaeger
-        return is_enabled, host, port, app_name_prefix
-
     @staticmethod
     def _get_component_associated_image_name(component_name: str, components_version: str, image_repository: str) -> str:
         if "gan-docker" in image_repository:
@@ -3091,35 +5579,42 @@ class PilDeployer(PilDeploymentDescriptionParser):
             component_associated_image_name = f"{image_repository}-{component_name}:{components_version}"
         return component_associated_image_name
 
-    def _get_component_network_mode_dockercompose_lines(self, component_service_name: str, component_ip_address: str) -> List[str]:
+    def _get_component_network_mode_dockercompose_dict(self, component_service_name: str, component_ip_address: str) -> dict:
         if component_ip_address in self._first_service_by_ip_address_on_all_dockercomposes:
             service_name = self._first_service_by_ip_address_on_all_dockercomposes[component_ip_address]
-            return self._get_component_network_mode_dockercompose_lines_with_service_format(service_name)
+            return self._get_component_network_mode_dockercompose_dict_with_service_format(service_name)
         else:
             self._first_service_by_ip_address_on_all_dockercomposes[component_ip_address] = component_service_name
-            return self._get_component_network_mode_dockercompose_lines_with_network_format(self.pilCommonNetworkName, component_ip_address)
+            return self._get_component_network_mode_dockercompose_dict_with_network_format(self.pilCommonNetworkName, component_ip_address)
 
     @staticmethod
-    def _get_component_network_mode_dockercompose_lines_with_network_format(network_name: str, ipv4_address: str) -> List[str]:
-        dockercompose_lines = [
-            f'        networks:',
-            f'            {network_name}:',
-            f'                ipv4_address: "{ipv4_address}"',
-        ]
-        return dockercompose_lines
+    def _get_component_network_mode_dockercompose_dict_with_network_format(network_name: str, ipv4_address: str) -> dict:
+        return {"networks": {network_name: {"ipv4_address": f"{ipv4_address}"}}}
 
     @staticmethod
-    def _get_component_network_mode_dockercompose_lines_with_service_format(service_name: str) -> List[str]:
-        dockercompose_lines = [f'        network_mode: "service:{service_name}"']
-        return dockercompose_lines
+    def _get_component_network_mode_dockercompose_dict_with_service_format(service_name: str) -> dict:
+        return {"network_mode": f"service:{service_name}"}
 
 
 class PilRunning(PilDeploymentDescriptionParser):
+    imageBuildParallelism = 4
+    imageTagHashLength = 16
+    logCollectionParallelism = 8
+    containerComponentsFolderPath = "/usr/gan-ms"
+    dockerLogsCollectionsJsonFileName = "docker-logs-collections.json"
+    followLogFolderName = "follow"
+    followLogLineMaxSize = 1024 * 1024
+    startupWaveWidth = 8
+    startupWaveTimeoutInSeconds = 300
+    startupWavePollingIntervalInSeconds = 2
+
     def __init__(self, deployment_folder_path: Path):
         PilDeploymentDescriptionParser.__init__(self, deployment_folder_path)
         self._actionToBePerformed = None
+        self._containersToCollectLogsFrom = []
 
-    def save_the_basic_docker_images_used(self) -> NoReturn:
+    def save_the_basic_docker_images_used(self, pull_parallelism: int = None, force_pull: bool = False, transfer_parallelism: int = None,
+                                          bundle_cache: DockerImageBundleCache = None) -> NoReturn:
         if platform.system() == "Windows":
             print(" - Not allowed on Windows")
             return
@@ -3128,30 +5623,35 @@ class PilRunning(PilDeploymentDescriptionParser):
             print(" - The gan components dockercompose files are not created")
             return
 
-        used_docker_images, used_docker_images_hash = self._get_the_used_docker_images_list_and_hash()
-
-        file_path = self.pilDirPath / f"pil-docker-images-{used_docker_images_hash}.tar.gz"
+        used_docker_images, _ = self._get_the_used_docker_images_list_and_hash()
 
         print(f" - Pull the docker images")
-        for used_docker_image in used_docker_images:
-            print(f"      - Pull {used_docker_image}")
-            command_text = "docker pull " + used_docker_image
-            log_file_path = self.pilDirPath / "pull-docker-images.log"
-            log_file_path.parent.mkdir(parents=True, exist_ok=True)
-            complete_process = run_subprocess(log_file_path, command_text, current_working_directory=self.pilDirPath, shell=True)
-            if complete_process.returncode != 0:
-                print(f"        ! Pull docker image {used_docker_image} failed")
-                return
-
-        print(f" - Save the docker images")
-        command_text = "docker save " + " ".join(used_docker_images) + f' | gzip > "{file_path}"'
-        log_file_path = self.pilDirPath / "save-docker-images.log"
-        log_file_path.parent.mkdir(parents=True, exist_ok=True)
-        complete_process = run_subprocess(log_file_path, command_text, current_working_directory=self.pilDirPath, shell=True)
-        if complete_process.returncode != 0:
-            print(f"        ! Save docker images failed")
+        if not self._pull_the_used_docker_images(used_docker_images, pull_parallelism, force_pull):
+            return
 
-    def load_the_basic_docker_images_to_used(self, file_to_load: Path, do_not_check_the_used_components_hash: bool = False) -> NoReturn:
+        # The bundle identity is given by the digests, resolved by the pull
+        _, used_docker_images_hash = self._get_the_used_docker_images_list_and_hash()
+        bundle_cache = bundle_cache or DockerImageBundleCache()
+        bundle_dir_path = bundle_cache.get_the_bundle_dir_path(used_docker_images_hash)
+        docker_image_bundle = DockerImageBundle(bundle_dir_path, transfer_parallelism)
+        # Another deployer saving the same bundle is waited for, so its images are not exported twice
+        docker_image_bundle.lock()
+        try:
+            if {image_entry["name"] for image_entry in docker_image_bundle.read_the_manifest().get("images", [])} == set(used_docker_images):
+                print(f" - The docker images bundle '{bundle_dir_path}' is already in the cache")
+            else:
+                print(f" - Save the docker images into the bundle '{bundle_dir_path}'")
+                digest_by_image_name = self._get_running_status_from_running_deployment_dict(self.dockerImagesDigestByNameKey, default_value={})
+                if not docker_image_bundle.save(used_docker_images, digest_by_image_name, bundle_cache.get_the_image_file_path_by_identifier()):
+                    print(f"        ! Save docker images failed")
+                    return
+            bundle_cache.mark_the_bundle_as_used(bundle_dir_path)
+        finally:
+            docker_image_bundle.unlock()
+        bundle_cache.evict_the_least_recently_used_bundles(bundle_dir_path)
+
+    def load_the_basic_docker_images_to_used(self, file_to_load: Optional[Path], do_not_check_the_used_components_hash: bool = False, transfer_parallelism: int = None,
+                                             bundle_cache: DockerImageBundleCache = None) -> NoReturn:
         if platform.system() == "Windows":
             print(" - Not allowed on Windows")
             return
@@ -3160,17 +5660,76 @@ class PilRunning(PilDeploymentDescriptionParser):
             print(" - The gan components dockercompose files are not created")
             return
 
-        if not file_to_load.is_file():
-            print(" - The given path doesn't exist or it isn't a file path")
+        used_docker_images, used_docker_images_hash = self._get_the_used_docker_images_list_and_hash()
+        bundle_cache = bundle_cache or DockerImageBundleCache()
+
+        # Without a given path, the bundle is the cached one of the used images digests
+        if file_to_load is None:
+            if used_docker_images_hash is None:
+                print(" - The used docker images digests are not known, so give the docker images bundle to load")
+                return
+            file_to_load = bundle_cache.get_the_bundle_dir_path(used_docker_images_hash)
+
+        # A bundle is given by its folder or its manifest, a file is a former 'docker save | gzip' archive
+        if file_to_load.name == DockerImageBundle.manifestFileName:
+            file_to_load = file_to_load.parent
+        if not file_to_load.is_file() and not (file_to_load / DockerImageBundle.manifestFileName).is_file():
+            print(f" - The path '{file_to_load}' doesn't exist or it isn't a docker images bundle or file path")
             return
 
-        _, used_docker_images_hash = self._get_the_used_docker_images_list_and_hash()
+        if file_to_load.is_dir():
+            image_entries = DockerImageBundle(file_to_load).read_the_manifest().get("images", [])
+            image_digests = [image_entry.get("digest", None) for image_entry in image_entries]
+            bundle_identity = DockerImageBundleCache.get_the_bundle_identity(image_digests) if None not in image_digests else None
+            if not do_not_check_the_used_components_hash:
+                missing_docker_images = set(used_docker_images).difference(image_entry["name"] for image_entry in image_entries)
+                if len(missing_docker_images) > 0:
+                    print(f" ! The docker images bundle doesn't contain the used docker images {sorted(missing_docker_images)}")
+                    return
+                if used_docker_images_hash is not None and bundle_identity is not None and bundle_identity != used_docker_images_hash:
+                    print(" ! The docker images bundle has not the digests of the used docker images")
+                    return
+
+            # A bundle got from elsewhere is kept in the cache, so it is not transferred again
+            if bundle_identity is not None and bundle_cache.cacheDirPath not in file_to_load.resolve().parents:
+                cached_bundle_dir_path = bundle_cache.get_the_bundle_dir_path(bundle_identity)
+                cached_docker_image_bundle = DockerImageBundle(cached_bundle_dir_path)
+                cached_docker_image_bundle.lock()
+                try:
+                    if not (cached_bundle_dir_path / DockerImageBundle.manifestFileName).exists():
+                        # The manifest is written last, so the bundle is not used by another deployer before its archives are complete
+                        print(f" - Copy the docker images bundle into the cache '{cached_bundle_dir_path}'")
+                        shutil.copytree(str(file_to_load), str(cached_bundle_dir_path), dirs_exist_ok=True,
+                                        ignore=shutil.ignore_patterns(DockerImageBundle.manifestFileName, DockerImageBundle.lockFileName))
+                        cached_docker_image_bundle.write_the_manifest(DockerImageBundle(file_to_load).read_the_manifest())
+                finally:
+                    cached_docker_image_bundle.unlock()
+                file_to_load = cached_bundle_dir_path
+
+            print(f" - Load the docker images from '{file_to_load}'")
+            docker_image_bundle = DockerImageBundle(file_to_load, transfer_parallelism)
+            is_in_the_cache = bundle_cache.cacheDirPath in file_to_load.resolve().parents
+            # The bundle of the cache is not evicted by another deployer while it is loaded
+            if is_in_the_cache:
+                docker_image_bundle.lock(is_exclusive=False)
+            try:
+                if not docker_image_bundle.load():
+                    print(f"        ! Load docker images failed")
+                if is_in_the_cache:
+                    bundle_cache.mark_the_bundle_as_used(file_to_load)
+            finally:
+                docker_image_bundle.unlock()
+            if is_in_the_cache:
+                bundle_cache.evict_the_least_recently_used_bundles(file_to_load)
+            return
 
-        if not do_not_check_the_used_components_hash and used_docker_images_hash not in file_to_load.name:
+        # The former files are named by the hash of the used images names, not by the hash of their digests
+        if not do_not_check_the_used_components_hash and self._get_the_used_docker_images_names_hash(used_docker_images) not in file_to_load.name:
             print(" ! The gan components dockercompose files have not the expected hash")
             return
 
         print(f" - Load the docker images from '{file_to_load}'")
+
         command_text = f'docker load -i "{file_to_load}"'
         log_file_path = self.pilDirPath / "load-docker-images.log"
         log_file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -3203,14 +5762,43 @@ class PilRunning(PilDeploymentDescriptionParser):
             if complete_process.returncode != 0:
                 print(f"        ! Remove docker image {used_docker_image} failed")
 
-    def _get_the_used_docker_images_list_and_hash(self):
-        used_docker_images = self._get_running_status_from_running_deployment_dict(self.listOfDockerImagesUsedKey, default_value=[])
+    def _pull_the_used_docker_images(self, used_docker_images: List[str], pull_parallelism: int = None, force_pull: bool = False) -> bool:
+        # The images whose local digest is the recorded one are not pulled again
+        recorded_digest_by_image_name = {} if force_pull else self._get_running_status_from_running_deployment_dict(self.dockerImagesDigestByNameKey, default_value={})
+        pull_manager = DockerImagePullManager(self.pilDirPath / "pull-docker-images", pull_parallelism)
+        digest_by_image_name = pull_manager.pull_the_images(used_docker_images, recorded_digest_by_image_name)
+
+        failed_image_names = [image_name for image_name, digest in digest_by_image_name.items() if digest is None]
+        self._read_the_running_deployment_dict()
+        recorded_digest_by_image_name = self._get_running_status_from_running_deployment_dict(self.dockerImagesDigestByNameKey, default_value={})
+        recorded_digest_by_image_name.update({image_name: digest for image_name, digest in digest_by_image_name.items() if digest is not None})
+        self._set_running_status_to_running_deployment_dict(self.dockerImagesDigestByNameKey, recorded_digest_by_image_name)
+
+        if len(failed_image_names) > 0:
+            print(f"        ! Pull docker images {failed_image_names} failed")
+            return False
+        return True
+
+    @staticmethod
+    def _get_the_used_docker_images_names_hash(used_docker_images: List[str]) -> str:
         hash_builder = hashlib.sha256()
         for used_docker_image in used_docker_images:
             hash_builder.update(used_docker_image.encode())
-        return used_docker_images, hash_builder.hexdigest()
+        return hash_builder.hexdigest()
 
-    def start(self, keep_the_intermediate_images=False) -> NoReturn:
+    def _get_the_used_docker_images_list_and_hash(self) -> Tuple[List[str], Optional[str]]:
+        """
+        Give the used docker images and the identity of their content, None while one of their digests is not known
+        """
+        used_docker_images = self._get_running_status_from_running_deployment_dict(self.listOfDockerImagesUsedKey, default_value=[])
+        digest_by_image_name = self._get_running_status_from_running_deployment_dict(self.dockerImagesDigestByNameKey, default_value={})
+        used_docker_images_digests = [digest_by_image_name.get(used_docker_image, None) for used_docker_image in used_docker_images]
+        if None in used_docker_images_digests:
+            return used_docker_images, None
+        return used_docker_images, DockerImageBundleCache.get_the_bundle_identity(used_docker_images_digests)
+
+    def start(self, keep_the_intermediate_images=False, image_build_parallelism: int = None, startup_wave_width: int = None,
+              startup_wave_timeout_in_seconds: int = None, allow_resources_overcommit: bool = False) -> NoReturn:
         if platform.system() == "Windows":
             print(" - Not allowed on Windows")
             return
@@ -3223,29 +5811,221 @@ class PilRunning(PilDeploymentDescriptionParser):
             print(" - Gan components containers are already running")
             return
 
-        dockercompose_path_results: List[Path] = list(self.pilDirPath.glob(f"./*.dockercompose"))
+        if not self._check_the_resource_limits_against_the_docker_host_capacity(allow_resources_overcommit):
+            return
+
+        if not self._build_the_changed_docker_images(image_build_parallelism):
+            print(f"        ! Build PIL docker images failed")
+            return
 
         print(f" - Start PIL")
-        command_arguments = ["docker-compose", "-p", "pil-session"]
+        referenced_service_names_by_service_name = self._get_running_status_from_running_deployment_dict(self.referencedServiceNamesByServiceNameKey, default_value={})
+        if len(referenced_service_names_by_service_name) == 0:
+            print(f"     - No services dependency graph known, so all the services are started at once")
+            is_started = self._start_the_services(None, keep_the_intermediate_images)
+            if not is_started:
+                print(f"        ! Start PIL dockercomposes failed")
+        else:
+            is_started = self._start_the_services_by_waves(referenced_service_names_by_service_name, keep_the_intermediate_images, startup_wave_width, startup_wave_timeout_in_seconds)
 
-        for dockercompose_path in dockercompose_path_results:
-            command_arguments += ["-f", dockercompose_path.name]
+        if not is_started:
+            self._remove_the_partially_started_services()
+            return
+
+        self._read_the_running_deployment_dict()
+        self._set_gan_components_running_status(True)
+
+    def _remove_the_partially_started_services(self) -> NoReturn:
+        # Without a running status, the started containers couldn't be stopped by the stop, so they are removed once their logs are got
+        print(f" - Remove the started PIL services, their logs are kept in '{self.logDirPath}'")
+        self.logDirPath.mkdir(parents=True, exist_ok=True)
+        self._get_container_log()
+
+        command_arguments = self._get_the_dockercompose_command_arguments() + ["down", "--remove-orphans"]
+        complete_process = run_subprocess(self.pilDirPath / "pil-session.log", command_arguments, current_working_directory=self.pilDirPath)
+        if complete_process.returncode != 0:
+            print(f"        ! Remove the started PIL services failed")
+
+    def _check_the_resource_limits_against_the_docker_host_capacity(self, allow_resources_overcommit: bool = False) -> bool:
+        resource_limits_by_service_name = self._get_running_status_from_running_deployment_dict(self.resourceLimitsByServiceNameKey, default_value={})
+        if len(resource_limits_by_service_name) == 0:
+            return True
+
+        complete_process = subprocess.run(["docker", "info", "--format", "{{.NCPU}} {{.MemTotal}}"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+        try:
+            host_cpus_count, host_memory_size = [int(value) for value in complete_process.stdout.split()]
+        except ValueError:
+            print(f"        ! Get the docker host capacity failed, so the containers resource limits are not checked: {complete_process.stderr.strip()}")
+            return True
+
+        cpus_sum = sum(float(resource_limits.get("cpus", 0)) for resource_limits in resource_limits_by_service_name.values())
+        memory_size_sum = sum(self._get_the_memory_size_in_bytes(resource_limits.get("mem_limit", 0)) for resource_limits in resource_limits_by_service_name.values())
+        print(f" - Check the containers resource limits against the docker host capacity: {cpus_sum:g}/{host_cpus_count} cpus and "
+              f"{memory_size_sum // 1024 ** 2}/{host_memory_size // 1024 ** 2} MB of memory")
+
+        # A cpuset out of the host cpus makes the container creation fail, whatever the overcommit allowance
+        is_valid = True
+        for service_name, resource_limits in sorted(resource_limits_by_service_name.items()):
+            if "cpuset" in resource_limits and max(self._get_the_cpuset_cpu_indexes(resource_limits["cpuset"])) >= host_cpus_count:
+                print(f"        ! The '{service_name}' service cpuset '{resource_limits['cpuset']}' is out of the {host_cpus_count} docker host cpus")
+                is_valid = False
+
+        overcommit_messages = []
+        if cpus_sum > host_cpus_count:
+            overcommit_messages.append(f"The sum of the cpus limits ({cpus_sum:g}) is above the docker host cpus ({host_cpus_count})")
+        if memory_size_sum > host_memory_size:
+            overcommit_messages.append(f"The sum of the memory limits ({memory_size_sum // 1024 ** 2} MB) is above the docker host memory ({host_memory_size // 1024 ** 2} MB)")
+        for overcommit_message in overcommit_messages:
+            print(f"        ! {overcommit_message}{', allowed' if allow_resources_overcommit else ''}")
+        return is_valid and (allow_resources_overcommit or len(overcommit_messages) == 0)
+
+    def _start_the_services_by_waves(self, referenced_service_names_by_service_name: Dict[str, List[str]], keep_the_intermediate_images: bool,
+                                     startup_wave_width: int = None, startup_wave_timeout_in_seconds: int = None) -> bool:
+        """
+        Start the services of each dependency stage by waves of at most the given width,
+        each wave being started once the containers of the previous one are healthy (or only running, or exited successfully, without healthcheck)
+        """
+        startup_wave_width = startup_wave_width or self.startupWaveWidth
+        startup_wave_timeout_in_seconds = startup_wave_timeout_in_seconds or self.startupWaveTimeoutInSeconds
+        container_name_by_service_name = self._get_running_status_from_running_deployment_dict(self.containerNameByServiceNameKey, default_value={})
+
+        startup_waves = []
+        for startup_stage in DockerComposeModel.get_the_startup_stages(referenced_service_names_by_service_name):
+            startup_waves += [startup_stage[index:index + startup_wave_width] for index in range(0, len(startup_stage), startup_wave_width)]
+
+        for wave_index, service_names in enumerate(startup_waves, start=1):
+            print(f"     - Start the wave {wave_index}/{len(startup_waves)} of {len(service_names)} services: {', '.join(service_names)}")
+            if not self._start_the_services(service_names, keep_the_intermediate_images):
+                print(f"        ! Start the wave {wave_index} services failed")
+                return False
+
+            container_names = [container_name_by_service_name.get(service_name, service_name) for service_name in service_names]
+            if not self._wait_for_the_containers_to_be_healthy(container_names, startup_wave_timeout_in_seconds):
+                print(f"        ! The wave {wave_index} services are not healthy, so the next waves are not started")
+                return False
+        return True
 
-        command_arguments += ["up", "-d"]
+    def _start_the_services(self, service_names: Optional[List[str]], keep_the_intermediate_images: bool) -> bool:
+        command_arguments = self._get_the_dockercompose_command_arguments()
+
+        # The images are already built, so the dockercompose files builds are not used
+        command_arguments += ["up", "-d", "--no-build"]
 
         if not keep_the_intermediate_images:
-            command_arguments += ["--build", "--force-recreate"]
+            command_arguments += ["--force-recreate"]
+
+        # The dependencies are started by the previous waves
+        if service_names is not None:
+            command_arguments += ["--no-deps"] + service_names
 
         log_file_path = self.pilDirPath / "pil-session.log"
         log_file_path.parent.mkdir(parents=True, exist_ok=True)
         complete_process = run_subprocess(log_file_path, command_arguments, current_working_directory=self.pilDirPath)
-        if complete_process.returncode != 0:
-            print(f"        ! Start PIL dockercomposes failed")
+        return complete_process.returncode == 0
+
+    def _wait_for_the_containers_to_be_healthy(self, container_names: List[str], timeout_in_seconds: int) -> bool:
+        deadline = time.time() + timeout_in_seconds
+        waited_container_names = list(container_names)
+        while True:
+            complete_process = subprocess.run(["docker", "inspect", "--format", "{{.Name}} {{.State.Status}} {{.State.ExitCode}} {{if .State.Health}}{{.State.Health.Status}}{{end}}"] + waited_container_names,
+                                              stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+            if complete_process.returncode != 0:
+                print(f"        ! Inspect the containers {waited_container_names} failed: {complete_process.stderr.strip()}")
+                return False
 
-        self._read_the_running_deployment_dict()
-        self._set_gan_components_running_status(True)
+            for line in complete_process.stdout.splitlines():
+                container_name, container_status, exit_code, health_status = (line.split() + ["", "", "", ""])[:4]
+                container_name = container_name.lstrip("/")
+                # A container without healthcheck which exited successfully is a one-shot task (like an initialization) which is done
+                is_done = container_status == "exited" and exit_code == "0" and health_status == ""
+                if (container_status != "running" and not is_done) or health_status == "unhealthy":
+                    print(f"        ! The container '{container_name}' is {health_status or container_status}" + (f" (exit code {exit_code})" if container_status == "exited" else ""))
+                    return False
+                if health_status in ("", "healthy") and container_name in waited_container_names:
+                    waited_container_names.remove(container_name)
+
+            if len(waited_container_names) == 0:
+                return True
+            if time.time() > deadline:
+                print(f"        ! The containers {waited_container_names} are not healthy after {timeout_in_seconds} seconds")
+                return False
+            time.sleep(self.startupWavePollingIntervalInSeconds)
+
+    def _build_the_changed_docker_images(self, image_build_parallelism: int = None) -> bool:
+        """
+        Build one image by dockerfile, tagged by the hash of the dockerfile content and of its base image identifier,
+        so only the images whose hash changed are built (in parallel), and write the dockercompose file giving them to the services.
+        """
+        dockerfile_name_by_service_name = self._get_running_status_from_running_deployment_dict(self.dockerfileNameByServiceNameKey, default_value={})
+        if len(dockerfile_name_by_service_name) == 0:
+            print(f" - No dockerfile by service known, so the images are built by docker-compose")
+            (self.pilDirPath / self.dockerImagesOverrideFileName).unlink(missing_ok=True)
+            return True
+
+        dockerfile_names = sorted(set(dockerfile_name_by_service_name.values()))
+        image_build_parallelism = image_build_parallelism or self.imageBuildParallelism
+        print(f" - Build the PIL docker images of the {len(dockerfile_names)} dockerfiles (parallelism: {image_build_parallelism})")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=image_build_parallelism) as executor:
+            image_tags = list(executor.map(self._build_the_docker_image_if_changed, dockerfile_names))
+        if None in image_tags:
+            return False
+
+        image_tag_by_dockerfile_name = dict(zip(dockerfile_names, image_tags))
+        dockercompose_model = DockerComposeModel(self.pilDirPath / self.dockerImagesOverrideFileName, ["Images built from the dockerfiles hash, generated at start"])
+        for service_name, dockerfile_name in dockerfile_name_by_service_name.items():
+            dockercompose_model.add_service(service_name, {"image": image_tag_by_dockerfile_name[dockerfile_name]})
+        dockercompose_model.write()
+        return True
+
+    def _build_the_docker_image_if_changed(self, dockerfile_name: str) -> Optional[str]:
+        dockerfile_path = self.dockerfilesDirPath / dockerfile_name
+        try:
+            dockerfile_content = dockerfile_path.read_text()
+        except OSError as e:
+            print(f"      ! Read the dockerfile '{dockerfile_path}' failed: {e}")
+            return None
+
+        base_image_names = re.findall(r"^\s*FROM\s+(\S+)", dockerfile_content, flags=re.MULTILINE | re.IGNORECASE)
+        hash_builder = hashlib.sha256(dockerfile_content.encode())
+        for base_image_name in base_image_names:
+            base_image_identifier = DockerImageBundle.get_the_local_image_identifier(base_image_name)
+            if base_image_identifier is None:
+                # Pulled here and not by the build, so its identifier is part of the hash
+                if DockerImagePullManager(self.pilDirPath / "pull-docker-images").pull_the_image(base_image_name) is not None:
+                    base_image_identifier = DockerImageBundle.get_the_local_image_identifier(base_image_name)
+                if base_image_identifier is None:
+                    print(f"      ! Pull the '{dockerfile_name}' base image {base_image_name} failed")
+                    return None
+            hash_builder.update(base_image_identifier.encode())
+
+        image_tag = f"{dockerfile_path.stem}:{hash_builder.hexdigest()[:self.imageTagHashLength]}"
+        if DockerImageBundle.get_the_local_image_identifier(image_tag) is not None:
+            print(f"      - {image_tag} is up to date")
+            return image_tag
+
+        print(f"      - Build {image_tag}")
+        log_file_path = self.pilDirPath / "build-docker-images" / f"{dockerfile_path.stem}.log"
+        log_file_path.parent.mkdir(parents=True, exist_ok=True)
+        command_arguments = ["docker", "build", "-f", str(dockerfile_path), "-t", image_tag, str(self.dockerfilesDirPath)]
+        with log_file_path.open("w") as log_file:
+            complete_process = subprocess.run(command_arguments, stdout=log_file, stderr=subprocess.STDOUT, cwd=self.pilDirPath)
+        if complete_process.returncode != 0:
+            print(f"      ! Build {image_tag} failed, see '{log_file_path}'")
+            return None
+        self._remove_the_superseded_docker_images(image_tag)
+        return image_tag
 
-    def logs(self) -> NoReturn:
+    @staticmethod
+    def _remove_the_superseded_docker_images(image_tag: str) -> NoReturn:
+        # The images built from a former content of the dockerfile are not used anymore
+        image_repository, image_hash = image_tag.rsplit(":", 1)
+        complete_process = subprocess.run(["docker", "image", "ls", "--format", "{{.Tag}}", image_repository], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True)
+        superseded_image_tags = [f"{image_repository}:{tag}" for tag in complete_process.stdout.split() if tag != image_hash and tag != "<none>"]
+        if complete_process.returncode == 0 and len(superseded_image_tags) > 0:
+            print(f"      - Remove the superseded images {', '.join(superseded_image_tags)}")
+            subprocess.run(["docker", "image", "rm"] + superseded_image_tags, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def logs(self, log_collection_parallelism: int = None) -> NoReturn:
         if platform.system() == "Windows":
             print(" - Not allowed on Windows")
             return
@@ -3254,14 +6034,13 @@ class PilRunning(PilDeploymentDescriptionParser):
             print(" - No gan components containers are running")
             return
 
-        if self.logDirPath.exists():
-            shutil.rmtree(self.logDirPath, ignore_errors=True)
+        # Kept from a collection to the next one, with the time of the previous docker logs collection
         self.logDirPath.mkdir(parents=True, exist_ok=True)
 
         print(f" - Get the containers logs")
-        self._get_container_log()
+        self._get_container_log(log_collection_parallelism)
 
-    def stop(self, keep_the_intermediate_images: bool = False, do_not_get_logs: bool = False) -> NoReturn:
+    def stop(self, keep_the_intermediate_images: bool = False, do_not_get_logs: bool = False, log_collection_parallelism: int = None) -> NoReturn:
         if platform.system() == "Windows":
             print(" - Not allowed on Windows")
             return
@@ -3271,19 +6050,16 @@ class PilRunning(PilDeploymentDescriptionParser):
             return
 
         if not do_not_get_logs:
-            self.logs()
+            self.logs(log_collection_parallelism)
 
         print(f" - Stop PIL")
-        command_arguments = ["docker-compose", "-p", "pil-session"]
-
-        dockercompose_path_results: List[Path] = list(self.pilDirPath.glob(f"./*.dockercompose"))
-        for dockercompose_path in dockercompose_path_results:
-            command_arguments += ["-f", dockercompose_path.name]
+        command_arguments = self._get_the_dockercompose_command_arguments()
 
         command_arguments += ["down", "--remove-orphans"]
 
+        # The images built from the dockerfiles hash are kept for the next start, only the images without custom tag are removed
         if not keep_the_intermediate_images:
-            command_arguments += ["--rmi", "all"]
+            command_arguments += ["--rmi", "local" if (self.pilDirPath / self.dockerImagesOverrideFileName).exists() else "all"]
 
         log_file_path = self.pilDirPath / "pil-session.log"
         log_file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -3294,68 +6070,133 @@ class PilRunning(PilDeploymentDescriptionParser):
         self._read_the_running_deployment_dict()
         self._set_gan_components_running_status(False)
 
-    def _get_container_log(self) -> NoReturn:
+    def _get_container_log(self, log_collection_parallelism: int = None) -> NoReturn:
+        self._containersToCollectLogsFrom = []
         self._perform_the_action("getContainerLog")
-
-    def _perform_the_action(self, action: str) -> NoReturn:
-        self._actionToBePerformed = action
-
-        self._deployment_dict = self._get_dict_from_json_file(self.runningDeploymentDescriptionJsonFile)
-        self.parse_deployment_description_dict(self._deployment_dict)
-
-    def _component_deployment_starting(self, dict_path: DictPath, path_based_dict: PathBasedDictionary) -> NoReturn:
-        if self._actionToBePerformed not in ("getContainerLog",):
+        if len(self._containersToCollectLogsFrom) == 0:
             return
 
-        _, _, _, service_name, container_name = self._get_the_component_name_version_environments_variables_and_associated_service_and_container_name(dict_path, path_based_dict)
+        log_collection_parallelism = log_collection_parallelism or self.logCollectionParallelism
+        docker_logs_collections_json_file_path = self.logDirPath / self.dockerLogsCollectionsJsonFileName
+        last_collection_time_by_container_name = self._get_dict_from_json_file(docker_logs_collections_json_file_path) if docker_logs_collections_json_file_path.exists() else None
+        last_collection_time_by_container_name = last_collection_time_by_container_name or {}
+        collection_time = time.time()
+
+        print(f"     - Get the docker logs of {len(self._containersToCollectLogsFrom)} containers (parallelism: {log_collection_parallelism})")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=log_collection_parallelism) as executor:
+            is_collected_list = list(executor.map(lambda container_to_collect_logs_from: self._get_the_container_docker_log(container_to_collect_logs_from[0],
+                                                                                                                               last_collection_time_by_container_name.get(container_to_collect_logs_from[0], None),
+                                                                                                                               collection_time),
+                                                  self._containersToCollectLogsFrom))
+        for (container_name, _, _), is_collected in zip(self._containersToCollectLogsFrom, is_collected_list):
+            if is_collected:
+                last_collection_time_by_container_name[container_name] = collection_time
+        self._write_dict_to_json_file(last_collection_time_by_container_name, docker_logs_collections_json_file_path)
+
+        # The logs folders of all the components inside the containers are streamed as tar archives directly into the session archive
+        log_archives_dir_path = self.pilDirPath / LogArchiver.archivesFolderName
+        print(f"     - Archive the containers logs into '{log_archives_dir_path}'")
+        log_archiver = LogArchiver(log_archives_dir_path, stream_parallelism=log_collection_parallelism)
+        log_archiver.add_the_folder(self.logDirPath, self.runningDeploymentLogFolderName)
+        for container_name, _, _ in self._containersToCollectLogsFrom:
+            log_archiver.add_the_tar_stream_command(["docker", "exec", container_name, "/bin/bash", "-c", f"cd {self.containerComponentsFolderPath} && tar -c */logs"], container_name)
+        log_archiver.write_the_session_archive()
+
+    def follow_logs(self, service_name_patterns: List[str] = None, tail_lines_count: int = 10, max_log_file_size: int = 10240000, max_log_files_count: int = 10) -> NoReturn:
+        if platform.system() == "Windows":
+            print(" - Not allowed on Windows")
+            return
 
-        print(f"             - Get the '{container_name}' logs")
+        if not self.is_gan_components_running():
+            print(" - No gan components containers are running")
+            return
 
-        print(f"                 - Get container docker log")
-        container_docker_log_folder_path = self.logDirPath / f"{container_name}.docker.log"
-        command_text = f'docker logs -t {container_name} > "{container_docker_log_folder_path}"'
-        log_file_path = self.pilDirPath / "get-container-docker-logs.log"
-        log_file_path.parent.mkdir(parents=True, exist_ok=True)
-        complete_process = run_subprocess(log_file_path, command_text, current_working_directory=self.pilDirPath, shell=True)
-        if complete_process.returncode != 0:
-            print(f"        ! Get docker container log failed")
+        self._containersToCollectLogsFrom = []
+        self._perform_the_action("getContainerLog")
+        containers_to_follow = [(container_name, service_name) for container_name, _, service_name in self._containersToCollectLogsFrom
+                                if not service_name_patterns or any(fnmatch.fnmatchcase(service_name, service_name_pattern) for service_name_pattern in service_name_patterns)]
+        if len(containers_to_follow) == 0:
+            print(" - No container to follow")
+            return
 
-        print(f"                 - Make a copy of the logs inside the container")
-        command_arguments = ["docker", "exec", container_name, "/bin/bash", "-c", "mkdir -p /tmp_logs; cp -r /usr/gan-ms/*/logs /tmp_logs"]
+        follow_log_dir_path = self.logDirPath / self.followLogFolderName
+        follow_log_dir_path.mkdir(parents=True, exist_ok=True)
+        print(f" - Follow the logs of {len(containers_to_follow)} containers into '{follow_log_dir_path}' (Ctrl+C to stop)")
+        try:
+            asyncio.run(self._follow_the_containers_logs(containers_to_follow, follow_log_dir_path, tail_lines_count, max_log_file_size, max_log_files_count))
+        except KeyboardInterrupt:
+            print(f" - Stop following the logs")
 
-        log_file_path = self.pilDirPath / f"container-inside-logs-copy.log"
-        log_file_path.parent.mkdir(parents=True, exist_ok=True)
-        complete_process = run_subprocess(log_file_path, command_arguments, current_working_directory=self.pilDirPath)
+    @classmethod
+    async def _follow_the_containers_logs(cls, containers_to_follow: List[Tuple[str, str]], follow_log_dir_path: Path, tail_lines_count: int,
+                                          max_log_file_size: int, max_log_files_count: int) -> NoReturn:
+        # One event loop reads all the 'docker logs -f' outputs, so the followers don't need one thread each
+        prefix_width = max(len(service_name) for _, service_name in containers_to_follow)
+
+        async def follow_the_container_log(container_name: str, service_name: str) -> NoReturn:
+            prefix = f"{service_name:<{prefix_width}} | "
+            log_process = await asyncio.create_subprocess_exec("docker", "logs", "-f", "-t", "--tail", str(tail_lines_count), container_name,
+                                                               stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT, limit=cls.followLogLineMaxSize)
+            log_file = RotatingLogFile(follow_log_dir_path / f"{container_name}.log", max_log_file_size, max_log_files_count)
+            try:
+                while True:
+                    try:
+                        line = await log_process.stdout.readuntil(b"\n")
+                    except asyncio.IncompleteReadError as e:
+                        line = e.partial
+                    except asyncio.LimitOverrunError as e:
+                        # A line longer than the limit is given by chunks, so one noisy container doesn't stop the others
+                        line = await log_process.stdout.readexactly(e.consumed)
+                    if not line:
+                        break
+                    log_file.write(line)
+                    sys.stdout.write(prefix + line.decode(errors="replace").rstrip("\r\n") + "\n")
+                print(f"{prefix}--- end of the log stream (exit code {await log_process.wait()})")
+            except OSError as e:
+                print(f"{prefix}! Follow the log failed: {e}")
+            finally:
+                log_file.close()
+                if log_process.returncode is None:
+                    log_process.terminate()
+                    await log_process.wait()
+
+        await asyncio.gather(*[follow_the_container_log(container_name, service_name) for container_name, service_name in containers_to_follow])
+
+    def _get_the_container_docker_log(self, container_name: str, since_time: Optional[float], until_time: float) -> bool:
+        # Only the log lines between the previous collection and this one are got, the previous ones are already in the previous session archives
+        command_arguments = ["docker", "logs", "-t", "--until", f"{until_time:.6f}"]
+        if since_time is not None:
+            command_arguments += ["--since", f"{since_time:.6f}"]
+        command_arguments.append(container_name)
+        container_docker_log_file_path = self.logDirPath / f"{container_name}.docker.log"
+        with container_docker_log_file_path.open("w") as container_docker_log_file:
+            complete_process = subprocess.run(command_arguments, stdout=container_docker_log_file, stderr=subprocess.STDOUT)
         if complete_process.returncode != 0:
-            print(f"             ! Make a inside copy of the '{container_name}' container logs failed")
+            print(f"        ! Get the '{container_name}' docker container log failed")
+            return False
+        return True
 
-        print(f"                 - Make a copy of the logs from the container")
-        container_log_folder_path = self.logDirPath / container_name
-        container_log_folder_path.parent.mkdir(parents=True, exist_ok=True)
-        command_arguments = ["docker", "cp", f"{container_name}:/tmp_logs/logs", container_log_folder_path]
+    def _perform_the_action(self, action: str) -> NoReturn:
+        self._actionToBePerformed = action
 
-        log_file_path = self.pilDirPath / f"container-logs-copy.log"
-        log_file_path.parent.mkdir(parents=True, exist_ok=True)
-        complete_process = run_subprocess(log_file_path, command_arguments, current_working_directory=self.pilDirPath)
-        if complete_process.returncode != 0:
-            print(f"             ! Make a copy of the '{container_name}' container logs failed")
+        self._deployment_dict = self._get_dict_from_json_file(self.runningDeploymentDescriptionJsonFile)
+        self.parse_deployment_description_dict(self._deployment_dict)
 
-        print(f"                 - Delete the logs temporary folder inside the container")
-        command_arguments = ["docker", "exec", container_name, "/bin/bash", "-c", "rm -R /tmp_logs"]
+    def _component_deployment_starting(self, dict_path: DictPath, path_based_dict: PathBasedDictionary) -> NoReturn:
+        if self._actionToBePerformed not in ("getContainerLog",):
+            return
 
-        log_file_path = self.pilDirPath / f"container-inside-logs-delete.log"
-        log_file_path.parent.mkdir(parents=True, exist_ok=True)
-        complete_process = run_subprocess(log_file_path, command_arguments, current_working_directory=self.pilDirPath)
-        if complete_process.returncode != 0:
-            print(f"             ! Delete the logs temporary folder inside the '{container_name}' container failed")
+        component_name, _, _, service_name, container_name = self._get_the_component_name_version_environments_variables_and_associated_service_and_container_name(dict_path, path_based_dict)
+        self._containersToCollectLogsFrom.append((container_name, component_name, service_name))
 
 
 if __name__ == "__main__":
 
-    # Get the script path
+    # Get the script path (the startup messages are printed once the arguments are parsed, so a machine-readable output stays clean)
     parameters_dict = {}
+    startup_messages = []
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-        print("The script is running in a PyInstaller bundle")
+        startup_messages.append("The script is running in a PyInstaller bundle")
         this_script_dir_path = Path(sys.executable).parent.absolute()
 
         # Check the presence of a parameters json file
@@ -3364,14 +6205,14 @@ if __name__ == "__main__":
             try:
                 with parameters_json_path.open("r") as parameters_json_file:
                     parameters_dict = json.load(parameters_json_file)
-                print(f"The parameters json file give the following parameters: {parameters_dict}")
+                startup_messages.append(f"The parameters json file give the following parameters: {parameters_dict}")
             except (OSError, json.JSONDecodeError) as json_exception:
-                print(f"The parameters json file can't be read: {json_exception}")
+                startup_messages.append(f"The parameters json file can't be read: {json_exception}")
     else:
-        print("The script is running in a normal Python process")
+        startup_messages.append("The script is running in a normal Python process")
         this_script_dir_path = Path(__file__).parent.absolute()
 
-    print(f"The script parent path is '{this_script_dir_path}'\n")
+    startup_messages.append(f"The script parent path is '{this_script_dir_path}'\n")
 
     # Set umask for folder and file creation
     new_mask = 0o000
@@ -3444,6 +6285,8 @@ if __name__ == "__main__":
 
     def stop_pel(parsed_args, make_copy_of_databases_root_folder=False):
         pel_running = _get_pel_running(parsed_args)
+        pel_running.stopTimeoutInSeconds = getattr(parsed_args, "stopTimeout", pel_running.stopTimeoutInSeconds)
+        pel_running.stopParallelism = getattr(parsed_args, "stopParallelism", pel_running.stopParallelism)
 
         component_deployment_path = None
         if len(parsed_args.componentDeploymentPath) > 0:
@@ -3455,18 +6298,60 @@ if __name__ == "__main__":
             pel_running.copy_working_databases_data_root_folder_as_original()
         return 0
 
+    def reconcile_pel(parsed_args):
+        pel_running = _get_pel_running(parsed_args)
+        if not pel_running.is_gan_components_deployed():
+            print(" - The gan components are not deployed")
+            return 0
+
+        for probe_result in pel_running.reconcile_the_components_running_status():
+            if probe_result["isAlive"] is None:
+                liveness = "unknown (no pid or listen port to probe)"
+            else:
+                liveness = "alive" if probe_result["isAlive"] else "not alive"
+            print(f"     - '{probe_result['name']}': {liveness}, pid {probe_result['pid']}, listen port {probe_result['isPortListening']}")
+        return 0
+
+    def status_pel(parsed_args):
+        pel_running = PelRunning(Path(parsed_args.workingFolderPath))
+        pel_running.print_the_running_deployment_status(as_json=parsed_args.asJson)
+        return 0
+
+    def search_logs(parsed_args):
+        log_index = LogIndex(Path(parsed_args.workingFolderPath) / PelDeploymentDescriptionParser.pelFolderName)
+        log_index.update()
+        found_lines = log_index.search(parsed_args.fromTime, parsed_args.toTime, parsed_args.component, parsed_args.level, parsed_args.textPattern, parsed_args.maxLinesCount)
+        for component, line in found_lines:
+            print(f"{component} | {line}")
+        return 0
+
     def build_single_dsl_pel(parsed_args):
         pel_running = _get_pel_running(parsed_args)
 
         print(f"     - The DSL log XML trace level to use is '{parsed_args.dslLogXmlTraceLevel}'")
         print(f"     - The DSL log XML max log file size to use is '{parsed_args.dslLogXmlMaxLogFileSize}'")
-
-        pel_running.build_single_dsl_pel(parsed_args.dslLogXmlTraceLevel, parsed_args.dslLogXmlMaxLogFileSize)
+        print(f"     - The DSL folders merge mode is '{parsed_args.mergeMode}'")
+        print(f"     - The resources content conflicts check status is '{parsed_args.checkResourcesConflicts}'")
+        print(f"     - The jar conflicts analysis status is '{parsed_args.analyzeJarConflicts}'")
+        print(f"     - The force full rebuild status is '{parsed_args.forceFullRebuild}'")
+        log_xml_options = SingleDslPel.get_the_log_xml_options({
+            "isAsync": parsed_args.dslLogXmlAsync,
+            "isRandomAccessFile": parsed_args.dslLogXmlRandomAccessFile,
+            "isImmediateFlush": not parsed_args.dslLogXmlNoImmediateFlush,
+            "isPasswordMasked": not parsed_args.dslLogXmlNoPasswordMasking,
+            "bufferSize": parsed_args.dslLogXmlBufferSize,
+            "optionsByServiceNamePattern": SingleDslPel.get_the_log_xml_options_by_service_name_pattern(parsed_args.dslLogXmlServiceOptions),
+        })
+        print(f"     - The DSL log XML options are {log_xml_options}")
+
+        pel_running.build_single_dsl_pel(parsed_args.dslLogXmlTraceLevel, parsed_args.dslLogXmlMaxLogFileSize, parsed_args.mergeMode, parsed_args.checkResourcesConflicts,
+                                         parsed_args.analyzeJarConflicts, parsed_args.forceFullRebuild, log_xml_options)
         return 0
 
     def start_single_dsl_pel(parsed_args):
         pel_running = _get_pel_running(parsed_args)
-        pel_running.start_single_dsl_pel()
+        print(f"     - The DSL JVMs start timeout is {parsed_args.startTimeout}s")
+        pel_running.start_single_dsl_pel(parsed_args.startTimeout)
         return 0
 
     def stop_single_dsl_pel(parsed_args):
@@ -3494,6 +6379,11 @@ if __name__ == "__main__":
         pel_running.test(cataclysm_folder_path, parsed_args.testProfile, test_name_to_run)
         return 0
 
+    def run_process_supervisor(parsed_args):
+        process_supervisor = ProcessSupervisor(Path(parsed_args.socketPath))
+        process_supervisor.serve_forever()
+        return 0
+
     def build_pil(parsed_args):
         working_folder_path = Path(parsed_args.workingFolderPath)
         templated_deployment_description_file_path = Path(parsed_args.templatedDeploymentDescriptionFile)
@@ -3526,27 +6416,40 @@ if __name__ == "__main__":
         pil_deployer.deploy_from_deployment_description_json_file(deployment_description_file_path)
         return 0
 
+    def _get_the_docker_image_bundle_cache(parsed_args) -> DockerImageBundleCache:
+        bundle_cache_dir_path = Path(parsed_args.bundleCacheFolderPath) if parsed_args.bundleCacheFolderPath is not None else None
+        bundle_cache = DockerImageBundleCache(bundle_cache_dir_path, parsed_args.bundleCacheMaxSizeInGb)
+        print(f"     - The docker images bundle cache folder is '{bundle_cache.cacheDirPath}' (max size: {parsed_args.bundleCacheMaxSizeInGb} GB)")
+        return bundle_cache
+
     def save_the_basic_docker_images_used_by_the_pil(parsed_args):
         working_folder_path = Path(parsed_args.workingFolderPath)
 
         print(f" - The deployer arguments are:")
         print(f"     - The deployer working folder is '{working_folder_path}'")
+        print(f"     - The pull parallelism is {parsed_args.pullParallelism}")
+        print(f"     - The force pull status is '{parsed_args.forcePull}'")
+        print(f"     - The transfer parallelism is {parsed_args.transferParallelism}")
+        bundle_cache = _get_the_docker_image_bundle_cache(parsed_args)
 
         pil_running = PilRunning(working_folder_path)
-        pil_running.save_the_basic_docker_images_used()
+        pil_running.save_the_basic_docker_images_used(parsed_args.pullParallelism, parsed_args.forcePull, parsed_args.transferParallelism, bundle_cache)
         return 0
 
     def load_the_basic_docker_images_used_by_the_pil(parsed_args):
         working_folder_path = Path(parsed_args.workingFolderPath)
-        docker_images_tar_gz_file_path = Path(parsed_args.dockerImagesTarGzFilePath[0])
+        docker_images_tar_gz_file_path = Path(parsed_args.dockerImagesTarGzFilePath) if parsed_args.dockerImagesTarGzFilePath is not None else None
 
         print(f" - The deployer arguments are:")
         print(f"     - The deployer working folder is '{working_folder_path}'")
-        print(f"     - The tar.gz file to load is '{docker_images_tar_gz_file_path}'")
+        print(f"     - The docker images bundle or tar.gz file to load is '{docker_images_tar_gz_file_path or 'the cached one'}'")
         print(f"     - The 'do not check hash' status is '{parsed_args.doNotCheckHash}'")
+        print(f"     - The transfer parallelism is {parsed_args.transferParallelism}")
+        bundle_cache = _get_the_docker_image_bundle_cache(parsed_args)
 
         pil_running = PilRunning(working_folder_path)
-        pil_running.load_the_basic_docker_images_to_used(docker_images_tar_gz_file_path, do_not_check_the_used_components_hash=parsed_args.doNotCheckHash)
+        pil_running.load_the_basic_docker_images_to_used(docker_images_tar_gz_file_path, do_not_check_the_used_components_hash=parsed_args.doNotCheckHash,
+                                                         transfer_parallelism=parsed_args.transferParallelism, bundle_cache=bundle_cache)
         return 0
 
     def remove_the_basic_docker_images_used_by_the_pil(parsed_args):
@@ -3565,9 +6468,14 @@ if __name__ == "__main__":
         print(f" - The deployer arguments are:")
         print(f"     - The deployer working folder is '{working_folder_path}'")
         print(f"     - The keeping intermediate images status is '{parsed_args.keepTheIntermediateImages}'")
+        print(f"     - The image build parallelism is {parsed_args.imageBuildParallelism}")
+        print(f"     - The startup waves width is {parsed_args.startupWaveWidth} (timeout: {parsed_args.startupWaveTimeoutInSeconds} seconds)")
+        print(f"     - The resources overcommit allowance status is '{parsed_args.allowResourcesOvercommit}'")
 
         pil_running = PilRunning(working_folder_path)
-        pil_running.start(keep_the_intermediate_images=parsed_args.keepTheIntermediateImages)
+        pil_running.start(keep_the_intermediate_images=parsed_args.keepTheIntermediateImages, image_build_parallelism=parsed_args.imageBuildParallelism,
+                          startup_wave_width=parsed_args.startupWaveWidth, startup_wave_timeout_in_seconds=parsed_args.startupWaveTimeoutInSeconds,
+                          allow_resources_overcommit=parsed_args.allowResourcesOvercommit)
         return 0
 
     def get_logs_pil(parsed_args):
@@ -3575,9 +6483,21 @@ if __name__ == "__main__":
 
         print(f" - The deployer arguments are:")
         print(f"     - The deployer working folder is '{working_folder_path}'")
+        print(f"     - The log collection parallelism is {parsed_args.logCollectionParallelism}")
+
+        pil_running = PilRunning(working_folder_path)
+        pil_running.logs(parsed_args.logCollectionParallelism)
+        return 0
+
+    def follow_logs_pil(parsed_args):
+        working_folder_path = Path(parsed_args.workingFolderPath)
+
+        print(f" - The deployer arguments are:")
+        print(f"     - The deployer working folder is '{working_folder_path}'")
+        print(f"     - The followed services are {parsed_args.serviceNamePatterns or 'all'}")
 
         pil_running = PilRunning(working_folder_path)
-        pil_running.logs()
+        pil_running.follow_logs(parsed_args.serviceNamePatterns, parsed_args.tailLinesCount, parsed_args.maxLogFileSize, parsed_args.maxLogFilesCount)
         return 0
 
     def stop_pil(parsed_args):
@@ -3587,9 +6507,16 @@ if __name__ == "__main__":
         print(f"     - The deployer working folder is '{working_folder_path}'")
         print(f"     - The keeping intermediate images status is '{parsed_args.keepTheIntermediateImages}'")
         print(f"     - The 'do not get logs' status is '{parsed_args.doNotGetLogs}'")
+        print(f"     - The log collection parallelism is {parsed_args.logCollectionParallelism}")
 
         pil_running = PilRunning(working_folder_path)
-        pil_running.stop(keep_the_intermediate_images=parsed_args.keepTheIntermediateImages, do_not_get_logs=parsed_args.doNotGetLogs)
+        pil_running.stop(keep_the_intermediate_images=parsed_args.keepTheIntermediateImages, do_not_get_logs=parsed_args.doNotGetLogs,
+                         log_collection_parallelism=parsed_args.logCollectionParallelism)
+        return 0
+
+    def status_pil(parsed_args):
+        pil_running = PilRunning(Path(parsed_args.workingFolderPath))
+        pil_running.print_the_running_deployment_status(as_json=parsed_args.asJson)
         return 0
 
     # Default script arguments values by destination parameter name
@@ -3620,6 +6547,10 @@ if __name__ == "__main__":
     common_parser.add_argument("--working-folder", dest=destination_parameter_name, type=str,
                                help=f"Deployer working directory, by default '{args_default_value_by_destination_parameter_name[destination_parameter_name]}'",
                                default=args_default_value_by_destination_parameter_name[destination_parameter_name])
+    common_parser.add_argument("--quiet", dest="quiet", action="store_true",
+                               help=f"Capture the sub-processes output by large chunks into their log files without console echo, by default False")
+    common_parser.add_argument("--tail", dest="tailLineCount", metavar="N", type=int, default=None,
+                               help=f"Capture the sub-processes output by large chunks into their log files and only echo their last N lines on the console")
 
     common_pel_deployment_parser = argparse.ArgumentParser(add_help=False)
     destination_parameter_name = "pelDeploymentDescriptionFile"
@@ -3711,8 +6642,44 @@ if __name__ == "__main__":
                                       help=help_string)
     subparser.add_argument(dest="componentDeploymentPath", metavar='COMPONENT_DEPLOYMENT_PATH', type=str, nargs="*",
                            help=f"Component deployment path to the component to stop, by default all components are started")
+    subparser.add_argument("--stop-timeout", dest="stopTimeout", type=float, default=ProcessGroupStopper.gracefulStopTimeoutInSeconds,
+                           help=f"Time in seconds given to each component process group to stop before being killed, by default {ProcessGroupStopper.gracefulStopTimeoutInSeconds}")
+    subparser.add_argument("--stop-parallelism", dest="stopParallelism", type=int, default=8,
+                           help=f"Number of components stopped in parallel, by default 8")
     subparser.set_defaults(func=stop_pel)
 
+    help_string = "Probe the real liveness of the PEL components and reconcile the stored running status with it."
+    subparser = subparsers.add_parser("reconcile-pel", parents=[common_parser],
+                                      description=help_string,
+                                      help=help_string)
+    subparser.set_defaults(func=reconcile_pel)
+
+    help_string = "Print the PEL deployment status (nodes, groups, components, pids and uptimes) from its index, without parsing the description."
+    subparser = subparsers.add_parser("status-pel", parents=[common_parser],
+                                      description=help_string,
+                                      help=help_string)
+    subparser.add_argument("--json", dest="asJson", action="store_true",
+                           help=f"Print the status as JSON, by default False")
+    subparser.set_defaults(func=status_pel)
+
+    help_string = "Search the PEL and single DSL logs, live and archived, through an incremental index of their time buckets, components and levels."
+    subparser = subparsers.add_parser("search-logs", parents=[common_parser],
+                                      description=help_string,
+                                      help=help_string)
+    subparser.add_argument("--from", dest="fromTime", type=str, default=None,
+                           help=f"Start of the time window, in the log time format 'MM/dd HH:mm:ss.SSS' or one of its beginnings, by default None")
+    subparser.add_argument("--to", dest="toTime", type=str, default=None,
+                           help=f"End of the time window, in the log time format 'MM/dd HH:mm:ss.SSS' or one of its beginnings, by default None")
+    subparser.add_argument("--component", dest="component", type=str, action="append",
+                           help=f"Component deployment path (or one of its parents, like 'node/group') of the searched logs, can be repeated, by default all")
+    subparser.add_argument("--level", dest="level", type=str, action="append",
+                           help=f"Level of the searched log lines, can be repeated, by default all")
+    subparser.add_argument("--grep", dest="textPattern", type=str, default=None,
+                           help=f"Regular expression the searched log lines must contain, by default None")
+    subparser.add_argument("--max-lines", dest="maxLinesCount", type=int, default=None,
+                           help=f"Maximum number of printed log lines, by default None")
+    subparser.set_defaults(func=search_logs)
+
     help_string = "Build a single DSL PEL from an existing PEL deployment."
     subparser = subparsers.add_parser("build-single-dsl-pel", parents=[common_parser],
                                       description=help_string,
@@ -3725,12 +6692,37 @@ if __name__ == "__main__":
     subparser.add_argument("--dsl-log-xml-max-log-file-size", dest=destination_parameter_name, type=int,
                            help=f"DSLs log4j.xml max log file size, by default {args_default_value_by_destination_parameter_name[destination_parameter_name]}",
                            default=args_default_value_by_destination_parameter_name[destination_parameter_name])
+    subparser.add_argument("--dsl-log-xml-async", dest="dslLogXmlAsync", action="store_true",
+                           help=f"DSLs log4j.xml async loggers, the LMAX disruptor jar must be in the DSLs classpath, by default False")
+    subparser.add_argument("--dsl-log-xml-random-access-file", dest="dslLogXmlRandomAccessFile", action="store_true",
+                           help=f"DSLs log4j.xml RollingRandomAccessFile appenders instead of RollingFile ones, by default False")
+    subparser.add_argument("--dsl-log-xml-no-immediate-flush", dest="dslLogXmlNoImmediateFlush", action="store_true",
+                           help=f"DSLs log4j.xml appenders not flushed after each log event, by default False")
+    subparser.add_argument("--dsl-log-xml-no-password-masking", dest="dslLogXmlNoPasswordMasking", action="store_true",
+                           help=f"DSLs log4j.xml pattern without the password masking replacement (nor the message padding), by default False")
+    subparser.add_argument("--dsl-log-xml-buffer-size", dest="dslLogXmlBufferSize", type=int, default=None,
+                           help=f"DSLs log4j.xml appenders buffer size in bytes, by default the log4j one")
+    subparser.add_argument("--dsl-log-xml-service-option", dest="dslLogXmlServiceOptions", type=str, action="append",
+                           metavar="SERVICE-NAME-PATTERN=TRACE-LEVEL[:BUFFER-SIZE]",
+                           help=f"DSLs log4j.xml trace level and buffer size of the services matching the fnmatch pattern, can be repeated, the first matching pattern wins,"
+                                f" by default None")
+    subparser.add_argument("--merge-mode", dest="mergeMode", type=str, choices=FileLinker.mergeModes, default=FileLinker.linkMergeMode,
+                           help=f"'{FileLinker.linkMergeMode}' shares the jar and resources files between the DSL folders by hardlinks (reflinks or copies as fallback),"
+                                f" '{FileLinker.copyMergeMode}' copies them, by default '{FileLinker.linkMergeMode}'")
+    subparser.add_argument("--check-resources-conflicts", dest="checkResourcesConflicts", action="store_true",
+                           help=f"Report the resources files present in several DSLs at the same path but with a different content, by default False")
+    subparser.add_argument("--analyze-jar-conflicts", dest="analyzeJarConflicts", action="store_true",
+                           help=f"Report the classes shadowed between the merged jar files, by default False")
+    subparser.add_argument("--force-full-rebuild", dest="forceFullRebuild", action="store_true",
+                           help=f"Delete the single DSL folders and rebuild them instead of re-merging only the changed inputs, by default False")
     subparser.set_defaults(func=build_single_dsl_pel)
 
     help_string = "Start a single DSL PEL."
     subparser = subparsers.add_parser("start-single-dsl-pel", parents=[common_parser],
                                       description=help_string,
                                       help=help_string)
+    subparser.add_argument("--start-timeout", dest="startTimeout", type=float, default=120,
+                           help=f"Time in seconds given to each DSL JVM to answer on its dsl.host:dsl.port, by default 120")
     subparser.set_defaults(func=start_single_dsl_pel)
 
     help_string = "Stop a single DSL PEL."
@@ -3803,12 +6795,36 @@ if __name__ == "__main__":
                                       help=help_string)
     subparser.add_argument("--keep-the-intermediate-images", dest="keepTheIntermediateImages", action="store_true",
                            help=f"Keep the intermediate images, by default False")
+    subparser.add_argument("--image-build-parallelism", dest="imageBuildParallelism", type=int, default=PilRunning.imageBuildParallelism,
+                           help=f"Maximum number of docker images built at the same time, by default {PilRunning.imageBuildParallelism}")
+    subparser.add_argument("--startup-wave-width", dest="startupWaveWidth", type=int, default=PilRunning.startupWaveWidth,
+                           help=f"Maximum number of services started in a wave, by default {PilRunning.startupWaveWidth}")
+    subparser.add_argument("--startup-wave-timeout", dest="startupWaveTimeoutInSeconds", type=int, default=PilRunning.startupWaveTimeoutInSeconds,
+                           help=f"Seconds to wait for the services of a wave to be healthy, by default {PilRunning.startupWaveTimeoutInSeconds}")
+    subparser.add_argument("--allow-resources-overcommit", dest="allowResourcesOvercommit", action="store_true",
+                           help=f"Start even if the sum of the containers cpus or memory limits is above the docker host capacity, by default False")
     subparser.set_defaults(func=start_pil)
 
+    help_string = "Follow the running containers logs of the PIL."
+    subparser = subparsers.add_parser("follow-logs-pil", parents=[common_parser],
+                                      description=help_string,
+                                      help=help_string)
+    subparser.add_argument("--service", dest="serviceNamePatterns", type=str, action="append",
+                           help=f"Name (fnmatch pattern) of the followed services, can be repeated, by default all")
+    subparser.add_argument("--since-lines", dest="tailLinesCount", type=int, default=10,
+                           help=f"Number of lines to show from the end of the logs before following them, by default 10")
+    subparser.add_argument("--max-log-file-size", dest="maxLogFileSize", type=int, default=10240000,
+                           help=f"Size of the containers log files above which they are rotated, by default 10240000")
+    subparser.add_argument("--max-log-files", dest="maxLogFilesCount", type=int, default=10,
+                           help=f"Number of rotated log files kept by container, by default 10")
+    subparser.set_defaults(func=follow_logs_pil)
+
     help_string = "Get running containers logs from PIL."
     subparser = subparsers.add_parser("get-logs-pil", parents=[common_parser],
                                       description=help_string,
                                       help=help_string)
+    subparser.add_argument("--log-collection-parallelism", dest="logCollectionParallelism", type=int, default=PilRunning.logCollectionParallelism,
+                           help=f"Maximum number of containers whose logs are collected at the same time, by default {PilRunning.logCollectionParallelism}")
     subparser.set_defaults(func=get_logs_pil)
 
     help_string = "Stop PIL deployment."
@@ -3819,12 +6835,33 @@ if __name__ == "__main__":
                            help=f"Keep the intermediate images, by default False")
     subparser.add_argument("--do-not-get-logs", dest="doNotGetLogs", action="store_true",
                            help=f"Do not get container logs before shutting down, by default False")
+    subparser.add_argument("--log-collection-parallelism", dest="logCollectionParallelism", type=int, default=PilRunning.logCollectionParallelism,
+                           help=f"Maximum number of containers whose logs are collected at the same time, by default {PilRunning.logCollectionParallelism}")
     subparser.set_defaults(func=stop_pil)
 
+    help_string = "Print the PIL deployment status (nodes, groups, services and containers) from its index, without parsing the description."
+    subparser = subparsers.add_parser("status-pil", parents=[common_parser],
+                                      description=help_string,
+                                      help=help_string)
+    subparser.add_argument("--json", dest="asJson", action="store_true",
+                           help=f"Print the status as JSON, by default False")
+    subparser.set_defaults(func=status_pil)
+
     help_string = "Save the basic docker images used by the PIL"
     subparser = subparsers.add_parser("save-the-basic-docker-images-used-by-the-pil", parents=[common_parser],
                                       description=help_string,
                                       help=help_string)
+    subparser.add_argument("--pull-parallelism", dest="pullParallelism", type=int, default=DockerImagePullManager.pullParallelism,
+                           help=f"Maximum number of docker images pulled at the same time, by default {DockerImagePullManager.pullParallelism}")
+    subparser.add_argument("--force-pull", dest="forcePull", action="store_true",
+                           help=f"Pull also the docker images whose local digest is the recorded one, by default False")
+    subparser.add_argument("--transfer-parallelism", dest="transferParallelism", type=int, default=DockerImageBundle.transferParallelism,
+                           help=f"Maximum number of docker images exported at the same time, by default {DockerImageBundle.transferParallelism}")
+    subparser.add_argument("--bundle-cache-folder", dest="bundleCacheFolderPath", type=str, default=None,
+                           help=f"Docker images bundles cache folder, can be shared, by default the '{DockerImageBundleCache.cacheFolderEnvironmentVariableName}' environment variable"
+                                f" or '{DockerImageBundleCache.get_the_default_cache_dir_path()}'")
+    subparser.add_argument("--bundle-cache-max-size", dest="bundleCacheMaxSizeInGb", type=float, default=DockerImageBundleCache.defaultMaxSizeInGb,
+                           help=f"Docker images bundles cache size in GB above which the least recently used bundles are removed, by default {DockerImageBundleCache.defaultMaxSizeInGb}")
     subparser.set_defaults(func=save_the_basic_docker_images_used_by_the_pil)
 
     help_string = "Load the basic docker images used by the PIL"
@@ -3832,10 +6869,17 @@ if __name__ == "__main__":
                                       description=help_string,
                                       help=help_string)
     destination_parameter_name = "dockerImagesTarGzFilePath"
-    subparser.add_argument(dest=destination_parameter_name, metavar='DOCKER-IMAGES-TAR-GZ-FILE', type=str, nargs=1,
-                           help=f"Docker images tar.gz file to load")
+    subparser.add_argument(dest=destination_parameter_name, metavar='DOCKER-IMAGES-BUNDLE', type=str, nargs="?", default=None,
+                           help=f"Docker images bundle folder (or its manifest) to load, or a former docker images tar.gz file, by default the cached bundle of the used images")
     subparser.add_argument("--do-not-check-hash", dest="doNotCheckHash", action="store_true",
                            help=f"Do not check the components hash used by the PIL, by default False")
+    subparser.add_argument("--transfer-parallelism", dest="transferParallelism", type=int, default=DockerImageBundle.transferParallelism,
+                           help=f"Maximum number of docker images loaded at the same time, by default {DockerImageBundle.transferParallelism}")
+    subparser.add_argument("--bundle-cache-folder", dest="bundleCacheFolderPath", type=str, default=None,
+                           help=f"Docker images bundles cache folder, can be shared, by default the '{DockerImageBundleCache.cacheFolderEnvironmentVariableName}' environment variable"
+                                f" or '{DockerImageBundleCache.get_the_default_cache_dir_path()}'")
+    subparser.add_argument("--bundle-cache-max-size", dest="bundleCacheMaxSizeInGb", type=float, default=DockerImageBundleCache.defaultMaxSizeInGb,
+                           help=f"Docker images bundles cache size in GB above which the least recently used bundles are removed, by default {DockerImageBundleCache.defaultMaxSizeInGb}")
     subparser.set_defaults(func=load_the_basic_docker_images_used_by_the_pil)
 
     help_string = "Remove the basic docker images used by the PIL"
@@ -3844,11 +6888,27 @@ if __name__ == "__main__":
                                       help=help_string)
     subparser.set_defaults(func=remove_the_basic_docker_images_used_by_the_pil)
 
+    help_string = "Run the process supervisor owning the detached processes of a deployment (started on demand by the deployer)."
+    subparser = subparsers.add_parser("run-process-supervisor",
+                                      description=help_string,
+                                      help=help_string)
+    subparser.add_argument(dest="socketPath", metavar='SOCKET-PATH', type=str,
+                           help=f"Unix socket path on which the supervisor listens")
+    subparser.set_defaults(func=run_process_supervisor)
+
     if len(sys.argv) == 1:
         parser.print_help()
         sys.exit(0)
 
     args = parser.parse_args()
+
+    if not getattr(args, "asJson", False):
+        for startup_message in startup_messages:
+            print(startup_message)
+
+    if getattr(args, "quiet", False) or getattr(args, "tailLineCount", None) is not None:
+        SubprocessLogCapture.enable_the_low_overhead_mode(quiet=args.quiet, tail_line_count=args.tailLineCount)
+
     # noinspection PyBroadException
     try:
         status_code = args.func(args)
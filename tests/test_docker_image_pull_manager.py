@@ -0,0 +1,113 @@
+import json
+import os
+import stat
+import sys
+import textwrap
+
+import pytest
+
+from script import DockerImagePullManager
+
+
+FAKE_DOCKER_SCRIPT = textwrap.dedent('''
+    import fcntl, json, os, sys
+
+    state_path = os.environ["FAKE_DOCKER_STATE"]
+    # The pulls are run in parallel, so the state is updated under a lock
+    lock_file = open(state_path + ".lock", "w")
+    fcntl.flock(lock_file, fcntl.LOCK_EX)
+    with open(state_path) as state_file:
+        state = json.load(state_file)
+    arguments = sys.argv[1:]
+    state["calls"].append(arguments)
+    return_code = 0
+    if arguments[0] == "pull":
+        image_name = arguments[-1]
+        if state["failuresCountByImageName"].get(image_name, 0) > 0:
+            state["failuresCountByImageName"][image_name] -= 1
+            print("net/http: TLS handshake timeout", file=sys.stderr)
+            return_code = 1
+        elif image_name in state["remoteDigestByImageName"]:
+            state["localDigestByImageName"][image_name] = state["remoteDigestByImageName"][image_name]
+        else:
+            print("pull access denied", file=sys.stderr)
+            return_code = 1
+    elif arguments[:2] == ["image", "inspect"]:
+        image_name = arguments[-1]
+        if image_name in state["localDigestByImageName"]:
+            print(json.dumps([image_name.rsplit(":", 1)[0] + "@" + state["localDigestByImageName"][image_name]]))
+        else:
+            print(f"Error: No such image: {image_name}", file=sys.stderr)
+            return_code = 1
+    with open(state_path, "w") as state_file:
+        json.dump(state, state_file)
+    sys.exit(return_code)
+''')
+
+
+class FakeDocker:
+    def __init__(self, state_file_path):
+        self.stateFilePath = state_file_path
+
+    def set_the_state(self, remote_digest_by_image_name=None, local_digest_by_image_name=None, failures_count_by_image_name=None):
+        with self.stateFilePath.open("w") as state_file:
+            json.dump({"calls": [],
+                       "remoteDigestByImageName": remote_digest_by_image_name or {},
+                       "localDigestByImageName": local_digest_by_image_name or {},
+                       "failuresCountByImageName": failures_count_by_image_name or {}}, state_file)
+
+    def get_the_pull_calls_count(self, image_name):
+        with self.stateFilePath.open() as state_file:
+            return sum(1 for call in json.load(state_file)["calls"] if call == ["pull", image_name])
+
+
+@pytest.fixture
+def fake_docker(tmp_path, monkeypatch):
+    bin_dir_path = tmp_path / "bin"
+    bin_dir_path.mkdir()
+    docker_file_path = bin_dir_path / "docker"
+    docker_file_path.write_text(f"#!{sys.executable}\n{FAKE_DOCKER_SCRIPT}")
+    docker_file_path.chmod(docker_file_path.stat().st_mode | stat.S_IXUSR)
+    monkeypatch.setenv("PATH", f"{bin_dir_path}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_DOCKER_STATE", str(tmp_path / "fake-docker-state.json"))
+    monkeypatch.setattr(DockerImagePullManager, "firstRetryDelayInSeconds", 0.0)
+    fake_docker = FakeDocker(tmp_path / "fake-docker-state.json")
+    fake_docker.set_the_state()
+    return fake_docker
+
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="The fake docker command is a script with a shebang")
+
+
+def test_pull_the_images_skips_the_images_with_the_expected_local_digest(tmp_path, fake_docker):
+    fake_docker.set_the_state(remote_digest_by_image_name={"repo/a:1": "sha256:new", "repo/b:1": "sha256:b"},
+                              local_digest_by_image_name={"repo/a:1": "sha256:old", "repo/b:1": "sha256:b"})
+
+    digest_by_image_name = DockerImagePullManager(tmp_path / "logs").pull_the_images(["repo/a:1", "repo/b:1"], {"repo/a:1": "sha256:new", "repo/b:1": "sha256:b"})
+
+    assert digest_by_image_name == {"repo/a:1": "sha256:new", "repo/b:1": "sha256:b"}
+    assert fake_docker.get_the_pull_calls_count("repo/a:1") == 1
+    assert fake_docker.get_the_pull_calls_count("repo/b:1") == 0
+
+
+def test_pull_the_image_retries_the_failed_pulls(tmp_path, fake_docker):
+    fake_docker.set_the_state(remote_digest_by_image_name={"repo/a:1": "sha256:a"}, failures_count_by_image_name={"repo/a:1": 2})
+
+    assert DockerImagePullManager(tmp_path / "logs").pull_the_image("repo/a:1") == "sha256:a"
+    assert fake_docker.get_the_pull_calls_count("repo/a:1") == 3
+
+
+def test_pull_the_image_gives_up_after_the_max_attempts(tmp_path, fake_docker):
+    fake_docker.set_the_state(remote_digest_by_image_name={"repo/a:1": "sha256:a"}, failures_count_by_image_name={"repo/a:1": 10})
+
+    assert DockerImagePullManager(tmp_path / "logs").pull_the_image("repo/a:1") is None
+    assert fake_docker.get_the_pull_calls_count("repo/a:1") == DockerImagePullManager.maxPullAttemptsCount
+
+
+def test_pull_the_images_gives_none_only_for_the_failed_images(tmp_path, fake_docker):
+    image_names = [f"repo/image-{index}:1" for index in range(6)]
+    fake_docker.set_the_state(remote_digest_by_image_name={image_name: f"sha256:{index}" for index, image_name in enumerate(image_names[:-1])})
+
+    digest_by_image_name = DockerImagePullManager(tmp_path / "logs", pull_parallelism=3).pull_the_images(image_names)
+
+    assert digest_by_image_name == {**{image_name: f"sha256:{index}" for index, image_name in enumerate(image_names[:-1])}, image_names[-1]: None}
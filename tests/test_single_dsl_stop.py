@@ -0,0 +1,119 @@
+import http.server
+import json
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from script import PelDeploymentDescriptionParser, ProcessGroupStopper, ProcessLivenessProbe, SingleDslPel
+
+# The stop requests are sent by the optional 'requests' package
+pytest.importorskip("requests")
+
+
+class StubDslServer(http.server.ThreadingHTTPServer):
+    """
+    Stands in for the DSLs: answers their stop request after a delay, with the given status code
+    """
+    def __init__(self, response_delay_in_seconds: float = 0.0, response_status_code: int = 200):
+        self.responseDelayInSeconds = response_delay_in_seconds
+        self.responseStatusCode = response_status_code
+        self.stopRequestPaths = []
+        self.maxConcurrentRequestsCount = 0
+        self._concurrentRequestsCount = 0
+        self._lock = threading.Lock()
+        http.server.ThreadingHTTPServer.__init__(self, ("127.0.0.1", 0), StubDslRequestHandler)
+
+
+class StubDslRequestHandler(http.server.BaseHTTPRequestHandler):
+    def do_POST(self):
+        server = self.server
+        with server._lock:
+            server.stopRequestPaths.append(self.path)
+            server._concurrentRequestsCount += 1
+            server.maxConcurrentRequestsCount = max(server.maxConcurrentRequestsCount, server._concurrentRequestsCount)
+        time.sleep(server.responseDelayInSeconds)
+        with server._lock:
+            server._concurrentRequestsCount -= 1
+        self.send_response(server.responseStatusCode)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_dsl_server():
+    servers = []
+
+    def start_the_stub_dsl_server(**kwargs) -> StubDslServer:
+        server = StubDslServer(**kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start_the_stub_dsl_server
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def create_the_dsl_folders(tmp_path, server: StubDslServer, dsl_folders_count: int):
+    single_dsl_pel = SingleDslPel(tmp_path)
+    dsl_folder_paths = [single_dsl_pel.singleDslTargetDirPath / "main-dsl-folder"]
+    dsl_folder_paths += [single_dsl_pel.singleDslTargetDirPath / f"dsl-folder-{index}" for index in range(1, dsl_folders_count)]
+    for dsl_folder_path in dsl_folder_paths:
+        (dsl_folder_path / "etc").mkdir(parents=True)
+        with (dsl_folder_path / "etc" / "dsl.json").open("w") as dsl_json_file:
+            json.dump({"dsl.host": server.server_address[0], "dsl.port": server.server_address[1]}, dsl_json_file)
+    (tmp_path / PelDeploymentDescriptionParser.pelFolderName).mkdir(exist_ok=True)
+    return single_dsl_pel, dsl_folder_paths
+
+
+def test_stop_single_dsl_sends_the_stop_requests_concurrently(tmp_path, stub_dsl_server):
+    server = stub_dsl_server(response_delay_in_seconds=0.5)
+    single_dsl_pel, dsl_folder_paths = create_the_dsl_folders(tmp_path, server, 4)
+
+    stop_start_time = time.monotonic()
+    has_some_failures = single_dsl_pel.stop_single_dsl()
+
+    assert not has_some_failures
+    assert server.stopRequestPaths == ["/api/v1/stop"] * len(dsl_folder_paths)
+    assert server.maxConcurrentRequestsCount == len(dsl_folder_paths)
+    assert time.monotonic() - stop_start_time < 0.5 * len(dsl_folder_paths)
+
+
+def test_stop_dsl_fails_when_the_stop_request_fails(tmp_path, stub_dsl_server):
+    server = stub_dsl_server(response_status_code=500)
+    single_dsl_pel, dsl_folder_paths = create_the_dsl_folders(tmp_path, server, 1)
+
+    assert not single_dsl_pel.stop_dsl(dsl_folder_paths[0])
+    assert server.stopRequestPaths == ["/api/v1/stop"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="The process group stop is POSIX only")
+def test_stop_dsl_kills_the_process_which_does_not_stop_by_itself(tmp_path, stub_dsl_server, monkeypatch):
+    server = stub_dsl_server()
+    single_dsl_pel, dsl_folder_paths = create_the_dsl_folders(tmp_path, server, 1)
+    single_dsl_pel.stopTimeoutInSeconds = 0.5
+    monkeypatch.setattr(ProcessGroupStopper, "killTimeoutInSeconds", 0.5)
+
+    # The DSL JVM stand-in ignores SIGTERM, and is reaped by a thread so it doesn't stay a zombie once killed
+    dsl_process = subprocess.Popen([sys.executable, "-c", "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); print('ready', flush=True); time.sleep(60)"],
+                                   stdout=subprocess.PIPE, start_new_session=True)
+    assert dsl_process.stdout.readline().strip() == b"ready"
+    threading.Thread(target=dsl_process.wait, daemon=True).start()
+    dsl_process_json_file_path = dsl_folder_paths[0] / SingleDslPel.dslProcessJsonFileName
+    with dsl_process_json_file_path.open("w") as dsl_process_json_file:
+        json.dump({"pid": dsl_process.pid, "startIdentity": ProcessLivenessProbe.get_the_process_start_identity(dsl_process.pid)}, dsl_process_json_file)
+
+    try:
+        assert single_dsl_pel.stop_dsl(dsl_folder_paths[0])
+        assert dsl_process.wait(timeout=5) is not None
+        assert not dsl_process_json_file_path.exists()
+    finally:
+        if dsl_process.poll() is None:
+            dsl_process.kill()